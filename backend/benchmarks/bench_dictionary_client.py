@@ -0,0 +1,133 @@
+"""
+DictionaryService HTTP 클라이언트 벤치마크
+
+로컬 스텁 서버(dictionaryapi.dev 응답 형식)를 띄우고 단어 조회 지연 시간을 비교합니다.
+    - per_call: 예전 방식처럼 조회마다 httpx.AsyncClient를 새로 만드는 경우
+    - pooled:   DictionaryService가 가진 keep-alive 클라이언트를 재사용하는 경우
+    - lookup:   DictionaryService._lookup_word_meaning 전체 경로 (번역은 가짜 서비스)
+
+스텁은 평문 HTTP라서 실제 api.dictionaryapi.dev의 TLS 핸드셰이크 비용은 포함되지 않습니다.
+실제 환경에서는 절약되는 시간이 이보다 큽니다.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_dictionary_client.py --requests 200
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.dictionary_service import DictionaryService  # noqa: E402
+
+STUB_BODY = json.dumps([{
+    "word": "evolution",
+    "meanings": [{
+        "partOfSpeech": "noun",
+        "definitions": [
+            {"definition": "The process by which different kinds of living organism develop."},
+            {"definition": "The gradual development of something."},
+        ],
+    }],
+}]).encode("utf-8")
+
+
+class StubDictionaryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+
+    def setup(self):
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 요청마다 delayed ACK(~40ms)가 생김
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeTranslationService:
+    async def translate(self, text: str, target_lang: str = "KO") -> str:
+        return "생물이 발달하는 과정. 점진적인 발전."
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDictionaryHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def summarize(name: str, samples):
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(f"{name:<10} mean={statistics.mean(samples_ms):7.3f}ms "
+          f"p50={statistics.median(samples_ms):7.3f}ms p95={p95:7.3f}ms")
+    return statistics.mean(samples_ms)
+
+
+async def run(requests: int):
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v2/entries/en"
+
+    service = DictionaryService(translation_service=FakeTranslationService())
+    service.DICT_API_URL = base_url
+    # 벤치마크에서는 속도 제한을 끔
+    for limiter in service._rate_limiters.values():
+        limiter.rate = 0
+
+    per_call = []
+    for i in range(requests):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            await client.get(f"{base_url}/word{i}")
+        per_call.append(time.perf_counter() - start)
+
+    pooled = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await service._get_client().get(f"{base_url}/word{i}")
+        pooled.append(time.perf_counter() - start)
+
+    lookup = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await service._lookup_word_meaning(f"word{i}")
+        lookup.append(time.perf_counter() - start)
+
+    await service.aclose()
+    server.shutdown()
+
+    print(f"\n{requests} requests against local stub (http2={service.http2})")
+    per_call_mean = summarize("per_call", per_call)
+    pooled_mean = summarize("pooled", pooled)
+    summarize("lookup", lookup)
+    print(f"saved per lookup: {per_call_mean - pooled_mean:.3f}ms "
+          f"({per_call_mean / pooled_mean:.1f}x faster)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+DictionaryService 장애 대응 (서킷 브레이커 + hedged request) 확인 스크립트
+
+장애를 흉내 내는 로컬 스텁 서버를 띄우고 시나리오별로 조회 지연 시간과 브레이커 상태를 확인합니다.
+    - healthy:  정상 응답 -> hedging 없이 사전 API 결과 사용, 브레이커 closed
+    - slow:     응답 지연 -> p95 기준 시점에 DeepL 직접 번역이 이기고, 연속으로 느리면 브레이커 open
+    - errors:   500 응답 -> 연속 실패로 브레이커 open, 이후 조회는 사전 API를 건너뜀
+    - recovery: 정상 복구 -> reset 시간 후 시험 요청이 성공하면 브레이커 closed
+
+하나라도 기대와 다르면 종료 코드 1로 끝납니다.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_dictionary_resilience.py --slow-delay 1.5
+"""
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from bench_dictionary_client import STUB_BODY, FakeTranslationService, StubDictionaryHandler  # noqa: E402
+from services.dictionary_service import DictionaryService  # noqa: E402
+
+
+class FaultInjectingHandler(StubDictionaryHandler):
+    # 서버 객체에 설정된 모드에 따라 정상 / 지연 / 500 응답
+    def do_GET(self):
+        mode = self.server.fault_mode
+        if mode == "slow":
+            time.sleep(self.server.slow_delay)
+        if mode == "error":
+            body = b'{"title": "Internal Server Error"}'
+            self.send_response(500)
+        else:
+            body = STUB_BODY
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        try:
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # hedging으로 취소된 요청은 클라이언트가 먼저 연결을 끊음
+            pass
+
+
+def start_fault_server(slow_delay: float):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FaultInjectingHandler)
+    server.fault_mode = "ok"
+    server.slow_delay = slow_delay
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+async def run_lookups(service: DictionaryService, prefix: str, count: int):
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        meaning = await service._lookup_word_meaning(f"{prefix}{i}")
+        samples.append(time.perf_counter() - start)
+        assert meaning, f"{prefix}{i}: no meaning returned"
+    return samples
+
+
+async def run(args) -> bool:
+    server = start_fault_server(args.slow_delay)
+    service = DictionaryService(translation_service=FakeTranslationService())
+    service.DICT_API_URL = f"http://127.0.0.1:{server.server_address[1]}/api/v2/entries/en"
+    for limiter in service._rate_limiters.values():
+        limiter.rate = 0
+    service.breaker.reset_timeout = args.reset_timeout
+
+    results = []
+
+    def check(name: str, condition: bool, detail: str):
+        results.append(condition)
+        print(f"  [{'PASS' if condition else 'FAIL'}] {name}: {detail}")
+
+    print("healthy")
+    samples = await run_lookups(service, "ok", args.lookups)
+    check("no hedging", service.hedged_count == 0, f"hedged={service.hedged_count}")
+    check("breaker closed", service.breaker.state == "closed", service.breaker.state)
+    print(f"  hedge delay now {service.latency.hedge_delay() * 1000:.1f}ms, "
+          f"max lookup {max(samples) * 1000:.1f}ms")
+
+    print("slow")
+    server.fault_mode = "slow"
+    samples = await run_lookups(service, "slow", args.lookups)
+    check("fallback wins", service.hedge_wins > 0, f"hedged={service.hedged_count} wins={service.hedge_wins}")
+    check("lookups bounded", max(samples) < args.slow_delay,
+          f"max {max(samples) * 1000:.1f}ms < upstream delay {args.slow_delay * 1000:.0f}ms")
+    check("breaker opened by slowness", service.breaker.trips >= 1, f"trips={service.breaker.trips}")
+
+    print("errors")
+    server.fault_mode = "error"
+    await asyncio.sleep(args.reset_timeout)  # half_open 시험 요청이 500을 받도록
+    rejected_before = service.breaker.rejected
+    samples = await run_lookups(service, "err", args.lookups)
+    check("breaker open", service.breaker.state == "open", service.breaker.state)
+    check("upstream skipped", service.breaker.rejected > rejected_before,
+          f"rejected={service.breaker.rejected - rejected_before}")
+    check("fast fallback", max(samples[1:]) < 0.1, f"max {max(samples[1:]) * 1000:.1f}ms")
+
+    print("recovery")
+    server.fault_mode = "ok"
+    await asyncio.sleep(args.reset_timeout)
+    await run_lookups(service, "back", 3)
+    check("breaker closed", service.breaker.state == "closed", service.breaker.state)
+
+    print(f"\nstats: {service.stats()['circuit_breaker']}")
+    print(f"       {service.stats()['hedging']}")
+
+    await service.aclose()
+    server.shutdown()
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=25)
+    parser.add_argument("--slow-delay", type=float, default=1.5, help="slow 모드 응답 지연(초)")
+    parser.add_argument("--reset-timeout", type=float, default=0.5, help="브레이커 reset 시간(초)")
+    args = parser.parse_args()
+    ok = asyncio.run(run(args))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+API 모듈 import 시간 벤치마크 (python -X importtime)
+
+새 프로세스에서 `import main`을 여러 번 실행해 import 시간(중앙값)과 가장 오래 걸린 모듈을 보여 줍니다.
+서버 시작(콜드 스타트) 시간은 이 값에 lifespan 시간을 더한 것이므로, 무거운 의존성이 다시
+모듈 최상단 import로 들어오면 여기서 바로 드러납니다.
+
+검사 항목 (하나라도 실패하면 종료 코드 1):
+    - import 시간이 기준값(benchmarks/data/import_time_baseline.json)보다 --threshold% 넘게 늘어남
+    - 처음 사용할 때 불러와야 하는 무거운 모듈(LAZY_MODULES)이 import 시점에 불러와짐
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --module main --runs 7 --threshold 20
+    python benchmarks/bench_import_time.py --update-baseline
+
+기준값은 실행한 머신에 따라 다르므로, 다른 머신(CI 등)에서는 먼저 --update-baseline으로 다시 저장하세요.
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / "data" / "import_time_baseline.json"
+
+# 서버 시작 시 import되면 안 되는 모듈 (OCR/번역/사전/모델을 처음 쓸 때 import)
+LAZY_MODULES = (
+    "deepl",
+    "pdfplumber",
+    "pytesseract",
+    "PIL",
+    "httpx",
+    "transformers",
+    "torch",
+    "onnxruntime",
+)
+
+LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+def measure(module: str):
+    """새 프로세스에서 module을 import하고 (전체 시간(ms), 모듈별 누적 시간(ms), import된 최상위 모듈 집합) 반환"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=backend_path,
+    )
+    if output.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{output.stderr[-2000:]}")
+
+    cumulative = {}
+    for line in output.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1000
+    total = cumulative.get(module, 0.0)
+    top_level = {name.split(".")[0] for name in cumulative}
+    return total, cumulative, top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=25.0, help="기준값 대비 허용하는 증가율(%%)")
+    parser.add_argument("--top", type=int, default=10, help="오래 걸린 모듈을 몇 개 보여줄지")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    totals = []
+    cumulative = {}
+    imported = set()
+    for _ in range(args.runs):
+        total, cumulative, imported = measure(args.module)
+        totals.append(total)
+    median_ms = statistics.median(totals)
+
+    print(f"import {args.module}: median {median_ms:.1f}ms over {args.runs} runs "
+          f"(min {min(totals):.1f}ms, max {max(totals):.1f}ms)")
+    # 직접 import한 모듈만 (하위 모듈은 부모 시간에 포함됨)
+    direct = sorted(
+        ((name, ms) for name, ms in cumulative.items() if name != args.module and "." not in name),
+        key=lambda x: x[1], reverse=True,
+    )
+    for name, ms in direct[:args.top]:
+        print(f"  {ms:8.1f}ms  {name}")
+
+    failed = False
+    eager = sorted(name for name in LAZY_MODULES if name in imported)
+    if eager:
+        print(f"FAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+
+    baselines = json.loads(BASELINE.read_text(encoding="utf-8")) if BASELINE.exists() else {}
+    if args.update_baseline:
+        baselines[args.module] = round(median_ms, 1)
+        BASELINE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline {median_ms:.1f}ms to {BASELINE}")
+    elif args.module in baselines:
+        baseline = baselines[args.module]
+        change = (median_ms - baseline) / baseline * 100 if baseline else 0.0
+        status = "FAIL" if change > args.threshold else "ok"
+        print(f"{status}: baseline {baseline:.1f}ms, change {change:+.1f}% (threshold +{args.threshold:.0f}%)")
+        failed = failed or change > args.threshold
+    else:
+        print("No baseline yet (run with --update-baseline)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
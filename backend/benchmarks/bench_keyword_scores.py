@@ -0,0 +1,111 @@
+"""
+주제 키워드 점수 계산 마이크로벤치마크
+
+긴 지문(키워드 + 일반 단어를 섞어 만든 영어 텍스트)에 대해 두 방식을 비교합니다.
+    - substring: 예전 방식. 키워드마다 `keyword in text_lower`로 전체 텍스트를 검사
+    - matcher:   KeywordMatcher (단어 단위 Aho-Corasick, 텍스트를 한 번만 훑음)
+
+두 방식의 점수가 다른 지문 수도 함께 출력합니다. 차이는 대부분 예전 방식이 단어 중간에서
+매칭한 경우입니다 ('ai' in "certain", 'art' in "part").
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_keyword_scores.py --words 2000 --passages 50
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.topic_classification_service import KEYWORD_GROUPS  # noqa: E402
+
+FILLER_WORDS = (
+    "the of and to in that is was for it with as his on be at by this had not are but from or have "
+    "an they which one you were her all she there would their we him been has when who will more no "
+    "if out so said what up its about into than them can only other new some could time these two may "
+    "then do first any my now such like our over man me even most made after also did many before must "
+    "through back years where much your way well down should because each just those people how too "
+    "certain part particular maintain remain wait start chart party article ancestral department"
+).split()
+
+
+def legacy_scores(keyword_groups: Dict[str, List[str]], text: str) -> Dict[str, float]:
+    """예전 _calculate_keyword_scores (부분 문자열 검사)"""
+    text_lower = text.lower()
+    scores = {}
+    for topic, keywords in keyword_groups.items():
+        score = 0
+        for keyword in keywords:
+            if keyword in text_lower:
+                score += 1
+        scores[topic] = score / len(keywords) if keywords else 0
+    return scores
+
+
+def make_passage(rng: random.Random, words: int, keywords: List[str], keyword_ratio: float) -> str:
+    tokens = []
+    for _ in range(words):
+        tokens.append(rng.choice(keywords) if rng.random() < keyword_ratio else rng.choice(FILLER_WORDS))
+    sentences = []
+    for i in range(0, len(tokens), 15):
+        sentence = " ".join(tokens[i:i + 15])
+        sentences.append(sentence[:1].upper() + sentence[1:] + ".")
+    return " ".join(sentences)
+
+
+def time_calls(func, passages: List[str], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        for passage in passages:
+            start = time.perf_counter()
+            func(passage)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=2000, help="지문 하나의 단어 수")
+    parser.add_argument("--passages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keyword-ratio", type=float, default=0.02, help="키워드가 나올 확률")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    keyword_groups = {topic: [kw.lower() for kw in keywords] for topic, keywords in KEYWORD_GROUPS.items()}
+    all_keywords = [kw for keywords in keyword_groups.values() for kw in keywords]
+    rng = random.Random(args.seed)
+    passages = [make_passage(rng, args.words, all_keywords, args.keyword_ratio) for _ in range(args.passages)]
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keyword_groups)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    results = {
+        "substring": time_calls(lambda text: legacy_scores(keyword_groups, text), passages, args.repeat),
+        "matcher": time_calls(matcher.score, passages, args.repeat),
+    }
+
+    print(f"{args.passages} passages x {args.words} words, {len(all_keywords)} keywords "
+          f"(matcher build {build_ms:.2f}ms)")
+    means = {}
+    for name, samples in results.items():
+        samples_ms = sorted(s * 1000 for s in samples)
+        means[name] = statistics.mean(samples_ms)
+        p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+        print(f"{name:<10} mean={means[name]:8.3f}ms p50={statistics.median(samples_ms):8.3f}ms p95={p95:8.3f}ms")
+    print(f"speedup: {means['substring'] / means['matcher']:.2f}x")
+
+    differing = sum(1 for p in passages if legacy_scores(keyword_groups, p) != matcher.score(p))
+    print(f"passages scored differently: {differing}/{len(passages)} (substring matches inside words)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+텍스트 처리 핫 패스 마이크로벤치마크 모음
+
+benchmarks/text_corpus.py로 만든 small/medium/book 크기 입력에서 다음 함수를 측정합니다.
+    split_into_paragraphs       TranslationService.split_into_paragraphs (제목/저자/챕터 줄, 문단 번호 포함 지문)
+    split_into_sentences        TranslationService.split_into_sentences (문단마다)
+    extract_words               VocabularyService.extract_words
+    keyword_scores              TopicClassificationService._calculate_keyword_scores
+    group_words_into_lines      OCRService._group_words_into_lines (pdfplumber 단어 박스, 페이지마다)
+    lines_to_paragraphs         OCRService._lines_to_paragraphs (페이지마다)
+    group_ocr_boxes_into_lines  OCRService._group_ocr_boxes_into_lines (Tesseract 박스)
+    pdf_parse                   OCRService._extract_from_pdf_fallback (합성 PDF 파일, pdfplumber가 있을 때만)
+
+각 케이스는 한 라운드가 --min-time초 이상 되도록 반복 횟수를 정하고, 모든 케이스를 번갈아 가며 --rounds번 측정합니다 (GC 끔).
+비교에는 timeit 관례대로 라운드 중 최솟값(min)을 쓰고, 중앙값과 편차(spread)는 참고로 보여 줍니다.
+결과 출력의 해시(output)도 저장하므로, 속도 말고 동작이 바뀐 커밋도 알 수 있습니다.
+
+기준값(benchmarks/data/text_processing_baseline.json)과 비교해 --threshold%보다 느려진 케이스가 있으면 종료 코드 1.
+케이스별 허용치는 기준값 파일의 "thresholds"에 fnmatch 패턴으로 지정합니다 (예: {"pdf_parse/*": 40}).
+기준값은 실행한 머신에 따라 다르므로, 다른 머신(CI 등)에서는 먼저 --update-baseline으로 다시 저장하세요.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_text_processing.py
+    python benchmarks/bench_text_processing.py --quick
+    python benchmarks/bench_text_processing.py --filter "split_*" --sizes small,medium
+    python benchmarks/bench_text_processing.py --output /tmp/after.json --compare /tmp/before.json
+    python benchmarks/bench_text_processing.py --update-baseline
+"""
+import argparse
+import asyncio
+import fnmatch
+import gc
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+# TranslationService 생성에 필요할 뿐 DeepL은 호출하지 않음
+os.environ.setdefault("DEEPL_API_KEY", "benchmark-unused")
+
+import text_corpus  # noqa: E402
+from services.database import Database  # noqa: E402
+from services.ocr_service import OCRService  # noqa: E402
+from services.storage_service import StorageService  # noqa: E402
+from services.topic_classification_service import TopicClassificationService  # noqa: E402
+from services.translation_service import TranslationService  # noqa: E402
+from services.vocabulary_service import VocabularyService  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "data" / "text_processing_baseline.json"
+# pdfplumber 전체 파싱은 느려서 book 크기는 기본으로 빼 둠 (--pdf-sizes로 지정 가능)
+DEFAULT_PDF_SIZES = ("small", "medium")
+
+
+def build_cases(sizes: List[str], pdf_sizes: List[str], seed: int, tmp_dir: Path) -> List[Tuple[str, Callable]]:
+    """(케이스 이름, 인자 없는 함수) 목록. 입력은 여기서 미리 만들어 측정에 포함되지 않게 함"""
+    translation = TranslationService()
+    vocabulary = VocabularyService(StorageService(Database(db_path=str(tmp_dir / "unused.db"))))
+    topics = TopicClassificationService(use_model=False, use_sidecar=False)
+    ocr = OCRService()
+
+    cases = []
+    for size in sizes:
+        text = text_corpus.make_text(size, seed)
+        paragraphs = text_corpus.make_paragraphs(size, seed)
+        pdf_pages = text_corpus.make_pdf_words(size, seed)
+        page_lines = [ocr._group_words_into_lines(words) for words in pdf_pages]
+        ocr_data = text_corpus.make_ocr_data(size, seed)
+
+        cases += [
+            (f"split_into_paragraphs/{size}", lambda text=text: translation.split_into_paragraphs(text)),
+            (f"split_into_sentences/{size}",
+             lambda paragraphs=paragraphs: [translation.split_into_sentences(p) for p in paragraphs]),
+            (f"extract_words/{size}", lambda text=text: vocabulary.extract_words(text)),
+            (f"keyword_scores/{size}", lambda text=text: topics._calculate_keyword_scores(text)),
+            (f"group_words_into_lines/{size}",
+             lambda pages=pdf_pages: [ocr._group_words_into_lines(words) for words in pages]),
+            (f"lines_to_paragraphs/{size}",
+             lambda page_lines=page_lines: [ocr._lines_to_paragraphs(lines) for lines in page_lines]),
+            (f"group_ocr_boxes_into_lines/{size}", lambda data=ocr_data: ocr._group_ocr_boxes_into_lines(data)),
+        ]
+
+    try:
+        import pdfplumber  # noqa: F401
+    except ImportError:
+        print("pdfplumber is not installed, skipping pdf_parse cases")
+        pdf_sizes = []
+    for size in pdf_sizes:
+        pdf_path = tmp_dir / f"{size}.pdf"
+        pdf_path.write_bytes(text_corpus.make_pdf(size, seed))
+        cases.append((
+            f"pdf_parse/{size}",
+            lambda path=str(pdf_path): asyncio.run(ocr._extract_from_pdf_fallback(path)),
+        ))
+    return cases
+
+
+def output_digest(result) -> str:
+    """결과의 짧은 해시 (동작이 바뀌었는지 확인용)"""
+    return hashlib.sha256(json.dumps(result, sort_keys=True, ensure_ascii=False, default=str).encode()).hexdigest()[:12]
+
+
+def calibrate(func: Callable, min_time: float) -> Tuple[int, object]:
+    """워밍업 후 한 라운드가 min_time 이상이 되는 반복 횟수와 함수 결과"""
+    result = func()  # 워밍업 (정규식 컴파일 캐시 등)
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1_000_000:
+            return loops, result
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+
+def time_round(func: Callable, loops: int) -> float:
+    """라운드 하나 (호출 한 번당 ms, GC 끔)"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return (time.perf_counter() - started) / loops * 1000
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def run_cases(cases: List[Tuple[str, Callable]], rounds: int, min_time: float) -> Dict[str, Dict]:
+    """
+    모든 케이스를 라운드마다 한 번씩 돌아가며 측정
+
+    한 케이스의 라운드를 몰아서 재지 않고 섞어서 재므로, 잠깐 머신이 바빴던 구간이 한 케이스에만
+    몰리지 않고 라운드 중 최솟값이 안정적입니다.
+    """
+    calibrated = {name: calibrate(func, min_time) for name, func in cases}
+    timings: Dict[str, List[float]] = {name: [] for name, _ in cases}
+    for _ in range(rounds):
+        for name, func in cases:
+            timings[name].append(time_round(func, calibrated[name][0]))
+
+    results = {}
+    for name, _ in cases:
+        case_timings = timings[name]
+        loops, output = calibrated[name]
+        median_ms = statistics.median(case_timings)
+        quartiles = statistics.quantiles(case_timings, n=4) if len(case_timings) >= 2 else [median_ms] * 3
+        results[name] = {
+            "min_ms": round(min(case_timings), 6),
+            "median_ms": round(median_ms, 6),
+            "spread_pct": round((quartiles[2] - quartiles[0]) / median_ms * 100, 1) if median_ms else 0.0,
+            "loops": loops,
+            "rounds": rounds,
+            "output": output_digest(output),
+        }
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=backend_path, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, cwd=backend_path).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def threshold_for(case: str, thresholds: Dict[str, float], default: float) -> float:
+    """케이스에 맞는 허용치 (가장 긴 패턴 우선)"""
+    matches = [pattern for pattern in thresholds if fnmatch.fnmatch(case, pattern)]
+    return thresholds[max(matches, key=len)] if matches else default
+
+
+def compare(results: Dict[str, Dict], reference: Dict, default_threshold: float) -> bool:
+    """기준 결과와 비교해 표를 출력하고, 허용치를 넘게 느려진 케이스가 있으면 True"""
+    thresholds = reference.get("thresholds", {})
+    baseline_results = reference.get("results", {})
+    regressed = False
+    print(f"\nCompared with {reference.get('meta', {}).get('commit') or 'reference'} (min per call):")
+    for case, result in results.items():
+        base = baseline_results.get(case)
+        if base is None:
+            print(f"  new    {case}")
+            continue
+        threshold = threshold_for(case, thresholds, default_threshold)
+        change = (result["min_ms"] - base["min_ms"]) / base["min_ms"] * 100 if base["min_ms"] else 0.0
+        status = "ok"
+        if change > threshold:
+            status = "FAIL"
+            regressed = True
+        elif change < -threshold:
+            status = "faster"
+        note = "" if base.get("output") == result["output"] else "  (output changed)"
+        print(f"  {status:6s} {case:40s} {base['min_ms']:10.3f}ms -> {result['min_ms']:10.3f}ms "
+              f"{change:+7.1f}% (threshold +{threshold:.0f}%){note}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(text_corpus.SIZES), help="쉼표로 구분 (small,medium,book)")
+    parser.add_argument("--pdf-sizes", default=",".join(DEFAULT_PDF_SIZES), help="pdf_parse 케이스 크기 (빈 값이면 생략)")
+    parser.add_argument("--filter", default="*", help="케이스 이름 fnmatch 패턴 (예: 'split_*', '*/book')")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05, help="라운드 하나의 최소 시간(초)")
+    parser.add_argument("--quick", action="store_true", help="book 크기 제외, 라운드/시간 축소 (빠른 확인용)")
+    parser.add_argument("--seed", type=int, default=0, help="코퍼스 seed (기준값과 같아야 비교 가능)")
+    parser.add_argument("--threshold", type=float, default=25.0,
+                        help="기준값 파일에 케이스별 값이 없을 때 허용하는 증가율(%%)")
+    parser.add_argument("--compare", type=Path, default=None, help=f"비교할 결과 JSON (기본값: {BASELINE.name})")
+    parser.add_argument("--output", type=Path, help="이번 결과를 JSON으로 저장")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--list", action="store_true", help="케이스 이름만 출력")
+    args = parser.parse_args()
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    pdf_sizes = [s for s in args.pdf_sizes.split(",") if s]
+    rounds, min_time = args.rounds, args.min_time
+    if args.quick:
+        sizes = [s for s in sizes if s != "book"]
+        pdf_sizes = [s for s in pdf_sizes if s != "book"]
+        rounds, min_time = min(rounds, 3), min(min_time, 0.01)
+    unknown = set(sizes + pdf_sizes) - set(text_corpus.SIZES)
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [(name, func) for name, func in build_cases(sizes, pdf_sizes, args.seed, Path(tmp))
+                 if fnmatch.fnmatch(name, args.filter)]
+        if args.list:
+            print("\n".join(name for name, _ in cases))
+            return
+
+        results = run_cases(cases, rounds, min_time)
+        print(f"{'case':40s} {'min':>12s} {'median':>12s} {'spread':>8s} {'loops':>7s}")
+        for name, result in results.items():
+            print(f"{name:40s} {result['min_ms']:10.3f}ms {result['median_ms']:10.3f}ms "
+                  f"{result['spread_pct']:7.1f}% {result['loops']:7d}")
+
+    report = {
+        "meta": {
+            "commit": git_revision(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "rounds": rounds,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved results to {args.output}")
+
+    reference_path = args.compare or BASELINE
+    reference = json.loads(reference_path.read_text(encoding="utf-8")) if reference_path.exists() else None
+
+    if args.update_baseline:
+        baseline = json.loads(BASELINE.read_text(encoding="utf-8")) if BASELINE.exists() else {}
+        # 케이스별 허용치는 유지하고, 이번에 측정한 케이스만 갱신
+        baseline_results = baseline.get("results", {})
+        baseline_results.update(results)
+        baseline = {
+            "meta": report["meta"],
+            "thresholds": baseline.get("thresholds", {}),
+            "results": dict(sorted(baseline_results.items())),
+        }
+        BASELINE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline ({len(results)} cases) to {BASELINE}")
+        return
+
+    if reference is None:
+        if args.compare:
+            parser.error(f"{args.compare} does not exist")
+        print("No baseline yet (run with --update-baseline)")
+        return
+    if reference.get("meta", {}).get("seed", args.seed) != args.seed:
+        print(f"WARNING: reference was generated with seed {reference['meta']['seed']}, results are not comparable")
+    sys.exit(1 if compare(results, reference, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+주제 분류 추론 백엔드 비교 (pytorch vs onnx int8)
+
+로컬 평가 세트(benchmarks/data/topic_eval.jsonl, 주제별 6개 지문)로 두 백엔드를 비교합니다.
+메모리를 깨끗하게 재기 위해 백엔드마다 별도 프로세스에서 실행합니다.
+    - load_s:     모델 로드 시간
+    - rss_mb:     모델 로드로 늘어난 최대 RSS (torch/onnxruntime import 포함)
+    - p50/p95:    지문 하나당 모델 추론 지연 시간
+    - model_acc:  모델 점수만으로 고른 주제의 정답률
+    - hybrid_acc: classify() (키워드 + 모델) 정답률
+    - agree:      모델만으로 고른 주제가 pytorch 결과와 같은 비율
+
+onnx 백엔드는 먼저 scripts/export_topic_model_onnx.py로 모델을 만들어 두어야 합니다.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_topic_backends.py
+    python benchmarks/bench_topic_backends.py --backends onnx --repeat 5
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+EVAL_SET = Path(__file__).resolve().parent / "data" / "topic_eval.jsonl"
+TOPIC_TO_LABEL = {
+    "humanities": "인문",
+    "natural_science": "자연과학",
+    "engineering": "공학·기술",
+    "arts": "예술·문화",
+}
+
+
+def load_eval_set(path: Path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def max_rss_mb() -> float:
+    # Linux에서 ru_maxrss는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(backend: str, repeat: int):
+    """자식 프로세스: 한 백엔드를 불러와 평가하고 결과를 JSON으로 출력"""
+    os.environ["TOPIC_MODEL_BACKEND"] = backend
+    from services.topic_classification_service import TopicClassificationService
+
+    items = load_eval_set(EVAL_SET)
+    service = TopicClassificationService()
+    rss_before = max_rss_mb()
+    service.load_model()
+    if not service.model_ready:
+        print(json.dumps({"backend": backend, "error": service.model_error or service.model_state}))
+        return
+
+    rss_after = max_rss_mb()
+    service.classify(items[0]["text"])  # 워밍업
+
+    latencies = []
+    model_topics = []
+    for _ in range(repeat):
+        model_topics = []
+        for item in items:
+            start = time.perf_counter()
+            scores = service._calculate_model_scores(item["text"])
+            latencies.append(time.perf_counter() - start)
+            model_topics.append(max(scores.items(), key=lambda x: x[1])[0] if scores else None)
+
+    hybrid = [service.classify(item["text"]) for item in items]
+    latencies_ms = sorted(s * 1000 for s in latencies)
+    print(json.dumps({
+        "backend": backend,
+        "load_s": service.model_load_seconds,
+        "rss_mb": rss_after - rss_before,
+        "p50_ms": statistics.median(latencies_ms),
+        "p95_ms": latencies_ms[max(0, int(len(latencies_ms) * 0.95) - 1)],
+        "model_topics": model_topics,
+        "model_acc": sum(t == item["topic"] for t, item in zip(model_topics, items)) / len(items),
+        "hybrid_acc": sum(t == TOPIC_TO_LABEL[item["topic"]] for t, item in zip(hybrid, items)) / len(items),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "onnx"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.repeat)
+        return
+
+    results = {}
+    for backend in args.backends:
+        output = subprocess.run(
+            [sys.executable, __file__, "--worker", backend, "--repeat", str(args.repeat)],
+            capture_output=True, text=True, cwd=backend_path,
+        )
+        lines = [line for line in output.stdout.splitlines() if line.startswith("{")]
+        if not lines:
+            print(f"{backend}: worker failed\n{output.stderr[-2000:]}")
+            continue
+        results[backend] = json.loads(lines[-1])
+
+    reference = results.get("pytorch", {}).get("model_topics")
+    print(f"{len(load_eval_set(EVAL_SET))} passages, repeat={args.repeat}")
+    print(f"{'backend':<8} {'load_s':>7} {'rss_mb':>8} {'p50_ms':>8} {'p95_ms':>8} "
+          f"{'model_acc':>9} {'hybrid_acc':>10} {'agree':>6}")
+    for backend, r in results.items():
+        if "error" in r:
+            print(f"{backend:<8} failed: {r['error']}")
+            continue
+        agree = (sum(a == b for a, b in zip(r["model_topics"], reference)) / len(reference)
+                 if reference else float("nan"))
+        print(f"{backend:<8} {r['load_s']:7.2f} {r['rss_mb']:8.1f} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} "
+              f"{r['model_acc']:9.2f} {r['hybrid_acc']:10.2f} {agree:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+주제 분류 마이크로 배치 벤치마크
+
+동시 요청 수를 바꿔가며 TopicClassificationService.classify_async의 처리량과
+이벤트 루프 지연(heartbeat lag)을 비교합니다.
+    - inline:  예전 방식처럼 이벤트 루프에서 classify를 바로 호출
+    - batch=1: 추론 워커 사용, 배치 없이 한 건씩
+    - batch=N: 추론 워커 + 동적 마이크로 배치
+
+실제 모델 대신 "호출당 고정 비용 + 텍스트당 비용"으로 CPU를 쓰는 가짜 분류기를 사용합니다.
+(DistilBERT도 배치로 묶으면 토크나이저/그래프 실행 고정 비용이 나뉘어 같은 모양이 됩니다)
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_topic_batching.py --requests 64 --concurrency 1 8 32
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.micro_batcher import MicroBatcher  # noqa: E402
+from services.topic_classification_service import (  # noqa: E402
+    MODEL_READY,
+    ZERO_SHOT_LABELS,
+    TopicClassificationService,
+)
+
+PASSAGE = (
+    "Evolution explains how populations of organisms change over many generations. "
+    "Natural selection favors traits that improve survival, and genetics describes how "
+    "those traits are passed on through DNA."
+)
+
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class FakeZeroShotClassifier:
+    def __init__(self, fixed_ms: float, per_item_ms: float):
+        self.fixed = fixed_ms / 1000
+        self.per_item = per_item_ms / 1000
+
+    def __call__(self, texts, labels, batch_size=1):
+        items = texts if isinstance(texts, list) else [texts]
+        busy(self.fixed + self.per_item * len(items))
+        results = [{"labels": list(labels), "scores": [0.1, 0.7, 0.1, 0.1]} for _ in items]
+        return results if isinstance(texts, list) else results[0]
+
+
+def make_service(args, max_batch_size: int) -> TopicClassificationService:
+    service = TopicClassificationService()
+    service.classifier = FakeZeroShotClassifier(args.fixed_ms, args.per_item_ms)
+    service.model_state = MODEL_READY
+    # 키워드만으로 결정되는 지문이라 cascade를 끄고 항상 모델을 거치게 함
+    service.cascade_enabled = False
+    # 같은 지문을 반복해서 보내므로 결과 캐시도 끔
+    service.cache_size = 0
+    service.batcher = MicroBatcher(service.classify_batch, max_batch_size=max_batch_size,
+                                   max_wait_ms=args.max_wait_ms)
+    return service
+
+
+async def heartbeat(stop: asyncio.Event, lags: list, interval: float = 0.005):
+    """이벤트 루프가 막힌 정도 (예정 시각보다 늦게 깨어난 시간)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_mode(args, mode: str, concurrency: int):
+    service = make_service(args, args.batch_size if mode == "batch=N" else 1)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            if mode == "inline":
+                return service.classify(PASSAGE)
+            return await service.classify_async(PASSAGE)
+
+    stop = asyncio.Event()
+    lags = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    start = time.perf_counter()
+    topics = await asyncio.gather(*(one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    stats = service.batcher.stats()
+    await service.aclose()
+
+    assert all(topic == topics[0] for topic in topics)
+    max_lag = max(lags) * 1000 if lags else elapsed * 1000
+    print(f"  {mode:<8} {args.requests / elapsed:8.1f} req/s  "
+          f"loop lag p50={statistics.median(lags) * 1000 if lags else 0:6.2f}ms max={max_lag:7.2f}ms  "
+          f"avg batch={stats['avg_batch_size']}")
+
+
+async def main_async(args):
+    print(f"fake model: {args.fixed_ms}ms per call + {args.per_item_ms}ms per text, "
+          f"{len(ZERO_SHOT_LABELS)} labels, max wait {args.max_wait_ms}ms")
+    for concurrency in args.concurrency:
+        print(f"concurrency={concurrency}")
+        for mode in ("inline", "batch=1", "batch=N"):
+            await run_mode(args, mode, concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    parser.add_argument("--fixed-ms", type=float, default=20, help="가짜 모델의 호출당 고정 비용")
+    parser.add_argument("--per-item-ms", type=float, default=5, help="가짜 모델의 텍스트당 비용")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+긴 지문 주제 분류 벤치마크 (창 나누기 + 결과 캐시)
+
+평가 세트 지문을 이어 붙여 짧은 글부터 책 한 권 분량까지 만들고,
+길이별로 모델에 들어가는 창 수와 분류 시간, 같은 글을 다시 분류할 때(캐시 적중)의 시간을 비교합니다.
+실제 모델 대신 "창 하나당 고정 비용"으로 CPU를 쓰는 가짜 분류기를 사용하므로 어디서나 실행할 수 있습니다.
+키워드만으로 끝나지 않도록 cascade는 끕니다.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/bench_topic_long_documents.py
+    python benchmarks/bench_topic_long_documents.py --words 500 5000 100000 --per-window-ms 30
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.topic_classification_service import MODEL_READY, TopicClassificationService  # noqa: E402
+
+EVAL_SET = Path(__file__).resolve().parent / "data" / "topic_eval.jsonl"
+
+
+class CountingZeroShotClassifier:
+    """창 수를 세고 창 하나당 per_window초씩 CPU를 쓰는 가짜 분류기"""
+
+    def __init__(self, per_window_ms: float):
+        self.per_window = per_window_ms / 1000
+        self.windows = 0
+
+    def __call__(self, texts, labels, batch_size=1):
+        items = texts if isinstance(texts, list) else [texts]
+        self.windows += len(items)
+        end = time.perf_counter() + self.per_window * len(items)
+        while time.perf_counter() < end:
+            pass
+        results = [{"labels": list(labels), "scores": [0.4, 0.3, 0.2, 0.1]} for _ in items]
+        return results if isinstance(texts, list) else results[0]
+
+
+def build_document(passages, words: int) -> str:
+    out = []
+    count = 0
+    while count < words:
+        for passage in passages:
+            out.append(passage)
+            count += len(passage.split())
+            if count >= words:
+                break
+    return " ".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, nargs="+", default=[150, 1000, 10000, 100000])
+    parser.add_argument("--per-window-ms", type=float, default=20, help="가짜 모델의 창 하나당 비용")
+    args = parser.parse_args()
+
+    with open(EVAL_SET, encoding="utf-8") as f:
+        passages = [json.loads(line)["text"] for line in f if line.strip()]
+
+    service = TopicClassificationService()
+    service.model_state = MODEL_READY
+    service.cascade_enabled = False
+    print(f"window={service.window_words} words, stride={service.window_stride}, "
+          f"max windows={service.max_windows}, {args.per_window_ms}ms per window")
+    print(f"{'words':>8} {'windows':>7} {'first_ms':>9} {'cached_ms':>9}")
+    for words in args.words:
+        service.classifier = CountingZeroShotClassifier(args.per_window_ms)
+        document = build_document(passages, words)
+
+        start = time.perf_counter()
+        service.classify(document)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        service.classify(document)
+        cached = time.perf_counter() - start
+
+        print(f"{len(document.split()):8d} {service.classifier.windows:7d} "
+              f"{first * 1000:9.1f} {cached * 1000:9.2f}")
+    print(f"cache: {service.cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+주제 분류 cascade 기준값 보정
+
+평가 세트(benchmarks/data/topic_eval.jsonl)에서 TOPIC_CASCADE_MIN_HITS / TOPIC_CASCADE_MARGIN 조합마다
+키워드 단계에서 끝나는 비율(exit)과, 그렇게 끝난 지문의 정답률(exit_acc)을 계산합니다.
+exit_acc가 --target 이상인 조합 중 exit가 가장 큰 조합을 추천합니다.
+모델 없이 키워드만 쓰므로 어디서나 실행할 수 있습니다.
+
+실행 (backend 디렉토리에서):
+    python benchmarks/calibrate_topic_cascade.py --target 0.95
+    python benchmarks/calibrate_topic_cascade.py --eval-set my_passages.jsonl
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.topic_classification_service import TOPIC_MAPPING, TopicClassificationService  # noqa: E402
+
+EVAL_SET = Path(__file__).resolve().parent / "data" / "topic_eval.jsonl"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eval-set", type=Path, default=EVAL_SET, help="한 줄에 {\"topic\", \"text\"} JSON")
+    parser.add_argument("--target", type=float, default=0.95, help="조기 종료한 지문의 최소 정답률")
+    parser.add_argument("--max-hits", type=int, default=5)
+    parser.add_argument("--max-margin", type=int, default=4)
+    args = parser.parse_args()
+
+    with open(args.eval_set, encoding="utf-8") as f:
+        items = [json.loads(line) for line in f if line.strip()]
+
+    service = TopicClassificationService(use_model=False)
+    print(f"{len(items)} passages, target exit accuracy {args.target:.2f}")
+    print(f"{'min_hits':>8} {'margin':>6} {'exit':>6} {'exit_acc':>8}")
+
+    best = None
+    for min_hits in range(1, args.max_hits + 1):
+        for margin in range(1, args.max_margin + 1):
+            service.cascade_min_hits = min_hits
+            service.cascade_margin = margin
+            exited = correct = 0
+            for item in items:
+                _, decided = service._keyword_stage(item["text"])
+                if decided is not None:
+                    exited += 1
+                    correct += decided == TOPIC_MAPPING[item["topic"]]
+            exit_rate = exited / len(items)
+            exit_acc = correct / exited if exited else 1.0
+            print(f"{min_hits:8d} {margin:6d} {exit_rate:6.2f} {exit_acc:8.2f}")
+            if exited and exit_acc >= args.target and (best is None or exit_rate > best[2]):
+                best = (min_hits, margin, exit_rate, exit_acc)
+
+    if best:
+        print(f"\nrecommended: TOPIC_CASCADE_MIN_HITS={best[0]} TOPIC_CASCADE_MARGIN={best[1]} "
+              f"(exit {best[2]:.2f}, accuracy {best[3]:.2f})")
+    else:
+        print("\nno setting reaches the target accuracy")
+
+
+if __name__ == "__main__":
+    main()
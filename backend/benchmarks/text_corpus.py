@@ -0,0 +1,236 @@
+"""
+텍스트 처리 벤치마크용 합성 코퍼스 (bench_text_processing.py에서 사용)
+
+같은 seed면 항상 같은 입력을 만들어, 커밋 사이에 결과를 비교할 수 있게 합니다.
+외부 파일이나 네트워크 없이 로컬에서 생성합니다.
+    - make_text:      문단/문장/제목/저자/챕터 줄/문단 번호("(2) ")/말줄임표가 섞인 영어 지문
+    - make_pdf_words: pdfplumber page.extract_words() 형식의 단어 박스 (들여쓰기와 문단 간격 포함)
+    - make_ocr_data:  pytesseract image_to_data(Output.DICT) 형식의 OCR 박스
+    - make_pdf:       Helvetica 텍스트만 있는 최소 PDF 파일 (pdfplumber로 끝까지 처리하는 경우용)
+"""
+import random
+from typing import Dict, List
+
+from services.topic_classification_service import KEYWORD_GROUPS
+
+# 크기별 대략적인 단어 수
+SIZES = {
+    "small": 150,      # 짧은 지문 (직접 입력)
+    "medium": 2_000,   # 교재 한 단원
+    "book": 60_000,    # 책 한 권 분량
+}
+
+COMMON_WORDS = (
+    "the of and to in that is was for it with as his on be at by this had not are but from or have "
+    "an they which one you were her all she there would their we him been has when who will more no "
+    "if out so said what up its about into than them can only other new some could time these two may "
+    "then do first any my now such like our over man me even most made after also did many before must "
+    "through back years where much your way well down should because each just those people how too "
+    "little world very still nation hand old life tell write become here show house both between need "
+    "mean call develop under last right move thing general school never same another begin while number "
+    "part turn real leave might want point form off child few small since against ask late home interest "
+    "large person end open public follow during present without again hold govern around possible head "
+    "consider word program problem however lead system set order eye plan run keep face fact group play"
+).split()
+
+FIRST_NAMES = ("Sigmund", "Virginia", "Charles", "Rachel", "Thomas", "Hannah", "Alan", "Marie")
+LAST_NAMES = ("Freud", "Woolf", "Darwin", "Carson", "Kuhn", "Arendt", "Turing", "Curie")
+
+
+def _vocabulary() -> List[str]:
+    keywords = sorted({kw.lower() for keywords in KEYWORD_GROUPS.values() for kw in keywords if " " not in kw})
+    return COMMON_WORDS * 4 + keywords
+
+
+def _sentence(rng: random.Random, vocabulary: List[str]) -> str:
+    words = [rng.choice(vocabulary) for _ in range(rng.randint(6, 24))]
+    if rng.random() < 0.3:
+        words.insert(rng.randint(1, len(words) - 1), rng.choice(FIRST_NAMES))
+    if rng.random() < 0.15:
+        words[rng.randint(1, len(words) - 1)] += ","
+    sentence = " ".join(words)
+    ending = rng.choices([".", "?", "!", "..."], weights=[85, 7, 4, 4])[0]
+    return sentence[0].upper() + sentence[1:] + ending
+
+
+def _title(rng: random.Random, vocabulary: List[str]) -> str:
+    return " ".join(word.capitalize() for word in rng.sample(vocabulary, rng.randint(2, 5)))
+
+
+def make_paragraphs(size: str, seed: int = 0) -> List[str]:
+    """크기에 맞는 문단 목록 (문장 3~8개씩)"""
+    rng = random.Random(f"{seed}:{size}:paragraphs")
+    vocabulary = _vocabulary()
+    target = SIZES[size]
+    paragraphs = []
+    word_count = 0
+    while word_count < target:
+        paragraph = " ".join(_sentence(rng, vocabulary) for _ in range(rng.randint(3, 8)))
+        paragraphs.append(paragraph)
+        word_count += len(paragraph.split())
+    return paragraphs
+
+
+def make_text(size: str, seed: int = 0) -> str:
+    """
+    split_into_paragraphs가 처리하는 형태를 섞은 지문
+
+    - 문단 구분은 빈 줄, 문단 안은 OCR처럼 70자 안팎에서 줄바꿈
+    - 앞에 제목/저자 줄, 책 크기는 10문단마다 "CHAPTER n" 줄
+    - 일부 문단은 한 덩어리 안에 "(2) ", "(3) " 번호로 이어 붙임
+    """
+    rng = random.Random(f"{seed}:{size}:text")
+    vocabulary = _vocabulary()
+    paragraphs = make_paragraphs(size, seed)
+    blocks = [_title(rng, vocabulary), f"By {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"]
+    i = 0
+    number = 1
+    while i < len(paragraphs):
+        if size == "book" and i % 10 == 0:
+            blocks.append(f"CHAPTER {i // 10 + 1}")
+        if rng.random() < 0.2 and i + 2 < len(paragraphs):
+            # 문단 번호로 이어 붙인 덩어리
+            joined = f"({number}) {paragraphs[i]} ({number + 1}) {paragraphs[i + 1]} ({number + 2}) {paragraphs[i + 2]}"
+            blocks.append(_wrap(joined, rng))
+            number += 3
+            i += 3
+            continue
+        blocks.append(_wrap(paragraphs[i], rng))
+        number += 1
+        i += 1
+    return "\n\n".join(blocks)
+
+
+def _wrap(text: str, rng: random.Random) -> str:
+    lines = []
+    current: List[str] = []
+    width = rng.randint(60, 80)
+    for word in text.split():
+        if current and sum(len(w) + 1 for w in current) + len(word) > width:
+            lines.append(" ".join(current))
+            current = []
+        current.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return "\n".join(lines)
+
+
+def _layout(paragraphs: List[str], rng: random.Random, line_chars: int = 80):
+    """문단을 페이지 좌표로 배치: (page, 줄 텍스트, top, x0, 글자 크기) 목록"""
+    placed = []
+    page = 0
+    top = 72.0
+    for paragraph in paragraphs:
+        words = paragraph.split()
+        line: List[str] = []
+        first = True
+        lines = []
+        for word in words:
+            if line and sum(len(w) + 1 for w in line) + len(word) > line_chars:
+                lines.append(line)
+                line = []
+            line.append(word)
+        if line:
+            lines.append(line)
+        for line_words in lines:
+            if top > 720:
+                page += 1
+                top = 72.0
+            # 문단 첫 줄 들여쓰기, 줄마다 top이 조금씩 흔들림 (스캔/렌더링 오차)
+            x0 = 90.0 if first else 72.0
+            placed.append((page, line_words, top + rng.uniform(-0.8, 0.8), x0, 11.0))
+            top += 14.0
+            first = False
+        top += 10.0 + rng.uniform(0, 4)  # 문단 간격
+    return placed
+
+
+def make_pdf_words(size: str, seed: int = 0) -> List[List[Dict]]:
+    """페이지별 pdfplumber 단어 박스 목록 (page.extract_words()와 같은 키)"""
+    rng = random.Random(f"{seed}:{size}:pdf_words")
+    pages: List[List[Dict]] = []
+    for page, line_words, top, x0, font_size in _layout(make_paragraphs(size, seed), rng):
+        while len(pages) <= page:
+            pages.append([])
+        x = x0
+        for word in line_words:
+            width = len(word) * font_size * 0.5
+            pages[page].append({
+                "text": word,
+                "x0": x,
+                "x1": x + width,
+                "top": top,
+                "bottom": top + font_size,
+                "upright": True,
+                "direction": 1,
+            })
+            x += width + font_size * 0.28
+    # pdfplumber도 대략 읽기 순서로 주지만 정렬은 _group_words_into_lines가 하므로 조금 섞어 둠
+    for words in pages:
+        for i in range(0, len(words) - 1, 7):
+            words[i], words[i + 1] = words[i + 1], words[i]
+    return pages
+
+
+def make_ocr_data(size: str, seed: int = 0) -> Dict[str, List]:
+    """pytesseract image_to_data(Output.DICT) 형식 (한 이미지에 모든 줄, 빈 텍스트 박스 포함)"""
+    rng = random.Random(f"{seed}:{size}:ocr")
+    keys = ("level", "page_num", "block_num", "par_num", "line_num", "word_num",
+            "left", "top", "width", "height", "conf", "text")
+    data: Dict[str, List] = {key: [] for key in keys}
+
+    def add(block, par, line, word_num, left, top, width, height, conf, text):
+        for key, value in zip(keys, (5, 1, block, par, line, word_num, left, top, width, height, conf, text)):
+            data[key].append(value)
+
+    block = 0
+    for page, line_words, top, x0, font_size in _layout(make_paragraphs(size, seed), rng):
+        block = page * 1000 + int(top) // 600
+        line_num = int(top)
+        # Tesseract는 블록/문단/줄 구분용 빈 박스도 돌려줌
+        add(block, 1, line_num, 0, int(x0), int(top), 0, 0, -1, "")
+        x = x0
+        for word_num, word in enumerate(line_words, start=1):
+            width = int(len(word) * font_size * 0.55)
+            add(block, 1, line_num, word_num, int(x), int(top + page * 800 + rng.uniform(-1, 1)),
+                width, int(font_size + rng.uniform(-1, 1)), rng.randint(60, 96), word)
+            x += width + 4
+    return data
+
+
+def make_pdf(size: str, seed: int = 0) -> bytes:
+    """텍스트 레이어만 있는 최소 PDF (Helvetica, 페이지당 약 48줄)"""
+    rng = random.Random(f"{seed}:{size}:pdf")
+    pages: List[List[str]] = []
+    for page, line_words, top, x0, font_size in _layout(make_paragraphs(size, seed), rng):
+        while len(pages) <= page:
+            pages.append([])
+        text = " ".join(line_words).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        # PDF 좌표는 아래에서 위로 (letter 792pt)
+        pages[page].append(f"BT /F1 {font_size:g} Tf {x0:.1f} {792 - top - font_size:.1f} Td ({text}) Tj ET")
+
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    for pid, lines in zip(page_ids, pages):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {pid + 1} 0 R >>".encode()
+        )
+        stream = "\n".join(lines).encode("latin-1", errors="replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
@@ -0,0 +1,104 @@
+"""
+주제 분류 추론 사이드카
+
+Zero-shot 모델을 이 프로세스 하나에만 올리고, 같은 호스트의 API 워커들이 Unix 소켓으로 분류를 요청합니다.
+API 워커 수를 늘려도 모델 메모리는 늘어나지 않습니다.
+여러 워커에서 동시에 들어온 요청은 TopicClassificationService의 마이크로 배치로 함께 묶입니다.
+모델 설정(TOPIC_MODEL_BACKEND 등)은 이 프로세스의 환경 변수를 따릅니다.
+프로토콜은 services/topic_sidecar_client.py를 참고하세요.
+
+실행 (backend 디렉토리에서):
+    python inference_sidecar.py --socket /tmp/myling-topic.sock
+    TOPIC_SIDECAR_SOCKET=/tmp/myling-topic.sock uvicorn main:app --workers 4
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.topic_classification_service import TopicClassificationService  # noqa: E402
+from services.topic_sidecar_client import MAX_MESSAGE_BYTES, read_message, write_message  # noqa: E402
+
+logger = logging.getLogger("inference_sidecar")
+
+DEFAULT_SOCKET = "/tmp/myling-topic.sock"
+
+
+async def handle_connection(service: TopicClassificationService, reader, writer):
+    """연결 하나에서 요청을 줄 단위로 처리"""
+    try:
+        while True:
+            try:
+                message = await read_message(reader)
+            except ValueError as e:
+                await write_message(writer, {"error": f"invalid request: {e}"})
+                break
+            if message is None:
+                break
+
+            op = message.get("op")
+            if op == "classify":
+                texts = message.get("texts")
+                if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                    await write_message(writer, {"error": "texts must be a list of strings"})
+                    continue
+                # 메시지 하나(문서 전체 + 문단들)를 모델 배치 한 번으로 분류
+                topics = await service.classify_many_async(texts)
+                await write_message(writer, {"topics": topics, "model_ready": service.model_ready})
+            elif op == "status":
+                await write_message(writer, {"status": service.model_status(), "model_ready": service.model_ready})
+            else:
+                await write_message(writer, {"error": f"unknown op: {op}"})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        logger.exception("사이드카 요청 처리 실패: %s", e)
+    finally:
+        writer.close()
+
+
+async def serve(socket_path: str):
+    # API 워커용 설정(TOPIC_SIDECAR_SOCKET)이 같은 환경에 있어도 여기서는 모델을 직접 올림
+    service = TopicClassificationService(use_sidecar=False)
+    service.start_background_load()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(
+        lambda r, w: handle_connection(service, r, w), path=socket_path, limit=MAX_MESSAGE_BYTES
+    )
+    logger.info("Topic inference sidecar listening on %s", socket_path)
+    # SIGTERM(컨테이너 종료)에도 소켓 파일을 정리하도록 serve_forever를 취소
+    main_task = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.aclose()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=os.getenv("TOPIC_SIDECAR_SOCKET", DEFAULT_SOCKET),
+                        help=f"Unix 소켓 경로 (기본값: TOPIC_SIDECAR_SOCKET 또는 {DEFAULT_SOCKET})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(serve(args.socket))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from datetime import datetime
 
 class TranslationRequest(BaseModel):
     text: str
+    paragraph_topics: bool = False  # True면 문단마다 주제도 분류
 
 class SentencePair(BaseModel):
     english: str
@@ -11,6 +12,7 @@ class SentencePair(BaseModel):
 
 class Paragraph(BaseModel):
     sentences: List[SentencePair]
+    topic: Optional[str] = None  # paragraph_topics 요청 시에만 채움
 
 class TranslationResponse(BaseModel):
     paragraphs: List[Paragraph]
@@ -38,6 +40,12 @@ class StudyResponse(BaseModel):
     created_at: str
     topic: Optional[str] = None
 
+class FetchMeaningsRequest(BaseModel):
+    """여러 단어 뜻 한 번에 조회 요청"""
+    words: List[str] = []
+    # 주어지면 이 단어들 중 뜻이 비어 있는 것의 뜻을 조회해서 단어장에 바로 저장 (words는 무시)
+    word_ids: Optional[List[int]] = None
+
 class WordResponse(BaseModel):
     id: int
     word: str
@@ -0,0 +1,56 @@
+"""
+오프라인 영한 사전 인덱스 생성 스크립트
+
+단어 목록 파일(한 줄에 "단어<TAB>뜻", 또는 --delimiter로 지정한 구분자)을 읽어
+services/offline_dictionary.py가 mmap으로 읽는 인덱스 파일을 만듭니다.
+빈 줄과 '#'으로 시작하는 줄은 무시합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/build_offline_dictionary.py words.tsv
+    python scripts/build_offline_dictionary.py words.csv --delimiter , -o data/en_ko.mldx
+"""
+import argparse
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.offline_dictionary import DEFAULT_PATH, OfflineDictionary, build_index  # noqa: E402
+
+
+def read_entries(source: Path, delimiter: str):
+    with open(source, "r", encoding="utf-8-sig") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if delimiter not in line:
+                print(f"Skipping line {line_number}: no delimiter")
+                continue
+            word, meaning = line.split(delimiter, 1)
+            yield word, meaning
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="단어 목록 파일 (UTF-8)")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_PATH, help=f"출력 경로 (기본값: {DEFAULT_PATH})")
+    parser.add_argument("--delimiter", default="\t", help="단어와 뜻 사이 구분자 (기본값: 탭)")
+    args = parser.parse_args()
+
+    count = build_index(read_entries(args.source, args.delimiter), args.output)
+    size = args.output.stat().st_size
+    print(f"Wrote {count} words to {args.output} ({size / 1024:.1f} KB)")
+
+    # 생성한 파일을 다시 열어 항목 수 검증
+    dictionary = OfflineDictionary(args.output)
+    if count and len(dictionary) != count:
+        print("ERROR: index verification failed")
+        sys.exit(1)
+    dictionary.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+주제 분류 NLI 모델을 int8 양자화 ONNX로 내보내는 스크립트
+
+TOPIC_MODEL_BACKEND=onnx에서 쓰는 모델 디렉토리를 만듭니다.
+내보내기에는 optimum[onnxruntime]과 torch가 필요하지만, 서버에서 돌릴 때는 onnxruntime만 있으면 됩니다.
+    pip install "optimum[onnxruntime]"
+
+실행 (backend 디렉토리에서):
+    python scripts/export_topic_model_onnx.py
+    python scripts/export_topic_model_onnx.py --model typeform/distilbert-base-uncased-mnli --arch avx512_vnni
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.onnx_zero_shot import DEFAULT_MODEL_FILE  # noqa: E402
+from services.topic_classification_service import DEFAULT_MODEL_NAME, DEFAULT_ONNX_MODEL_DIR  # noqa: E402
+
+# 배포 대상 CPU에 맞는 양자화 설정 (AutoQuantizationConfig의 메서드 이름)
+ARCHITECTURES = ("avx2", "avx512", "avx512_vnni", "arm64")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME, help=f"Hugging Face 모델 (기본값: {DEFAULT_MODEL_NAME})")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_ONNX_MODEL_DIR,
+                        help=f"출력 디렉토리 (기본값: {DEFAULT_ONNX_MODEL_DIR})")
+    parser.add_argument("--arch", choices=ARCHITECTURES, default="avx2", help="양자화 대상 CPU 명령어 집합")
+    args = parser.parse_args()
+
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except ImportError:
+        print('optimum이 설치되어 있지 않습니다: pip install "optimum[onnxruntime]"')
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_dir = Path(tmp)
+        print(f"Exporting {args.model} to ONNX...")
+        model = ORTModelForSequenceClassification.from_pretrained(args.model, export=True)
+        model.save_pretrained(export_dir)
+        AutoTokenizer.from_pretrained(args.model).save_pretrained(export_dir)
+
+        # 가중치만 int8로 바꾸는 동적 양자화 (보정 데이터 필요 없음)
+        print(f"Quantizing (dynamic int8, {args.arch})...")
+        quantizer = ORTQuantizer.from_pretrained(export_dir)
+        qconfig = getattr(AutoQuantizationConfig, args.arch)(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=export_dir / "quantized", quantization_config=qconfig)
+
+        args.output.mkdir(parents=True, exist_ok=True)
+        for path in export_dir.iterdir():
+            if path.is_file() and path.suffix != ".onnx":
+                shutil.copy2(path, args.output / path.name)
+        quantized = next((export_dir / "quantized").glob("*.onnx"))
+        shutil.copy2(quantized, args.output / DEFAULT_MODEL_FILE)
+        fp32_size = sum(path.stat().st_size for path in export_dir.glob("*.onnx"))
+
+    int8_size = (args.output / DEFAULT_MODEL_FILE).stat().st_size
+    print(f"Saved {args.output / DEFAULT_MODEL_FILE} "
+          f"({int8_size / 1024 / 1024:.1f} MB, fp32 was {fp32_size / 1024 / 1024:.1f} MB)")
+    print("Run with TOPIC_MODEL_BACKEND=onnx")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+span JSONL 요약 스크립트 (services/tracing.py의 jsonl 내보내기 결과)
+
+트레이스마다 span 트리를 시작 시각 순으로 들여써서 보여 주고, 임계 경로(부모의 종료를 실제로
+늦춘 자식 span들)에는 '*'를 붙입니다.
+같은 부모 아래 같은 이름의 span이 많으면(단어별 사전 조회, SQL 문 등) 한 줄로 묶어 개수와 합계를 보여 줍니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/trace_summary.py
+    python scripts/trace_summary.py traces/spans.jsonl --last 5
+    python scripts/trace_summary.py --trace 4bf92f3577b34da6a3ce929d0e0e4736
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services.tracing import TRACING_FILE  # noqa: E402
+
+# 같은 부모 아래 같은 이름의 span이 이 개수 이상이면 한 줄로 묶음
+GROUP_THRESHOLD = 4
+
+
+def read_spans(path: Path):
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                spans.append(json.loads(line))
+    return spans
+
+
+def critical_path(span, children, path=None):
+    """
+    임계 경로에 있는 span ID 집합
+
+    가장 늦게 끝난 자식에서 시작해, 그 자식이 시작하기 전에 끝난 자식 중 가장 늦게 끝난 것으로 거슬러 올라가며
+    부모를 기다리게 한 자식들을 고르고, 각 자식 안에서도 같은 방식으로 내려갑니다.
+    """
+    path = set() if path is None else path
+    path.add(span["spanId"])
+    boundary = span["endTimeUnixNano"]
+    for kid in sorted(children.get(span["spanId"], []), key=lambda s: s["endTimeUnixNano"], reverse=True):
+        if kid["endTimeUnixNano"] <= boundary:
+            critical_path(kid, children, path)
+            boundary = kid["startTimeUnixNano"]
+    return path
+
+
+def format_attributes(attributes):
+    return " ".join(f"{key}={value}" for key, value in attributes.items() if key != "db.statement")
+
+
+def print_tree(span, children, on_path, trace_start, depth=0):
+    offset_ms = (span["startTimeUnixNano"] - trace_start) / 1e6
+    marker = "*" if span["spanId"] in on_path else " "
+    status = "" if span["status"] == "OK" else f" [{span['status']}]"
+    print(f"{marker} {offset_ms:8.1f}ms {span['durationMs']:9.1f}ms  {'  ' * depth}{span['name']}{status}  "
+          f"{format_attributes(span['attributes'])}".rstrip())
+
+    kids = sorted(children.get(span["spanId"], []), key=lambda s: s["startTimeUnixNano"])
+    by_name = defaultdict(list)
+    for kid in kids:
+        by_name[kid["name"]].append(kid)
+    printed_groups = set()
+    for kid in kids:
+        # 임계 경로에 있는 span은 묶지 않고 따로 보여 줌
+        group = [s for s in by_name[kid["name"]] if s["spanId"] not in on_path]
+        if kid["spanId"] in on_path or len(group) < GROUP_THRESHOLD:
+            print_tree(kid, children, on_path, trace_start, depth + 1)
+        elif kid["name"] not in printed_groups:
+            printed_groups.add(kid["name"])
+            durations = [s["durationMs"] for s in group]
+            start = (min(s["startTimeUnixNano"] for s in group) - trace_start) / 1e6
+            print(f"  {start:8.1f}ms {sum(durations):9.1f}ms  {'  ' * (depth + 1)}{kid['name']} x{len(group)} "
+                  f"(sum, max {max(durations):.1f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path, nargs="?", default=TRACING_FILE, help=f"span JSONL (기본값: {TRACING_FILE})")
+    parser.add_argument("--last", type=int, default=3, help="최근 트레이스 몇 개를 보여줄지")
+    parser.add_argument("--trace", help="특정 trace ID만 보기")
+    args = parser.parse_args()
+
+    spans = read_spans(args.path)
+    traces = defaultdict(list)
+    for span in spans:
+        traces[span["traceId"]].append(span)
+
+    if args.trace:
+        selected = [args.trace] if args.trace in traces else []
+    else:
+        ordered = sorted(traces, key=lambda trace_id: min(s["startTimeUnixNano"] for s in traces[trace_id]))
+        selected = ordered[-args.last:]
+    if not selected:
+        print("No matching traces")
+        return
+
+    for trace_id in selected:
+        trace_spans = traces[trace_id]
+        span_ids = {span["spanId"] for span in trace_spans}
+        children = defaultdict(list)
+        roots = []
+        for span in trace_spans:
+            # 부모가 이 파일에 없으면(외부 traceparent 등) 루트로 봄
+            if span["parentSpanId"] in span_ids:
+                children[span["parentSpanId"]].append(span)
+            else:
+                roots.append(span)
+        trace_start = min(span["startTimeUnixNano"] for span in trace_spans)
+        print(f"trace {trace_id} ({len(trace_spans)} spans)")
+        for root in sorted(roots, key=lambda s: s["startTimeUnixNano"]):
+            print_tree(root, children, critical_path(root, children), trace_start)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+공유 데이터베이스 런타임 (엔진 + 커넥션 풀 + 세션 팩토리)
+
+앱 시작 시 한 번만 생성해서 StorageService, VocabularyService 등 모든 서비스에 주입합니다.
+같은 myling.db 파일에 엔진이 여러 개 생기면 풀끼리 SQLite 파일 잠금을 두고 경쟁하므로
+엔진은 반드시 하나만 사용합니다.
+
+환경 변수:
+    MYLING_DB_PATH      SQLite 파일 경로 (기본값: myling.db)
+    DB_POOL_SIZE        풀에 유지할 커넥션 수 (기본값: 5)
+    DB_MAX_OVERFLOW     pool_size를 넘어 추가로 열 수 있는 커넥션 수 (기본값: 5)
+    DB_POOL_TIMEOUT     풀에서 커넥션을 기다리는 최대 시간(초) (기본값: 30)
+    DB_BUSY_TIMEOUT     SQLite 잠금 대기 시간(초) (기본값: 30)
+"""
+import asyncio
+import os
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+Base = declarative_base()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class Database:
+    """엔진, 커넥션 풀, 세션 팩토리를 소유하는 공유 런타임"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        busy_timeout: Optional[float] = None,
+    ):
+        self.db_path = db_path or os.getenv("MYLING_DB_PATH", "myling.db")
+        self.pool_size = pool_size if pool_size is not None else _env_int("DB_POOL_SIZE", 5)
+        self.max_overflow = max_overflow if max_overflow is not None else _env_int("DB_MAX_OVERFLOW", 5)
+        self.pool_timeout = pool_timeout if pool_timeout is not None else _env_float("DB_POOL_TIMEOUT", 30.0)
+        self.busy_timeout = busy_timeout if busy_timeout is not None else _env_float("DB_BUSY_TIMEOUT", 30.0)
+
+        # aiosqlite 파일 DB는 기본값이 NullPool(매번 새 커넥션)이므로 큐 풀을 명시적으로 사용
+        self.engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}",
+            echo=False,
+            pool_pre_ping=True,  # 연결 상태 확인
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            connect_args={
+                "check_same_thread": False,  # SQLite 멀티스레드 허용
+                "timeout": self.busy_timeout,  # 잠금 대기 타임아웃
+            },
+        )
+        self.async_session = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,  # 자동 flush 비활성화
+            autocommit=False
+        )
+
+        # 풀 지표
+        self._checkouts = 0
+        self._checked_out = 0
+        self._peak_checked_out = 0
+        self._connects = 0
+        self._lock_retries = 0
+        self._lock_failures = 0
+        self._register_pool_events()
+
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+
+    def _register_pool_events(self):
+        sync_engine = self.engine.sync_engine
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            self._connects += 1
+            # WAL 모드: 읽기와 쓰기가 서로를 막지 않도록 설정
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+            cursor.close()
+
+        @event.listens_for(sync_engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self._checkouts += 1
+            self._checked_out += 1
+            self._peak_checked_out = max(self._peak_checked_out, self._checked_out)
+
+        @event.listens_for(sync_engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            self._checked_out = max(0, self._checked_out - 1)
+
+    async def init_db(self):
+        """등록된 모든 테이블 생성 (프로세스당 한 번만 실행)"""
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            self._initialized = True
+
+    def record_lock_retry(self):
+        """'database is locked' 오류로 재시도할 때 호출"""
+        self._lock_retries += 1
+
+    def record_lock_failure(self):
+        """재시도 후에도 잠금이 풀리지 않아 실패했을 때 호출"""
+        self._lock_failures += 1
+
+    def pool_stats(self) -> Dict[str, object]:
+        """커넥션 풀 및 잠금 경합 지표"""
+        pool = self.engine.pool
+        return {
+            "db_path": self.db_path,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "busy_timeout": self.busy_timeout,
+            "checked_out": self._checked_out,
+            "peak_checked_out": self._peak_checked_out,
+            "idle": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+            "total_checkouts": self._checkouts,
+            "total_connects": self._connects,
+            "lock_retries": self._lock_retries,
+            "lock_failures": self._lock_failures,
+            "initialized": self._initialized,
+        }
+
+    async def dispose(self):
+        """풀의 모든 커넥션 종료 (앱 종료 시 호출)"""
+        await self.engine.dispose()
@@ -0,0 +1,181 @@
+"""
+단어 뜻 캐시 (메모리 LRU + SQLite 영구 저장)
+
+소문자 단어를 키로 DictionaryService.get_word_meaning 결과를 저장합니다.
+뜻을 찾은 결과(positive)는 오래 보관하고, 찾지 못한 결과(negative)는 짧게 보관해서
+없는 단어를 외부 API에 계속 다시 요청하지 않도록 합니다.
+
+환경 변수:
+    DICTIONARY_CACHE_SIZE          메모리 LRU에 보관할 최대 단어 수 (기본값: 5000)
+    DICTIONARY_CACHE_TTL           뜻을 찾은 결과 보관 시간(초) (기본값: 30일)
+    DICTIONARY_CACHE_NEGATIVE_TTL  뜻을 찾지 못한 결과 보관 시간(초) (기본값: 1시간)
+"""
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Boolean, Column, DateTime, String, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from services.database import Base, Database
+
+
+class DictionaryCacheEntry(Base):
+    __tablename__ = "dictionary_cache"
+
+    word = Column(String, primary_key=True)
+    meaning = Column(String, nullable=True)
+    found = Column(Boolean, nullable=False, default=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now)
+
+
+class DictionaryCache:
+    """메모리 LRU를 앞단에 둔 영구 단어 뜻 캐시"""
+
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        max_entries: Optional[int] = None,
+        positive_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            database: 영구 저장에 사용할 공유 Database (없으면 메모리에만 보관)
+            max_entries: 메모리 LRU 최대 크기
+            positive_ttl: 뜻을 찾은 결과 보관 시간(초)
+            negative_ttl: 뜻을 찾지 못한 결과 보관 시간(초)
+        """
+        self.database = database
+        self.max_entries = max_entries or int(os.getenv("DICTIONARY_CACHE_SIZE", "5000"))
+        self.positive_ttl = positive_ttl or float(os.getenv("DICTIONARY_CACHE_TTL", str(30 * 24 * 3600)))
+        self.negative_ttl = negative_ttl or float(os.getenv("DICTIONARY_CACHE_NEGATIVE_TTL", "3600"))
+
+        # word -> (meaning 또는 None, 만료 시각(epoch 초))
+        self._memory: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(word: str) -> str:
+        return word.lower().strip()
+
+    def _remember(self, key: str, meaning: Optional[str], expires_at: float):
+        self._memory[key] = (meaning, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    async def get(self, word: str) -> Tuple[bool, Optional[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (캐시에 있는지 여부, 뜻). 캐시에 있지만 뜻이 None이면 '찾을 수 없는 단어'로 저장된 것
+        """
+        key = self._key(word)
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            meaning, expires_at = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                if meaning is None:
+                    self.negative_hits += 1
+                return True, meaning
+            del self._memory[key]
+
+        if self.database is not None:
+            await self.database.init_db()
+            async with self.database.async_session() as session:
+                result = await session.execute(
+                    select(DictionaryCacheEntry).where(
+                        DictionaryCacheEntry.word == key,
+                        DictionaryCacheEntry.expires_at > datetime.now(),
+                    )
+                )
+                row = result.scalar_one_or_none()
+            if row is not None:
+                meaning = row.meaning if row.found else None
+                self._remember(key, meaning, row.expires_at.timestamp())
+                self.db_hits += 1
+                if meaning is None:
+                    self.negative_hits += 1
+                return True, meaning
+
+        self.misses += 1
+        return False, None
+
+    async def set(self, word: str, meaning: Optional[str]):
+        """조회 결과 저장 (meaning이 None이면 짧은 TTL의 negative 항목으로 저장)"""
+        await self.set_many({word: meaning})
+    
+    async def set_many(self, meanings: Dict[str, Optional[str]]):
+        """여러 조회 결과를 한 트랜잭션으로 저장"""
+        if not meanings:
+            return
+        now = datetime.now()
+        rows = []
+        for word, meaning in meanings.items():
+            key = self._key(word)
+            found = bool(meaning)
+            ttl = self.positive_ttl if found else self.negative_ttl
+            expires_at = now + timedelta(seconds=ttl)
+            self._remember(key, meaning if found else None, expires_at.timestamp())
+            self.stores += 1
+            rows.append({
+                "word": key,
+                "meaning": meaning if found else None,
+                "found": found,
+                "expires_at": expires_at,
+                "updated_at": now,
+            })
+
+        if self.database is None:
+            return
+        await self.database.init_db()
+        async with self.database.async_session() as session:
+            # SQLite 바인드 변수 제한을 넘지 않도록 나눠서 저장
+            for i in range(0, len(rows), 150):
+                stmt = sqlite_insert(DictionaryCacheEntry).values(rows[i:i + 150])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[DictionaryCacheEntry.word],
+                    set_={
+                        "meaning": stmt.excluded.meaning,
+                        "found": stmt.excluded.found,
+                        "expires_at": stmt.excluded.expires_at,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+                await session.execute(stmt)
+            await session.commit()
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 적중/실패 통계"""
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._memory),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "positive_ttl": self.positive_ttl,
+            "negative_ttl": self.negative_ttl,
+        }
@@ -1,223 +1,605 @@
-from typing import Optional, List
-import httpx
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse
+import asyncio
+import importlib.util
 import json
+import logging
+import os
+import time
+
+# httpx는 서버 시작 시간을 줄이려고 처음 사전 API를 호출할 때 import
+if TYPE_CHECKING:
+    import httpx
+
+from services.metrics import timed_stage
+from services.rate_limiter import RateLimiter
+from services.resilience import CircuitBreaker, LatencyTracker
+from services.tracing import set_attributes, traced
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationUnavailable(Exception):
+    """DeepL 번역 요청 자체가 실패함 (단어가 없는 것과 달리 일시적일 수 있으므로 캐시하지 않음)"""
+
 
 class DictionaryService:
     """Free Dictionary API + DeepL 조합으로 사전식 한국어 뜻 제공"""
     
     DICT_API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en"
+    DICT_API_HOST = urlparse(DICT_API_URL).netloc
+    DEEPL_HOST = "deepl"
     
-    def __init__(self, translation_service=None):
-        """번역 서비스를 받아서 영어 정의를 한국어로 번역"""
+    def __init__(self, translation_service=None, max_concurrency: Optional[int] = None, cache=None,
+                 offline_dictionary=None):
+        """번역 서비스를 받아서 영어 정의를 한국어로 번역
+        
+        Args:
+            translation_service: 영어 정의를 한국어로 번역할 TranslationService
+            max_concurrency: 여러 단어를 조회할 때 동시에 진행할 최대 조회 수
+                (기본값: DICTIONARY_MAX_CONCURRENCY 환경 변수 또는 8)
+            cache: 조회 결과를 저장할 DictionaryCache (없으면 매번 외부 API 호출)
+            offline_dictionary: 외부 API보다 먼저 확인할 OfflineDictionary (로컬 영한 사전)
+        """
         self.translation_service = translation_service
+        self.cache = cache
+        self.offline_dictionary = offline_dictionary
+        # 같은 단어를 동시에 조회하면 외부 요청은 한 번만 보내고 결과를 공유
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # 조회마다 DNS/TCP/TLS 연결을 새로 맺지 않도록 keep-alive 클라이언트 하나를 재사용
+        self._client: Optional["httpx.AsyncClient"] = None
+        self.http2 = importlib.util.find_spec("h2") is not None
+        self._http_limits = {
+            "max_connections": int(os.getenv("DICTIONARY_HTTP_MAX_CONNECTIONS", "20")),
+            "max_keepalive_connections": int(os.getenv("DICTIONARY_HTTP_MAX_KEEPALIVE", "10")),
+            "keepalive_expiry": float(os.getenv("DICTIONARY_HTTP_KEEPALIVE_EXPIRY", "30")),
+        }
+        self.max_concurrency = max_concurrency or int(os.getenv("DICTIONARY_MAX_CONCURRENCY", "8"))
+        # 호스트별 초당 요청 수 제한 (무료 사전 API와 DeepL 모두 과도한 요청 시 429 반환)
+        self._rate_limiters = {
+            self.DICT_API_HOST: RateLimiter(
+                rate=float(os.getenv("DICTIONARY_API_RATE_LIMIT", "10")),
+                burst=self.max_concurrency,
+            ),
+            self.DEEPL_HOST: RateLimiter(
+                rate=float(os.getenv("DEEPL_RATE_LIMIT", "5")),
+                burst=self.max_concurrency,
+            ),
+        }
+        # 사전 API가 연속으로 실패하면 잠시 호출을 멈추고 바로 DeepL 직접 번역 사용
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv("DICTIONARY_BREAKER_FAILURES", "5")),
+            reset_timeout=float(os.getenv("DICTIONARY_BREAKER_RESET_SECONDS", "30")),
+        )
+        # 사전 API 응답이 평소(p95)보다 늦으면 DeepL 직접 번역을 동시에 시작 (hedged request)
+        self.hedging_enabled = os.getenv("DICTIONARY_HEDGING_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.latency = LatencyTracker(
+            default_delay=float(os.getenv("DICTIONARY_HEDGE_DEFAULT_DELAY", "2.0")),
+            min_delay=float(os.getenv("DICTIONARY_HEDGE_MIN_DELAY", "0.2")),
+            max_delay=float(os.getenv("DICTIONARY_HEDGE_MAX_DELAY", "3.0")),
+        )
+        self.hedged_count = 0
+        self.hedge_wins = 0
         if not translation_service:
-            print("⚠️ Warning: TranslationService not provided to DictionaryService")
+            logger.warning("TranslationService not provided to DictionaryService")
         else:
-            print("✅ [DictionaryService] Initialized with Free Dictionary API + DeepL")
+            logger.info("DictionaryService initialized with Free Dictionary API + DeepL")
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """커넥션 풀을 가진 공유 HTTP 클라이언트 (처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(**self._http_limits),
+                http2=self.http2,  # h2 패키지가 설치된 경우에만 HTTP/2 사용
+            )
+        return self._client
+    
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료 (앱 lifespan 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _translate(self, text: str) -> str:
+        """DeepL 속도 제한을 지키며 한국어로 번역"""
+        await self._rate_limiters[self.DEEPL_HOST].acquire()
+        return await self.translation_service.translate(text, target_lang="KO")
+    
+    async def _translate_batch(self, texts: List[str]) -> List[str]:
+        """여러 문자열을 DeepL 배치 요청으로 번역 (요청당 최대 MAX_BATCH_TEXTS개)"""
+        translations: List[str] = []
+        batch_size = self.translation_service.MAX_BATCH_TEXTS
+        for i in range(0, len(texts), batch_size):
+            await self._rate_limiters[self.DEEPL_HOST].acquire()
+            translations.extend(
+                await self.translation_service.translate_batch(texts[i:i + batch_size], target_lang="KO")
+            )
+        return translations
+    
+    @traced()
+    @timed_stage("dictionary_batch")
+    async def get_word_meanings(self, words: List[str], max_concurrency: Optional[int] = None,
+                                refresh_misses: bool = False) -> Dict[str, Optional[str]]:
+        """
+        여러 단어의 뜻을 한 번에 조회합니다. 단어마다 get_word_meaning과 같은 순서로 확인합니다.
+        1. 오프라인 사전 -> 캐시 -> 다른 요청이 이미 조회 중인 단어(_inflight)는 그 결과를 사용
+        2. 나머지 단어는 _inflight에 등록하고 영어 정의를 동시에 가져옴 (동시 조회 수는 max_concurrency로 제한)
+        3. 모든 정의 문자열을 DeepL 배치 요청 한 번으로 번역
+        
+        Args:
+            refresh_misses: True면 캐시된 '찾지 못함' 결과를 무시하고 다시 조회 (백그라운드 워커 재시도용)
+        
+        Returns:
+            소문자 단어 -> 뜻 (찾지 못하면 None)
+        """
+        unique_words = list(dict.fromkeys(w.lower().strip() for w in words if w and w.strip()))
+        results: Dict[str, Optional[str]] = {}
+        
+        remaining = []
+        for word in unique_words:
+            if self.offline_dictionary is not None:
+                offline_meaning = self.offline_dictionary.lookup(word)
+                if offline_meaning:
+                    results[word] = offline_meaning
+                    continue
+            remaining.append(word)
+        
+        if remaining and not self.translation_service:
+            logger.error("TranslationService not available for %d word(s)", len(remaining))
+            results.update({word: None for word in remaining})
+            return results
+        
+        loop = asyncio.get_running_loop()
+        pending: List[str] = []
+        futures: Dict[str, asyncio.Future] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        try:
+            for word in remaining:
+                if self.cache:
+                    cached, meaning = await self.cache.get(word)
+                    if cached and (meaning is not None or not refresh_misses):
+                        results[word] = meaning
+                        continue
+                # 캐시 조회(await) 사이에 다른 요청이 등록했을 수 있으므로 등록 직전에 확인
+                inflight = self._inflight.get(word)
+                if inflight is not None:
+                    waiting[word] = inflight
+                    continue
+                pending.append(word)
+                futures[word] = self._inflight[word] = loop.create_future()
+            
+            set_attributes({
+                "dictionary.words": len(unique_words),
+                "dictionary.local_hits": len(results),
+                "dictionary.inflight": len(waiting),
+                "dictionary.pending": len(pending),
+            })
+            
+            if pending:
+                fetched = await self._lookup_word_meanings(pending, max_concurrency)
+                results.update(fetched)
+                for word in pending:
+                    futures[word].set_result(fetched.get(word))
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # 기다리는 쪽이 없으면 '처리되지 않은 예외' 경고가 나지 않도록 소비
+                    future.exception()
+            raise
+        finally:
+            for word, future in futures.items():
+                if self._inflight.get(word) is future:
+                    del self._inflight[word]
+        
+        if waiting:
+            shared = await asyncio.gather(*(asyncio.shield(f) for f in waiting.values()), return_exceptions=True)
+            for word, meaning in zip(waiting, shared):
+                results[word] = None if isinstance(meaning, BaseException) else meaning
+        return results
+    
+    async def _lookup_word_meanings(self, words: List[str], max_concurrency: Optional[int]) -> Dict[str, Optional[str]]:
+        """캐시를 거치지 않고 외부 API로 여러 단어의 뜻 조회 (번역이 성공하면 결과를 캐시에 저장)"""
+        results: Dict[str, Optional[str]] = {}
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def fetch(word: str) -> Optional[List[str]]:
+            async with semaphore:
+                return await self._fetch_definitions(word)
+        
+        definitions = await asyncio.gather(*(fetch(word) for word in words))
+        
+        try:
+            # 정의가 있으면 정의를, 없으면 단어 자체를 번역 (_fallback_to_deepl과 같은 방식)
+            texts = [". ".join(defs) if defs else word for word, defs in zip(words, definitions)]
+            translations = await self._translate_batch(texts)
+            
+            retry = []
+            for word, defs, korean in zip(words, definitions, translations):
+                if not defs:
+                    results[word] = self._format_direct_translation(korean)
+                elif korean and korean.strip():
+                    results[word] = self._format_korean_meaning(korean)
+                else:
+                    retry.append(word)
+            
+            # 정의 번역이 비어있던 단어는 단어 자체를 한 번 더 배치로 번역
+            if retry:
+                for word, korean in zip(retry, await self._translate_batch(retry)):
+                    results[word] = self._format_direct_translation(korean)
+        except Exception as e:
+            # DeepL 오류는 일시적일 수 있으므로 캐시하지 않음
+            logger.warning("Batch translation failed for %d word(s): %s", len(words), e)
+            return {word: results.get(word) for word in words}
+        
+        if self.cache:
+            await self.cache.set_many({word: results.get(word) for word in words})
+        return results
     
     async def _fallback_to_deepl(self, word: str) -> Optional[str]:
-        """DeepL로 직접 번역하는 fallback 메서드"""
+        """DeepL로 직접 번역하는 fallback 메서드
+        
+        번역 결과가 비어 있으면 None, DeepL 요청이 실패하면 TranslationUnavailable을 발생시킵니다.
+        """
         if not self.translation_service:
-            print(f"   ❌ TranslationService not available for fallback")
+            logger.error("TranslationService not available for fallback")
             return None
         
         try:
-            print(f"   🔄 Translating '{word}' directly with DeepL...")
+            logger.debug("Translating %r directly with DeepL", word)
             # 단어 자체를 직접 번역 (더 자연스러운 결과)
-            korean_meaning = await self.translation_service.translate(word, target_lang="KO")
-            if korean_meaning and korean_meaning.strip():
-                result = korean_meaning.strip()
-                # "의미" 같은 불필요한 단어 제거
-                if result.endswith('의미'):
-                    result = result[:-2].strip()
-                
-                # 쉼표나 세미콜론으로 구분된 뜻 필터링 (20글자 초과 제거)
-                result = self._filter_long_meanings(result)
-                
-                if not result.endswith('.'):
-                    result += "."
-                print(f"✅ [DictionaryService] Fallback translation: '{result}'")
-                return result
+            korean_meaning = await self._translate(word)
+            result = self._format_direct_translation(korean_meaning)
+            if result:
+                logger.debug("Fallback translation: %r", result)
             else:
-                print(f"   ❌ DeepL translation returned empty")
-                return None
+                logger.debug("DeepL translation returned empty")
+            return result
         except Exception as e:
-            print(f"   ❌ Fallback translation failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Fallback translation failed: %s", e, exc_info=True)
+            raise TranslationUnavailable(str(e)) from e
+    
+    def _format_direct_translation(self, korean_meaning: Optional[str]) -> Optional[str]:
+        """단어를 직접 번역한 결과를 사전식 뜻으로 정리 (비어있으면 None)"""
+        if not korean_meaning or not korean_meaning.strip():
             return None
+        result = korean_meaning.strip()
+        # "의미" 같은 불필요한 단어 제거
+        if result.endswith('의미'):
+            result = result[:-2].strip()
+        
+        # 쉼표나 세미콜론으로 구분된 뜻 필터링 (20글자 초과 제거)
+        result = self._filter_long_meanings(result)
+        
+        if not result.endswith('.'):
+            result += "."
+        return result
+    
+    def stats(self) -> Dict[str, object]:
+        """캐시 적중률 등 사전 서비스 상태"""
+        return {
+            "cache": self.cache.stats() if self.cache else None,
+            "offline": self.offline_dictionary.stats() if self.offline_dictionary is not None else None,
+            "inflight": len(self._inflight),
+            "http2": self.http2,
+            "circuit_breaker": self.breaker.stats(),
+            "hedging": {
+                "enabled": self.hedging_enabled,
+                "hedged": self.hedged_count,
+                "fallback_wins": self.hedge_wins,
+                **self.latency.stats(),
+            },
+        }
     
+    @traced()
+    @timed_stage("dictionary")
     async def get_word_meaning(self, word: str, translate_to_korean: bool = True) -> Optional[str]:
         """
         Free Dictionary API에서 영어 정의를 가져와서 DeepL로 한국어로 번역합니다.
         사전식 뜻 형식: "달리다. 작동하다. 운영하다."
+        로컬 오프라인 사전과 캐시를 먼저 확인하고, 외부 API는 둘 다 없을 때만 사용합니다.
+        찾지 못한 단어도 짧은 기간 캐시하지만, DeepL 오류로 뜻을 못 얻은 경우는 캐시하지 않습니다.
         """
         if not word or not word.strip():
-            print(f"❌ [DictionaryService] Empty word provided")
+            logger.debug("Empty word provided")
             return None
         
+        word_clean = word.lower().strip()
+        set_attributes({"dictionary.word": word_clean})
+        
+        if self.offline_dictionary is not None:
+            offline_meaning = self.offline_dictionary.lookup(word_clean)
+            if offline_meaning:
+                set_attributes({"dictionary.source": "offline"})
+                return offline_meaning
+        
         if not self.translation_service:
-            print(f"❌ [DictionaryService] TranslationService not available for word: {word}")
+            logger.error("TranslationService not available for word: %s", word)
             return None
         
-        word_clean = word.lower().strip()
-        print(f"🔍 [DictionaryService] Fetching definition for: '{word_clean}'")
+        if self.cache:
+            cached, meaning = await self.cache.get(word_clean)
+            if cached:
+                set_attributes({"dictionary.source": "cache"})
+                return meaning
+        
+        # 같은 단어를 이미 조회 중이면 그 결과를 기다림
+        inflight = self._inflight.get(word_clean)
+        if inflight is not None:
+            set_attributes({"dictionary.source": "inflight"})
+            return await asyncio.shield(inflight)
+        
+        set_attributes({"dictionary.source": "api"})
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[word_clean] = future
+        try:
+            try:
+                meaning = await self._lookup_word_meaning(word_clean)
+            except TranslationUnavailable:
+                # 일시적인 DeepL 오류는 '찾지 못함'으로 캐시하지 않고 이번 조회만 None
+                future.set_result(None)
+                return None
+            if self.cache:
+                await self.cache.set(word_clean, meaning)
+            future.set_result(meaning)
+            return meaning
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 쪽이 없으면 '처리되지 않은 예외' 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(word_clean, None)
+    
+    async def _lookup_word_meaning(self, word_clean: str) -> Optional[str]:
+        """캐시를 거치지 않고 외부 API로 단어 뜻 조회"""
+        logger.debug("Fetching definition for %r", word_clean)
+        
+        if self.hedging_enabled:
+            definitions, hedged_meaning, fallback_done = await self._fetch_definitions_hedged(word_clean)
+            # hedging에서 이미 DeepL 직접 번역을 했으면 (실패했더라도) 다시 요청하지 않음
+            if fallback_done:
+                return hedged_meaning
+        else:
+            definitions = await self._fetch_definitions(word_clean)
+        if not definitions:
+            # Free Dictionary API에 없거나 오류가 나면 DeepL로 직접 번역 (fallback)
+            logger.debug("Falling back to DeepL direct translation for %r", word_clean)
+            return await self._fallback_to_deepl(word_clean)
+        
+        # 3단계: 영어 정의들을 하나의 텍스트로 합치기
+        # 예: "move at a speed faster than a walk. operate or function."
+        english_definitions = ". ".join(definitions)
+        logger.debug("English definitions for %r: %.100s", word_clean, english_definitions)
+        
+        # 4단계: DeepL로 한국어로 번역
+        logger.debug("Translating definitions for %r with DeepL", word_clean)
+        try:
+            korean_translation = await self._translate(english_definitions)
+        except Exception as e:
+            logger.warning("Definition translation failed for %r: %s, falling back to direct translation", word_clean, e)
+            return await self._fallback_to_deepl(word_clean)
+        
+        if not korean_translation or not korean_translation.strip():
+            logger.debug("Definition translation for %r returned empty, falling back to direct translation", word_clean)
+            return await self._fallback_to_deepl(word_clean)
+        
+        result = self._format_korean_meaning(korean_translation)
+        logger.debug("Final meaning for %r: %r", word_clean, result)
+        return result
+    
+    async def _fetch_definitions_hedged(self, word_clean: str) -> Tuple[Optional[List[str]], Optional[str], bool]:
+        """
+        사전 API 응답이 hedging 지연 시간(최근 p95)을 넘기면 DeepL 직접 번역을 동시에 시작하고
+        먼저 결과를 낸 쪽을 사용합니다.
+        
+        Returns:
+            (영어 정의, DeepL 직접 번역 결과, 직접 번역을 이미 했는지).
+            세 번째 값이 True면 두 번째 값이 최종 결과 (직접 번역 결과가 비었으면 None).
+            두 쪽 모두 실패하고 DeepL 요청이 오류였으면 TranslationUnavailable
+        """
+        started_at = time.perf_counter()
+        hedge_delay = self.latency.hedge_delay()
+        fetch = asyncio.create_task(self._fetch_definitions(word_clean))
+        fallback: Optional[asyncio.Task] = None
+        try:
+            done, _ = await asyncio.wait({fetch}, timeout=hedge_delay)
+            if done:
+                return fetch.result(), None, False
+            
+            self.hedged_count += 1
+            logger.debug("Dictionary API slower than p95, hedging with DeepL for %r", word_clean)
+            fallback = asyncio.create_task(self._fallback_to_deepl(word_clean))
+            done, _ = await asyncio.wait({fetch, fallback}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if fallback in done and fallback.exception() is None and fallback.result():
+                self.hedge_wins += 1
+                # 직접 번역보다 느린 응답은 실패로 보고 브레이커에 반영
+                self.breaker.record_failure()
+                return None, fallback.result(), True
+            
+            definitions = await fetch
+            if definitions:
+                return definitions, None, False
+            # 사전 API가 실패했으면 이미 진행 중인 직접 번역 결과 사용
+            return None, await fallback, True
+        finally:
+            if fallback is not None and not fetch.done():
+                # 취소되는 느린 응답도 최소 이만큼 걸렸다는 표본(censored)으로 남겨야
+                # p95가 빠른 응답만으로 계산되어 hedging 지연 시간이 계속 줄어드는 일이 없음
+                self.latency.record(max(time.perf_counter() - started_at, hedge_delay))
+            for task in (fetch, fallback):
+                if task is not None and not task.done():
+                    task.cancel()
+                elif task is fallback and task is not None and not task.cancelled():
+                    # 사전 API 결과를 썼다면 직접 번역의 오류는 무시 ('처리되지 않은 예외' 경고 방지)
+                    task.exception()
+    
+    @traced("FreeDictionaryAPI.get")
+    async def _fetch_definitions(self, word_clean: str) -> Optional[List[str]]:
+        """Free Dictionary API에서 영어 정의를 최대 3개 가져오기 (찾지 못하거나 오류면 None)"""
+        import httpx
         
         try:
             # 1단계: Free Dictionary API에서 영어 정의 가져오기
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                api_url = f"{self.DICT_API_URL}/{word_clean}"
-                print(f"   📡 Fetching from: {api_url}")
-                
+            client = self._get_client()
+            api_url = f"{self.DICT_API_URL}/{word_clean}"
+            logger.debug("Fetching %s", api_url)
+            
+            if not self.breaker.allow_request():
+                logger.debug("Circuit breaker open, skipping Free Dictionary API for %r", word_clean)
+                set_attributes({"circuit.open": True})
+                return None
+            
+            await self._rate_limiters[self.DICT_API_HOST].acquire()
+            started_at = time.perf_counter()
+            try:
                 response = await client.get(api_url)
-                
-                print(f"   📊 Response status: {response.status_code}")
-                
-                if response.status_code == 404:
-                    print(f"   ⚠️ Word '{word_clean}' not found in Free Dictionary API (404)")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                if response.status_code != 200:
-                    print(f"   ❌ API returned status {response.status_code}")
-                    print(f"   Response text: {response.text[:200]}")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                try:
-                    data = response.json()
-                    print(f"   📦 Response data type: {type(data)}")
-                    if isinstance(data, list):
-                        print(f"   📦 Response data length: {len(data)}")
-                    elif isinstance(data, dict):
-                        print(f"   📦 Response data keys: {list(data.keys())}")
-                except Exception as e:
-                    print(f"   ❌ Failed to parse JSON: {e}")
-                    print(f"   Response text: {response.text[:500]}")
-                    print(f"   🔄 Falling back to DeepL direct translation...")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                # 2단계: 영어 정의 추출 (여러 의미 수집)
-                definitions = []
-                
-                if isinstance(data, list) and len(data) > 0:
-                    # 첫 번째 항목의 meanings에서 정의 추출
-                    word_entry = data[0]
-                    print(f"   📖 Word entry keys: {list(word_entry.keys()) if isinstance(word_entry, dict) else 'not a dict'}")
-                    meanings = word_entry.get("meanings", [])
-                    print(f"   📚 Found {len(meanings)} meaning group(s)")
-                    
-                    for idx, meaning in enumerate(meanings):
-                        print(f"   📚 Meaning group {idx + 1}: {meaning.get('partOfSpeech', 'unknown')}")
-                        defs = meaning.get("definitions", [])
-                        print(f"      Found {len(defs)} definition(s) in this group")
-                        for def_item in defs:
-                            definition = def_item.get("definition", "").strip()
-                            if definition:
-                                definitions.append(definition)
-                                print(f"      ✓ Added definition: {definition[:50]}...")
+            except httpx.RequestError:
+                self.breaker.record_failure()
+                raise
+            self.latency.record(time.perf_counter() - started_at)
+            # 404는 정상 응답 (없는 단어), 429/5xx는 사전 API 장애로 봄
+            if response.status_code == 429 or response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            
+            logger.debug("Free Dictionary API status %d for %r", response.status_code, word_clean)
+            set_attributes({"dictionary.word": word_clean, "http.status_code": response.status_code})
+            
+            if response.status_code == 404:
+                logger.debug("%r not found in Free Dictionary API (404)", word_clean)
+                return None
+            
+            if response.status_code != 200:
+                logger.warning("Free Dictionary API returned status %d for %r: %.200s", response.status_code, word_clean, response.text)
+                return None
+            
+            try:
+                data = response.json()
+                logger.debug("Response data type: %s", type(data).__name__)
+                if isinstance(data, list):
+                    logger.debug("Response data length: %d", len(data))
                 elif isinstance(data, dict):
-                    # dict 형태의 오류 응답인 경우 (예: {"title": "No Definitions Found"})
-                    error_title = data.get("title", "")
-                    error_message = data.get("message", "")
-                    print(f"   ⚠️ Free Dictionary API error response: {error_title}")
-                    if error_message:
-                        print(f"      Message: {error_message}")
-                    print(f"   🔄 Falling back to DeepL direct translation...")
-                    # Free Dictionary API 오류 응답 시 DeepL로 직접 번역 (fallback)
-                    return await self._fallback_to_deepl(word_clean)
-                else:
-                    print(f"   ⚠️ Unexpected data format: {type(data)}, length: {len(data) if isinstance(data, list) else 'N/A'}")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                if not definitions:
-                    print(f"   ⚠️ No definitions found in Free Dictionary API for '{word_clean}'")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                # 최대 3개의 정의만 사용 (너무 많으면 길어짐)
-                definitions = definitions[:3]
-                print(f"   📝 Found {len(definitions)} definition(s)")
-                
-                # 3단계: 영어 정의들을 하나의 텍스트로 합치기
-                # 예: "move at a speed faster than a walk. operate or function."
-                english_definitions = ". ".join(definitions)
-                print(f"   📄 English definitions: {english_definitions[:100]}...")
-                
-                # 4단계: DeepL로 한국어로 번역
-                print(f"   🌐 Translating with DeepL...")
-                korean_translation = await self.translation_service.translate(english_definitions, target_lang="KO")
-                
-                if not korean_translation or not korean_translation.strip():
-                    print(f"   ❌ Translation returned empty, falling back to direct translation...")
-                    return await self._fallback_to_deepl(word_clean)
-                
-                # 5단계: 사전식 형식으로 포맷팅
-                # 번역 결과를 문장 단위로 분리하고 간결하게 정리
-                korean_meaning = korean_translation.strip()
-                
-                # 마침표로 문장 분리
-                sentences = [s.strip() for s in korean_meaning.split('.') if s.strip()]
-                
-                # 각 문장을 간결하게 정리 (불필요한 설명 제거)
-                formatted_meanings = []
-                for sentence in sentences:
-                    # 너무 긴 문장은 앞부분만 사용 (50자 제한)
-                    if len(sentence) > 50:
-                        # 첫 번째 쉼표나 "또는", "그리고" 등으로 분리
-                        if '또는' in sentence:
-                            sentence = sentence.split('또는')[0].strip()
-                        elif ',' in sentence:
-                            sentence = sentence.split(',')[0].strip()
-                        elif '그리고' in sentence:
-                            sentence = sentence.split('그리고')[0].strip()
-                        else:
-                            sentence = sentence[:50].strip()
-                    
-                    # 문장이 유효하면 추가
-                    if sentence and len(sentence) >= 2:
-                        # 마지막이 동사형이 아니면 동사형으로 변환 시도
-                        if not sentence.endswith(('다', '하다', '되다', '이다', '되다')):
-                            # "~하는 것" 같은 표현 제거
-                            if sentence.endswith('하는 것'):
-                                sentence = sentence[:-3] + '하다'
-                            elif sentence.endswith('하는'):
-                                sentence = sentence[:-2] + '하다'
-                        
-                        formatted_meanings.append(sentence)
-                
-                if not formatted_meanings:
-                    # 포맷팅 실패 시 원본 사용
-                    formatted_meanings = [korean_meaning]
-                
-                # 최종 결과: "달리다. 작동하다. 운영하다." 형식
-                result = ". ".join(formatted_meanings)
-                
-                # 쉼표나 세미콜론으로 구분된 뜻 필터링 (20글자 초과 제거)
-                result = self._filter_long_meanings(result)
-                
-                # 마지막 마침표 확인
-                if not result.endswith('.'):
-                    result += "."
-                
-                print(f"✅ [DictionaryService] Final meaning: '{result}'")
-                return result
+                    logger.debug("Response data keys: %s", list(data.keys()))
+            except Exception as e:
+                logger.warning("Failed to parse Free Dictionary API JSON for %r: %s (%.500s)", word_clean, e, response.text)
+                return None
+            
+            # 2단계: 영어 정의 추출 (여러 의미 수집)
+            definitions = []
+            
+            if isinstance(data, list) and len(data) > 0:
+                # 첫 번째 항목의 meanings에서 정의 추출
+                word_entry = data[0]
+                logger.debug("Word entry keys: %s", list(word_entry.keys()) if isinstance(word_entry, dict) else "not a dict")
+                meanings = word_entry.get("meanings", [])
+                logger.debug("Found %d meaning group(s)", len(meanings))
                 
+                for idx, meaning in enumerate(meanings):
+                    logger.debug("Meaning group %d: %s", idx + 1, meaning.get("partOfSpeech", "unknown"))
+                    defs = meaning.get("definitions", [])
+                    logger.debug("Found %d definition(s) in this group", len(defs))
+                    for def_item in defs:
+                        definition = def_item.get("definition", "").strip()
+                        if definition:
+                            definitions.append(definition)
+                            logger.debug("Added definition: %.50s", definition)
+            elif isinstance(data, dict):
+                # dict 형태의 오류 응답인 경우 (예: {"title": "No Definitions Found"})
+                error_title = data.get("title", "")
+                error_message = data.get("message", "")
+                logger.debug("Free Dictionary API error response for %r: %s %s", word_clean, error_title, error_message)
+                return None
+            else:
+                logger.warning("Unexpected Free Dictionary API data format for %r: %s", word_clean, type(data).__name__)
+                return None
+            
+            if not definitions:
+                logger.debug("No definitions found in Free Dictionary API for %r", word_clean)
+                return None
+            
+            # 최대 3개의 정의만 사용 (너무 많으면 길어짐)
+            definitions = definitions[:3]
+            logger.debug("Found %d definition(s) for %r", len(definitions), word_clean)
+            return definitions
+            
         except httpx.TimeoutException:
-            print(f"❌ [DictionaryService] Timeout fetching definition for '{word_clean}'")
-            print(f"   🔄 Falling back to DeepL direct translation...")
-            return await self._fallback_to_deepl(word_clean)
+            logger.warning("Timeout fetching definition for %r", word_clean)
+            return None
         except httpx.RequestError as e:
-            print(f"❌ [DictionaryService] Request error for '{word_clean}': {str(e)}")
-            print(f"   🔄 Falling back to DeepL direct translation...")
-            return await self._fallback_to_deepl(word_clean)
+            logger.warning("Request error for %r: %s", word_clean, e)
+            return None
         except json.JSONDecodeError as e:
-            print(f"❌ [DictionaryService] JSON decode error for '{word_clean}': {str(e)}")
-            print(f"   🔄 Falling back to DeepL direct translation...")
-            return await self._fallback_to_deepl(word_clean)
+            logger.warning("JSON decode error for %r: %s", word_clean, e)
+            return None
         except Exception as e:
-            print(f"❌ [DictionaryService] Error processing word '{word_clean}': {str(e)}")
-            import traceback
-            traceback.print_exc()
-            print(f"   🔄 Falling back to DeepL direct translation...")
-            return await self._fallback_to_deepl(word_clean)
+            logger.exception("Error processing word %r: %s", word_clean, e)
+            return None
+    
+    def _format_korean_meaning(self, korean_translation: str) -> str:
+        """번역된 정의를 사전식 뜻 형식("달리다. 작동하다. 운영하다.")으로 정리"""
+        # 5단계: 사전식 형식으로 포맷팅
+        # 번역 결과를 문장 단위로 분리하고 간결하게 정리
+        korean_meaning = korean_translation.strip()
+        
+        # 마침표로 문장 분리
+        sentences = [s.strip() for s in korean_meaning.split('.') if s.strip()]
+        
+        # 각 문장을 간결하게 정리 (불필요한 설명 제거)
+        formatted_meanings = []
+        for sentence in sentences:
+            # 너무 긴 문장은 앞부분만 사용 (50자 제한)
+            if len(sentence) > 50:
+                # 첫 번째 쉼표나 "또는", "그리고" 등으로 분리
+                if '또는' in sentence:
+                    sentence = sentence.split('또는')[0].strip()
+                elif ',' in sentence:
+                    sentence = sentence.split(',')[0].strip()
+                elif '그리고' in sentence:
+                    sentence = sentence.split('그리고')[0].strip()
+                else:
+                    sentence = sentence[:50].strip()
+            
+            # 문장이 유효하면 추가
+            if sentence and len(sentence) >= 2:
+                # 마지막이 동사형이 아니면 동사형으로 변환 시도
+                if not sentence.endswith(('다', '하다', '되다', '이다', '되다')):
+                    # "~하는 것" 같은 표현 제거
+                    if sentence.endswith('하는 것'):
+                        sentence = sentence[:-3] + '하다'
+                    elif sentence.endswith('하는'):
+                        sentence = sentence[:-2] + '하다'
+                
+                formatted_meanings.append(sentence)
+        
+        if not formatted_meanings:
+            # 포맷팅 실패 시 원본 사용
+            formatted_meanings = [korean_meaning]
+        
+        # 최종 결과: "달리다. 작동하다. 운영하다." 형식
+        result = ". ".join(formatted_meanings)
+        
+        # 쉼표나 세미콜론으로 구분된 뜻 필터링 (20글자 초과 제거)
+        result = self._filter_long_meanings(result)
+        
+        # 마지막 마침표 확인
+        if not result.endswith('.'):
+            result += "."
+        
+        return result
     
     def _filter_long_meanings(self, meaning: str) -> str:
         """
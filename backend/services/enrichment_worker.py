@@ -0,0 +1,253 @@
+"""
+단어 뜻 백그라운드 채우기 워커 (write-behind)
+
+/api/study/save는 단어를 뜻 없이 바로 저장하고 meaning_queue에 작업을 넣습니다.
+이 워커가 큐에서 작업을 가져와 DictionaryService로 뜻을 조회하고, 결과를 한 트랜잭션에 모아서 씁니다.
+
+환경 변수:
+    MEANING_ENRICHMENT_ENABLED        워커 사용 여부 (기본값: true)
+    MEANING_ENRICHMENT_BATCH_SIZE     한 번에 가져올 작업 수 (기본값: 20)
+    MEANING_ENRICHMENT_CONCURRENCY    동시에 진행할 사전 조회 수 (기본값: 4)
+    MEANING_ENRICHMENT_POLL_INTERVAL  큐가 비었을 때 다시 확인하는 간격(초) (기본값: 2)
+    MEANING_ENRICHMENT_MAX_ATTEMPTS   포기하기 전 최대 시도 횟수 (기본값: 5)
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import DateTime, bindparam, delete, func, select, text, update
+
+from services.vocabulary_service import MeaningQueueItem, Word
+
+logger = logging.getLogger(__name__)
+
+
+class MeaningEnrichmentWorker:
+    """meaning_queue를 처리해 words.meaning을 채우는 백그라운드 작업"""
+
+    # 작업을 가져간 뒤 이 시간 안에 끝내지 못하면 다른 워커가 다시 가져갈 수 있음
+    CLAIM_LEASE_SECONDS = 120
+
+    def __init__(
+        self,
+        storage_service,
+        dictionary_service,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        self.storage_service = storage_service
+        self.dictionary_service = dictionary_service
+        self.enabled = os.getenv("MEANING_ENRICHMENT_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.batch_size = batch_size or int(os.getenv("MEANING_ENRICHMENT_BATCH_SIZE", "20"))
+        self.concurrency = concurrency or int(os.getenv("MEANING_ENRICHMENT_CONCURRENCY", "4"))
+        self.poll_interval = poll_interval or float(os.getenv("MEANING_ENRICHMENT_POLL_INTERVAL", "2"))
+        self.max_attempts = max_attempts or int(os.getenv("MEANING_ENRICHMENT_MAX_ATTEMPTS", "5"))
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+        # 처리 지표
+        self.processed_count = 0
+        self.filled_count = 0
+        self.failed_count = 0
+        self.batch_count = 0
+        self.last_batch_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """이벤트 루프에서 워커 시작 (앱 lifespan 시작 시 호출)"""
+        if not self.enabled or self.running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """진행 중인 배치를 취소하고 워커 종료 (앱 lifespan 종료 시 호출)"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self):
+        """새 작업이 큐에 들어왔음을 알려 대기 중인 워커를 바로 깨움"""
+        self._wakeup.set()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                handled = await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Meaning enrichment batch failed: %s", e)
+                handled = 0
+
+            if handled == 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _claim_batch(self) -> List[Dict]:
+        """처리할 작업을 가져오고 임대 시간을 걸어 다른 워커와 중복 처리되지 않게 함"""
+        now = datetime.now()
+        async with self.storage_service.async_session() as session:
+            # 큐가 비어 있을 때는 읽기만 하고 끝내서, 유휴 상태의 폴링이 쓰기 잠금을 잡지 않게 함
+            due = await session.execute(
+                select(MeaningQueueItem.id).where(MeaningQueueItem.next_attempt_at <= now).limit(1)
+            )
+            if due.first() is None:
+                return []
+            
+            # 한 문장(UPDATE ... RETURNING)으로 가져와서 여러 프로세스가 동시에 돌아도 안전
+            result = await session.execute(
+                text(
+                    "UPDATE meaning_queue SET next_attempt_at = :lease_until "
+                    "WHERE id IN (SELECT id FROM meaning_queue WHERE next_attempt_at <= :now "
+                    "ORDER BY enqueued_at LIMIT :limit) "
+                    "RETURNING id, word_id, word, attempts"
+                ).bindparams(
+                    bindparam("now", type_=DateTime),
+                    bindparam("lease_until", type_=DateTime),
+                ),
+                {
+                    "now": now,
+                    "lease_until": now + timedelta(seconds=self.CLAIM_LEASE_SECONDS),
+                    "limit": self.batch_size,
+                },
+            )
+            jobs = [dict(row._mapping) for row in result.all()]
+            
+            # 가져온 작업 중 단어가 삭제되었거나 그 사이 뜻이 채워진 것은 처리하지 않고 정리
+            if jobs:
+                pending = await session.execute(
+                    select(Word.id).where(
+                        Word.id.in_([job["word_id"] for job in jobs]),
+                        func.coalesce(Word.meaning, "") == "",
+                    )
+                )
+                pending_ids = set(pending.scalars().all())
+                stale_ids = [job["id"] for job in jobs if job["word_id"] not in pending_ids]
+                if stale_ids:
+                    await session.execute(delete(MeaningQueueItem).where(MeaningQueueItem.id.in_(stale_ids)))
+                jobs = [job for job in jobs if job["word_id"] in pending_ids]
+            await session.commit()
+            return jobs
+
+    async def process_batch(self) -> int:
+        """작업 한 배치 처리. 처리한 작업 수를 반환"""
+        jobs = await self._claim_batch()
+        if not jobs:
+            return 0
+
+        # 1. 사전 조회 (DB 세션 밖에서 동시 진행)
+        #    재시도 작업은 캐시된 '찾지 못함' 결과(negative TTL)를 건너뛰고 다시 조회
+        first_words = [job["word"] for job in jobs if job["attempts"] == 0]
+        retry_words = [job["word"] for job in jobs if job["attempts"] > 0]
+        #    조회가 예외로 실패해도 작업은 임대 상태로 두지 않고, 아래에서 못 찾은 단어와 같이
+        #    attempts + 1 / 백오프 / 포기 처리를 거치게 함
+        meanings: Dict[str, Optional[str]] = {}
+        for words, refresh_misses in ((first_words, False), (retry_words, True)):
+            if not words:
+                continue
+            try:
+                meanings.update(await self.dictionary_service.get_word_meanings(
+                    words, max_concurrency=self.concurrency, refresh_misses=refresh_misses,
+                ))
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Meaning lookup failed for %d queued word(s): %s", len(words), e)
+
+        filled = []
+        retry = []
+        give_up = []
+        for job in jobs:
+            meaning = meanings.get(job["word"].lower().strip())
+            if meaning:
+                filled.append(job)
+            elif job["attempts"] + 1 >= self.max_attempts:
+                give_up.append(job)
+            else:
+                retry.append(job)
+
+        # 2. 결과를 한 트랜잭션으로 기록
+        now = datetime.now()
+        async with self.storage_service.async_session() as session:
+            words_table = Word.__table__
+            if filled:
+                # 사용자가 그 사이 직접 뜻을 입력했다면 덮어쓰지 않음
+                await session.execute(
+                    update(words_table)
+                    .where(
+                        words_table.c.id == bindparam("b_word_id"),
+                        func.coalesce(words_table.c.meaning, "") == "",
+                    )
+                    .values(meaning=bindparam("b_meaning")),
+                    [
+                        {"b_word_id": job["word_id"], "b_meaning": meanings[job["word"].lower().strip()]}
+                        for job in filled
+                    ],
+                )
+            done_ids = [job["id"] for job in filled + give_up]
+            if done_ids:
+                await session.execute(delete(MeaningQueueItem).where(MeaningQueueItem.id.in_(done_ids)))
+            if retry:
+                # 실패한 작업은 지수 백오프 후 다시 시도
+                queue_table = MeaningQueueItem.__table__
+                await session.execute(
+                    update(queue_table)
+                    .where(queue_table.c.id == bindparam("b_id"))
+                    .values(attempts=queue_table.c.attempts + 1, next_attempt_at=bindparam("b_next")),
+                    [
+                        {
+                            "b_id": job["id"],
+                            "b_next": now + timedelta(seconds=self.poll_interval * (2 ** job["attempts"])),
+                        }
+                        for job in retry
+                    ],
+                )
+            await session.commit()
+
+        self.processed_count += len(jobs)
+        self.filled_count += len(filled)
+        self.failed_count += len(give_up)
+        self.batch_count += 1
+        self.last_batch_at = now
+        return len(jobs)
+
+    async def stats(self) -> Dict[str, object]:
+        """큐 길이와 지연 시간 등 워커 상태"""
+        async with self.storage_service.async_session() as session:
+            result = await session.execute(
+                select(func.count(MeaningQueueItem.id), func.min(MeaningQueueItem.enqueued_at))
+            )
+            depth, oldest = result.one()
+
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "queue_depth": depth,
+            "lag_seconds": (datetime.now() - oldest).total_seconds() if oldest else 0.0,
+            "processed": self.processed_count,
+            "filled": self.filled_count,
+            "failed": self.failed_count,
+            "batches": self.batch_count,
+            "last_batch_at": self.last_batch_at.strftime("%Y-%m-%d %H:%M:%S") if self.last_batch_at else None,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,62 @@
+"""
+환경 변수 로딩
+
+backend/api.env(없으면 .env)를 프로세스에서 한 번만 읽어 os.environ에 넣습니다.
+Railway 등 플랫폼에 이미 설정된 환경 변수는 덮어쓰지 않고, 값은 출력하지 않습니다.
+main.py, backend/main.py, TranslationService가 모두 이 함수를 쓰므로 여러 번 호출해도 파일은 한 번만 읽습니다.
+setup_logging(LOG_LEVEL 등을 환경 변수에서 읽음)보다 먼저 실행되므로, 로그 출력은 그때의 root 설정을 따릅니다.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENV_PATH = Path(__file__).resolve().parent.parent / "api.env"
+
+_loaded = False
+
+
+def _parse_env_file(content: str) -> Dict[str, str]:
+    """KEY=VALUE 줄만 읽음 (빈 줄과 '#' 주석은 무시)"""
+    values = {}
+    for line in content.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        if key.strip():
+            values[key.strip()] = value.strip()
+    return values
+
+
+def load_env(env_path: Optional[Path] = None) -> bool:
+    """
+    api.env를 읽어 아직 설정되지 않은 환경 변수만 채움 (두 번째 호출부터는 아무것도 하지 않음)
+
+    Returns:
+        DEEPL_API_KEY가 설정되어 있는지 여부
+    """
+    global _loaded
+    if not _loaded:
+        _loaded = True
+        path = Path(env_path) if env_path else DEFAULT_ENV_PATH
+        if path.exists():
+            try:
+                # utf-8-sig: 메모장 등에서 저장한 BOM 포함 파일도 처리
+                values = _parse_env_file(path.read_text(encoding='utf-8-sig'))
+                applied = [key for key in values if not os.getenv(key)]
+                for key in applied:
+                    os.environ[key] = values[key]
+                logger.info("Loaded %d of %d variables from %s", len(applied), len(values), path.name)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning("Error reading env file %s: %s", path, e)
+        else:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+
+        if not os.getenv('DEEPL_API_KEY'):
+            logger.warning("DEEPL_API_KEY is not set. Please set it in the environment or backend/api.env")
+    return bool(os.getenv('DEEPL_API_KEY'))
@@ -0,0 +1,121 @@
+"""
+주제 키워드 다중 패턴 매칭 (단어 단위 Aho-Corasick)
+
+키워드 그룹 전체를 한 번만 오토마톤으로 만들어 두고, 텍스트를 한 번 훑어서 모든 주제의 점수를 계산합니다.
+텍스트를 영숫자 토큰으로 나눈 뒤 토큰 단위로 매칭하므로 단어 중간에서는 매칭되지 않습니다
+('ai'가 "certain"에, 'art'가 "part"에 걸리지 않음). 여러 단어로 된 키워드('machine learning')도 지원합니다.
+마지막 단어의 복수형(-s, -es, -y -> -ies)은 같은 키워드로 봅니다 ('cell' -> "cells").
+"""
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _plural_variants(tokens: List[str]) -> Iterable[List[str]]:
+    """키워드 토큰과 마지막 단어의 복수형 변형"""
+    yield tokens
+    *head, last = tokens
+    if last.endswith("s"):
+        return
+    yield head + [last + "s"]
+    yield head + [last + "es"]
+    if last.endswith("y") and len(last) > 1 and last[-2] not in "aeiou":
+        yield head + [last[:-1] + "ies"]
+
+
+class KeywordMatcher:
+    """주제별 키워드 목록을 토큰 단위 Aho-Corasick 오토마톤으로 컴파일"""
+
+    def __init__(self, keyword_groups: Dict[str, List[str]]):
+        """
+        Args:
+            keyword_groups: 주제 -> 키워드 목록
+        """
+        self.group_sizes = {topic: len(keywords) for topic, keywords in keyword_groups.items()}
+        self.keywords: List[Tuple[str, str]] = []  # 키워드 번호 -> (주제, 키워드)
+
+        # 노드마다 토큰 -> 다음 노드, 실패 링크, 이 노드에서 끝나는 키워드 번호
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for topic, keywords in keyword_groups.items():
+            for keyword in keywords:
+                tokens = TOKEN_RE.findall(keyword.lower())
+                if not tokens:
+                    continue
+                keyword_id = len(self.keywords)
+                self.keywords.append((topic, keyword))
+                for variant in _plural_variants(tokens):
+                    self._insert(variant, keyword_id)
+
+        self._build_failure_links()
+
+    def _insert(self, tokens: List[str], keyword_id: int):
+        node = 0
+        for token in tokens:
+            next_node = self._goto[node].get(token)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = next_node
+        if keyword_id not in self._out[node]:
+            self._out[node] += (keyword_id,)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크를 만들고, 실패 링크를 따라 도달하는 키워드를 출력에 합침"""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for token, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += tuple(k for k in self._out[self._fail[child]] if k not in self._out[child])
+                queue.append(child)
+
+    def find(self, text: str) -> Set[int]:
+        """텍스트에 나온 키워드 번호 집합"""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        matched: Set[int] = set()
+        node = 0
+        for token in TOKEN_RE.findall(text.lower()):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if out[node]:
+                matched.update(out[node])
+        return matched
+
+    def matched_keywords(self, text: str) -> Dict[str, List[str]]:
+        """주제별로 텍스트에 나온 키워드 (디버깅용)"""
+        result: Dict[str, List[str]] = {topic: [] for topic in self.group_sizes}
+        for keyword_id in sorted(self.find(text)):
+            topic, keyword = self.keywords[keyword_id]
+            result[topic].append(keyword)
+        return result
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """주제별로 텍스트에 나온 서로 다른 키워드 수"""
+        counts = dict.fromkeys(self.group_sizes, 0)
+        for keyword_id in self.find(text):
+            counts[self.keywords[keyword_id][0]] += 1
+        return counts
+
+    def normalize(self, counts: Dict[str, int]) -> Dict[str, float]:
+        """키워드 수를 주제별 키워드 개수로 나누어 0~1 사이로 정규화"""
+        return {
+            topic: counts[topic] / size if size else 0
+            for topic, size in self.group_sizes.items()
+        }
+
+    def score(self, text: str) -> Dict[str, float]:
+        """주제별 점수 = 텍스트에 나온 서로 다른 키워드 수 / 그 주제의 키워드 수"""
+        return self.normalize(self.counts(text))
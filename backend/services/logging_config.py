@@ -0,0 +1,110 @@
+"""
+구조화 로깅 (레벨, 요청 ID, DEBUG 샘플링, 비동기 출력)
+
+서비스 코드는 print 대신 logging.getLogger(__name__)을 사용합니다.
+로그 레코드는 QueueHandler로 큐에 넣기만 하고 실제 출력(stdout)은 별도 스레드의 QueueListener가 하므로,
+stdout이나 로그 수집기가 느려도 요청 처리가 막히지 않습니다.
+요청마다 request_id(X-Request-ID 헤더 또는 새로 생성)가 모든 로그에 붙고, 응답 헤더로도 돌려줍니다.
+DEBUG 로그는 요청 단위로 샘플링해서 한 요청의 로그는 모두 남기거나 모두 버립니다.
+LOG_LEVEL=INFO(기본값)에서는 logger.debug 호출이 레벨 확인만 하고 바로 끝나므로 비용이 거의 없습니다.
+
+환경 변수:
+    LOG_LEVEL              로그 레벨 (기본값: INFO)
+    LOG_FORMAT             text 또는 json (기본값: text)
+    LOG_DEBUG_SAMPLE_RATE  LOG_LEVEL=DEBUG일 때 DEBUG 로그를 남길 요청 비율 (기본값: 1.0, 예: 0.01 = 1%)
+"""
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from typing import Optional
+
+request_id_var: contextvars.ContextVar = contextvars.ContextVar("request_id", default="-")
+# 요청 밖(백그라운드 워커 등)에서는 샘플링하지 않음
+_debug_sampled_var: contextvars.ContextVar = contextvars.ContextVar("debug_sampled", default=True)
+
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+# LogRecord 기본 속성 (이 밖의 속성은 extra={...}로 넘긴 필드로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_debug_sample_rate = 1.0
+
+
+class RequestContextFilter(logging.Filter):
+    """request_id를 붙이고, 샘플링되지 않은 요청의 DEBUG 로그는 버림 (로그를 남기는 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return record.levelno > logging.DEBUG or _debug_sampled_var.get()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 하나 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging():
+    """루트 로거를 큐 기반 핸들러로 설정 (여러 번 호출해도 한 번만 설정)"""
+    global _listener, _debug_sample_rate
+    if _listener is not None:
+        return
+
+    level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    _debug_sample_rate = min(1.0, max(0.0, float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))))
+
+    output = logging.StreamHandler(sys.stdout)
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def begin_request(incoming_id: Optional[str] = None) -> str:
+    """요청 시작 시 request_id와 DEBUG 샘플링 여부 설정 (HTTP 미들웨어에서 호출)"""
+    request_id = incoming_id if incoming_id and _REQUEST_ID_RE.match(incoming_id) else uuid.uuid4().hex[:16]
+    request_id_var.set(request_id)
+    _debug_sampled_var.set(_debug_sample_rate >= 1.0 or random.random() < _debug_sample_rate)
+    return request_id
@@ -0,0 +1,188 @@
+"""
+Prometheus 지표 (GET /metrics)
+
+라우트별 요청 수/지연 시간, 서비스 단계별 지연 시간, 진행 중인 요청/작업 수, 캐시 적중률을 모읍니다.
+단계 이름 (myling_stage_duration_seconds의 stage 라벨):
+    upload_io        업로드 파일 읽기/저장
+    ocr              OCRService.extract_text 전체
+    pdf_parse        pdfplumber로 PDF 단어 추출 + 문단 구성
+    image_ocr        Tesseract 이미지 OCR
+    paragraph_split  TranslationService.split_into_paragraphs
+    translate        TranslationService.translate / translate_batch (DeepL)
+    dictionary       DictionaryService.get_word_meaning
+    dictionary_batch DictionaryService.get_word_meanings
+    classify         주제 분류 (classify_batch / classify_many_async)
+    db_query         SQL 문 하나 실행 (SQLAlchemy 엔진 이벤트)
+
+prometheus_client가 설치되어 있지 않으면 모든 함수가 아무것도 하지 않습니다.
+uvicorn 워커를 여러 개 띄우면 지표는 워커별로 따로 집계됩니다.
+"""
+import functools
+import importlib.util
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+PROMETHEUS_AVAILABLE = importlib.util.find_spec("prometheus_client") is not None
+
+# 5ms ~ 60s (DeepL/사전 API/OCR까지 한 버킷 체계로)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 스크레이프할 때 값을 읽어 오는 지표: 캐시 이름 -> stats() 함수, 게이지 이름 -> (설명, 값 함수)
+_cache_sources: Dict[str, Callable[[], Dict]] = {}
+_gauge_sources: Dict[str, Tuple[str, Callable[[], float]]] = {}
+
+if PROMETHEUS_AVAILABLE:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+    HTTP_REQUESTS = Counter(
+        "myling_http_requests_total", "HTTP requests", ["method", "route", "status"]
+    )
+    HTTP_LATENCY = Histogram(
+        "myling_http_request_duration_seconds", "HTTP request latency", ["method", "route"],
+        buckets=LATENCY_BUCKETS,
+    )
+    HTTP_IN_FLIGHT = Gauge("myling_http_requests_in_flight", "HTTP requests currently being processed")
+    STAGE_LATENCY = Histogram(
+        "myling_stage_duration_seconds", "Latency of service stages", ["stage"], buckets=LATENCY_BUCKETS
+    )
+    STAGE_ERRORS = Counter("myling_stage_errors_total", "Service stages that raised", ["stage"])
+    STAGE_IN_FLIGHT = Gauge("myling_stage_in_flight", "Service stages currently running", ["stage"])
+
+    class _ScrapeTimeCollector:
+        """캐시 적중/실패 수와 큐 길이 등을 스크레이프할 때 서비스의 stats()에서 읽어 옴"""
+
+        def collect(self):
+            hits = CounterMetricFamily("myling_cache_hits", "Cache hits", labels=["cache"])
+            misses = CounterMetricFamily("myling_cache_misses", "Cache misses", labels=["cache"])
+            ratio = GaugeMetricFamily("myling_cache_hit_ratio", "Cache hit ratio since start", labels=["cache"])
+            for name, stats_fn in list(_cache_sources.items()):
+                try:
+                    stats = stats_fn()
+                except Exception:
+                    continue
+                cache_hits = stats.get("hits", 0)
+                cache_misses = stats.get("misses", 0)
+                lookups = cache_hits + cache_misses
+                hits.add_metric([name], cache_hits)
+                misses.add_metric([name], cache_misses)
+                ratio.add_metric([name], cache_hits / lookups if lookups else 0.0)
+            yield hits
+            yield misses
+            yield ratio
+
+            for name, (documentation, value_fn) in list(_gauge_sources.items()):
+                try:
+                    value = float(value_fn())
+                except Exception:
+                    continue
+                yield GaugeMetricFamily(name, documentation, value=value)
+
+    REGISTRY.register(_ScrapeTimeCollector())
+
+
+def register_cache(name: str, stats_fn: Callable[[], Dict]):
+    """캐시 지표 등록 (stats_fn은 hits, misses 키가 있는 dict를 반환)"""
+    _cache_sources[name] = stats_fn
+
+
+def register_gauge(name: str, documentation: str, value_fn: Callable[[], float]):
+    """스크레이프할 때 value_fn()으로 값을 읽는 게이지 등록 (큐 길이, 진행 중인 조회 수 등)"""
+    _gauge_sources[name] = (documentation, value_fn)
+
+
+@contextmanager
+def track_stage(stage: str):
+    """with 블록 실행 시간을 stage 히스토그램에 기록"""
+    if not PROMETHEUS_AVAILABLE:
+        yield
+        return
+    STAGE_IN_FLIGHT.labels(stage).inc()
+    started_at = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        STAGE_LATENCY.labels(stage).observe(time.perf_counter() - started_at)
+        STAGE_IN_FLIGHT.labels(stage).dec()
+
+
+def timed_stage(stage: str):
+    """함수(동기/async) 실행 시간을 stage 히스토그램에 기록하는 데코레이터"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with track_stage(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track_stage(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_engine(engine):
+    """SQL 문 실행 시간을 db_query 단계로 기록 (AsyncEngine이면 sync_engine에 이벤트 연결)"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_started", []).append(time.perf_counter())
+        STAGE_IN_FLIGHT.labels("db_query").inc()
+
+    def _finish(conn, failed: bool):
+        started = conn.info.get("metrics_query_started")
+        if not started:
+            return
+        STAGE_LATENCY.labels("db_query").observe(time.perf_counter() - started.pop())
+        STAGE_IN_FLIGHT.labels("db_query").dec()
+        if failed:
+            STAGE_ERRORS.labels("db_query").inc()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn, failed=False)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(context):
+        if context.connection is not None:
+            _finish(context.connection, failed=True)
+
+
+async def track_request(request, call_next):
+    """HTTP 미들웨어: 라우트 템플릿(/api/dictionary/{word}) 단위로 요청 수와 지연 시간 기록"""
+    if not PROMETHEUS_AVAILABLE:
+        return await call_next(request)
+    HTTP_IN_FLIGHT.inc()
+    started_at = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # 실제 경로 대신 라우트 템플릿을 라벨로 써서 단어/ID마다 시계열이 생기지 않게 함
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", None) or "unmatched"
+        HTTP_LATENCY.labels(request.method, route_path).observe(time.perf_counter() - started_at)
+        HTTP_REQUESTS.labels(request.method, route_path, str(status)).inc()
+        HTTP_IN_FLIGHT.dec()
+
+
+def render() -> Optional[Tuple[bytes, str]]:
+    """/metrics 응답 본문과 Content-Type (prometheus_client가 없으면 None)"""
+    if not PROMETHEUS_AVAILABLE:
+        return None
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
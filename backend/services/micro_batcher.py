@@ -0,0 +1,161 @@
+"""
+동적 마이크로 배치 추론 워커
+
+동시에 들어온 요청을 최대 max_batch_size개까지, 최대 max_wait_ms 동안 모아서
+전용 스레드 하나에서 한 번에 처리합니다. CPU를 많이 쓰는 모델 추론이 이벤트 루프를 막지 않고,
+요청이 몰릴수록 배치가 커져서 처리량이 늘어납니다.
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """submit()으로 들어온 항목을 모아 handler(items) -> results를 전용 스레드에서 실행"""
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        name: str = "inference",
+    ):
+        """
+        Args:
+            handler: 항목 리스트를 받아 같은 순서의 결과 리스트를 반환하는 블로킹 함수
+            max_batch_size: 한 번에 처리할 최대 항목 수
+            max_wait_ms: 첫 항목이 들어온 뒤 배치를 채우려고 기다리는 최대 시간(ms)
+            name: 워커 스레드 이름
+        """
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+
+        # 모델 추론은 항상 같은 스레드 하나에서 순서대로 실행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._pending: Deque[Tuple[Any, asyncio.Future, float]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._last_batch_size = 0
+
+        self.batch_count = 0
+        self.item_count = 0
+        self.largest_batch = 0
+        self.total_queue_wait = 0.0
+        self.total_inference_time = 0.0
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, item: Any) -> Any:
+        """항목 하나를 배치에 넣고 결과를 기다림"""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future, time.perf_counter()))
+        self._wakeup.set()
+        return await future
+
+    async def submit_batch(self, items: List[Any]) -> List[Any]:
+        """
+        이미 모아 둔 항목들을 (max_batch_size와 상관없이) handler 한 번으로 실행.
+        submit()으로 들어온 배치와 같은 전용 스레드에서 순서대로 실행됩니다.
+        """
+        if not items:
+            return []
+        started_at = time.perf_counter()
+        results = await asyncio.get_running_loop().run_in_executor(self._executor, self.handler, list(items))
+        self.batch_count += 1
+        self.item_count += len(items)
+        self.largest_batch = max(self.largest_batch, len(items))
+        self.total_inference_time += time.perf_counter() - started_at
+        return results
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future, float]]:
+        """
+        첫 항목이 들어오면 배치가 차거나 max_wait가 지날 때까지 더 모음.
+        직전 배치가 한 건뿐이었고 대기 중인 항목도 하나면 부하가 없는 것으로 보고 기다리지 않음
+        """
+        loop = asyncio.get_running_loop()
+        while not self._pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        wait = self.max_wait if self._last_batch_size > 1 or len(self._pending) > 1 else 0.0
+        deadline = loop.time() + wait
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+
+        batch = []
+        while self._pending and len(batch) < self.max_batch_size:
+            entry = self._pending.popleft()
+            # 기다리던 요청이 취소되었으면 건너뜀
+            if not entry[1].done():
+                batch.append(entry)
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self._executor, self.handler, [item for item, _, _ in batch])
+                for (_, future, _), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finished_at = time.perf_counter()
+            self._last_batch_size = len(batch)
+
+            self.batch_count += 1
+            self.item_count += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.total_queue_wait += sum(started_at - enqueued_at for _, _, enqueued_at in batch)
+            self.total_inference_time += finished_at - started_at
+
+    async def aclose(self):
+        """워커 종료 (앱 lifespan 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for _, future, _ in self._pending:
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_depth": len(self._pending),
+            "batches": self.batch_count,
+            "items": self.item_count,
+            "avg_batch_size": round(self.item_count / self.batch_count, 2) if self.batch_count else 0.0,
+            "largest_batch": self.largest_batch,
+            "avg_queue_wait_ms": round(self.total_queue_wait / self.item_count * 1000, 2) if self.item_count else 0.0,
+            "avg_inference_ms": round(self.total_inference_time / self.batch_count * 1000, 2) if self.batch_count else 0.0,
+        }
@@ -1,11 +1,15 @@
-import pytesseract  # type: ignore
-import pdfplumber  # type: ignore
-from PIL import Image  # type: ignore
 import os
+import logging
 import re
 from statistics import median
 from typing import Dict, List, Tuple
-from pytesseract import Output  # type: ignore
+
+from services.metrics import timed_stage
+from services.tracing import set_attributes, traced
+
+logger = logging.getLogger(__name__)
+
+# pdfplumber/pytesseract/PIL은 import가 무거워서 서버 시작 시가 아니라 처음 PDF/이미지를 처리할 때 불러옴
 
 class OCRService:
     def __init__(self):
@@ -13,15 +17,20 @@ class OCRService:
         # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
         pass
     
+    @traced()
+    @timed_stage("ocr")
     async def extract_text(self, file_path: str, content_type: str) -> str:
         """파일에서 텍스트 추출"""
+        set_attributes({"ocr.content_type": content_type, "ocr.file_bytes": os.path.getsize(file_path)})
         try:
             if content_type == "application/pdf" or file_path.endswith(".pdf"):
-                return await self._extract_from_pdf(file_path)
+                text = await self._extract_from_pdf(file_path)
             elif content_type.startswith("image/") or any(file_path.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".gif", ".bmp"]):
-                return await self._extract_from_image(file_path)
+                text = await self._extract_from_image(file_path)
             else:
                 raise ValueError(f"Unsupported file type: {content_type}")
+            set_attributes({"ocr.chars": len(text)})
+            return text
         except Exception as e:
             raise Exception(f"OCR extraction failed: {str(e)}")
     
@@ -29,24 +38,30 @@ class OCRService:
         """PDF에서 텍스트 추출 (pdfplumber 방식)"""
         return await self._extract_from_pdf_fallback(file_path)
     
+    @traced()
+    @timed_stage("pdf_parse")
     async def _extract_from_pdf_fallback(self, file_path: str) -> str:
         """PDF에서 텍스트 추출 (기존 pdfplumber 방식 - Fallback)"""
+        import pdfplumber  # type: ignore
+        
         paragraphs: List[str] = []
         try:
             with pdfplumber.open(file_path) as pdf:
-                print(f"PDF has {len(pdf.pages)} pages")
+                logger.debug("PDF has %d pages", len(pdf.pages))
+                set_attributes({"pdf.pages": len(pdf.pages)})
                 for i, page in enumerate(pdf.pages):
                     words = page.extract_words(use_text_flow=True, keep_blank_chars=False)
                     if not words:
-                        print(f"Page {i+1} has no extractable text")
+                        logger.debug("Page %d has no extractable text", i + 1)
                         continue
                     lines = self._group_words_into_lines(words)
                     page_paragraphs = self._lines_to_paragraphs(lines)
                     paragraphs.extend(page_paragraphs)
         except Exception as e:
-            print(f"PDF text extraction failed: {e}")
+            logger.warning("PDF text extraction failed: %s", e)
             raise Exception(f"PDF에서 텍스트를 추출할 수 없습니다: {str(e)}")
         
+        set_attributes({"pdf.paragraphs": len(paragraphs)})
         if not paragraphs:
             raise Exception("PDF에서 텍스트를 추출할 수 없습니다. PDF가 텍스트 레이어를 포함하고 있는지 확인해주세요.")
         
@@ -56,8 +71,14 @@ class OCRService:
         """이미지에서 OCR로 텍스트 추출 (Tesseract 방식)"""
         return await self._extract_from_image_fallback(file_path)
     
+    @traced()
+    @timed_stage("image_ocr")
     async def _extract_from_image_fallback(self, file_path: str) -> str:
         """이미지에서 OCR로 텍스트 추출 (기존 Tesseract 방식 - Fallback)"""
+        import pytesseract  # type: ignore
+        from PIL import Image  # type: ignore
+        from pytesseract import Output  # type: ignore
+        
         try:
             # Tesseract가 설치되어 있는지 확인
             try:
@@ -83,6 +104,12 @@ class OCRService:
             data = pytesseract.image_to_data(image, lang='eng', output_type=Output.DICT)
             lines = self._group_ocr_boxes_into_lines(data)
             paragraphs = self._lines_to_paragraphs(lines)
+            set_attributes({
+                "image.width": image.width,
+                "image.height": image.height,
+                "ocr.boxes": len(data.get("text", [])),
+                "ocr.paragraphs": len(paragraphs),
+            })
             if not paragraphs:
                 # fallback
                 text = pytesseract.image_to_string(image, lang='eng')
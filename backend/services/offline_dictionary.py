@@ -0,0 +1,159 @@
+"""
+오프라인 영한 사전 (메모리 맵 인덱스)
+
+자주 나오는 시험 어휘는 외부 API 대신 로컬 인덱스 파일에서 바로 찾습니다.
+파일은 mmap으로 열기 때문에 시작 비용이 거의 없고, 여러 워커 프로세스가 같은 페이지 캐시를 공유합니다.
+
+인덱스 파일 형식 (리틀 엔디언):
+    헤더     MAGIC(8바이트) | 항목 수 N (uint32) | 예약 (uint32)
+    오프셋   (N + 1)개의 uint32 - 데이터 영역 시작 기준 각 항목의 시작 위치
+    데이터   항목마다 "단어\\0뜻" (UTF-8), 단어 바이트 기준으로 정렬
+
+인덱스는 scripts/build_offline_dictionary.py로 단어 목록에서 생성합니다.
+
+환경 변수:
+    OFFLINE_DICTIONARY_PATH  인덱스 파일 경로 (기본값: backend/data/en_ko.mldx)
+"""
+import mmap
+import logging
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MLDICT01"
+HEADER = struct.Struct("<8sII")
+OFFSET = struct.Struct("<I")
+SEPARATOR = b"\x00"
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "en_ko.mldx"
+
+
+def build_index(entries: Iterable[Tuple[str, str]], output_path) -> int:
+    """
+    (단어, 뜻) 목록으로 인덱스 파일을 생성합니다.
+    단어는 소문자로 정규화하고, 같은 단어가 여러 번 나오면 처음 나온 뜻을 사용합니다.
+
+    Returns:
+        저장된 항목 수
+    """
+    merged: Dict[bytes, bytes] = {}
+    for word, meaning in entries:
+        key = word.lower().strip().encode("utf-8")
+        value = meaning.strip().encode("utf-8")
+        if not key or not value or SEPARATOR in key or key in merged:
+            continue
+        merged[key] = value
+
+    keys = sorted(merged)
+    offsets = []
+    data = bytearray()
+    for key in keys:
+        offsets.append(len(data))
+        data += key + SEPARATOR + merged[key]
+    offsets.append(len(data))
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys), 0))
+        for offset in offsets:
+            f.write(OFFSET.pack(offset))
+        f.write(data)
+    # 서비스가 읽는 중에도 안전하게 교체
+    os.replace(tmp_path, output_path)
+    return len(keys)
+
+
+class OfflineDictionary:
+    """정렬된 키 + 오프셋 인덱스를 이진 탐색하는 읽기 전용 사전"""
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.getenv("OFFLINE_DICTIONARY_PATH") or DEFAULT_PATH)
+        self._mmap: Optional[mmap.mmap] = None
+        self._count = 0
+        self._data_start = 0
+        self._opened = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _open(self) -> bool:
+        """처음 조회할 때 파일을 mmap으로 열기 (없으면 사용하지 않음)"""
+        if self._opened:
+            return self._mmap is not None
+        with self._lock:
+            if self._opened:
+                return self._mmap is not None
+            self._opened = True
+            if not self.path.exists():
+                return False
+            try:
+                with open(self.path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, count, _ = HEADER.unpack_from(mapped, 0)
+                if magic != MAGIC:
+                    logger.warning("Offline dictionary %s has an unknown format, skipping", self.path)
+                    mapped.close()
+                    return False
+                self._count = count
+                self._data_start = HEADER.size + (count + 1) * OFFSET.size
+                self._mmap = mapped
+                logger.info("Offline dictionary loaded: %s (%d words)", self.path, count)
+                return True
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning("Failed to open offline dictionary %s: %s", self.path, e)
+                return False
+
+    @property
+    def available(self) -> bool:
+        return self._open()
+
+    def __len__(self) -> int:
+        return self._count if self._open() else 0
+
+    def _entry(self, index: int) -> Tuple[bytes, int, int]:
+        """index번째 항목의 (단어, 뜻 시작, 뜻 끝) 반환"""
+        start = OFFSET.unpack_from(self._mmap, HEADER.size + index * OFFSET.size)[0] + self._data_start
+        end = OFFSET.unpack_from(self._mmap, HEADER.size + (index + 1) * OFFSET.size)[0] + self._data_start
+        separator = self._mmap.find(SEPARATOR, start, end)
+        return self._mmap[start:separator], separator + 1, end
+
+    def lookup(self, word: str) -> Optional[str]:
+        """단어 뜻 조회 (없으면 None)"""
+        if not word or not self._open():
+            return None
+        key = word.lower().strip().encode("utf-8")
+
+        low, high = 0, self._count - 1
+        while low <= high:
+            mid = (low + high) // 2
+            entry_key, value_start, value_end = self._entry(mid)
+            if entry_key == key:
+                self.hits += 1
+                return self._mmap[value_start:value_end].decode("utf-8")
+            if entry_key < key:
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        self.misses += 1
+        return None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": str(self.path),
+            "available": self._mmap is not None,
+            "words": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,107 @@
+"""
+int8 양자화 ONNX 모델로 돌리는 zero-shot 분류기 (PyTorch 없이 onnxruntime만 사용)
+
+transformers의 zero-shot-classification 파이프라인과 같은 방식으로 동작합니다.
+지문(premise)과 라벨마다 만든 가설("This example is {label}.")을 NLI 모델에 넣고,
+라벨별 entailment 로짓에 softmax를 적용해 점수를 냅니다.
+호출 형식과 반환 형식도 파이프라인과 같아서 TopicClassificationService에서 그대로 바꿔 쓸 수 있습니다.
+
+모델 디렉토리는 scripts/export_topic_model_onnx.py로 만듭니다.
+    model_quantized.onnx   int8 동적 양자화 모델
+    config.json            label2id (entailment 라벨 번호 확인용)
+    tokenizer 파일들
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+DEFAULT_MODEL_FILE = "model_quantized.onnx"
+
+
+class OnnxZeroShotClassifier:
+    """onnxruntime 기반 zero-shot 분류 (transformers 파이프라인 호환 호출)"""
+
+    def __init__(self, model_dir, model_file: str = DEFAULT_MODEL_FILE, max_length: int = 512,
+                 intra_op_threads: int = 0):
+        """
+        Args:
+            model_dir: ONNX 모델, config.json, 토크나이저가 있는 디렉토리
+            model_file: 디렉토리 안의 ONNX 파일 이름
+            max_length: 지문+가설 최대 토큰 수 (넘으면 지문을 자름)
+            intra_op_threads: onnxruntime 연산 스레드 수 (0이면 onnxruntime 기본값)
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_dir = Path(model_dir)
+        model_path = model_dir / model_file
+        if not model_path.exists():
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        self.max_length = max_length
+
+        with open(model_dir / "config.json", encoding="utf-8") as f:
+            config = json.load(f)
+        label2id = {label.lower(): int(idx) for label, idx in config.get("label2id", {}).items()}
+        entailment = [idx for label, idx in label2id.items() if label.startswith("entail")]
+        if not entailment:
+            raise ValueError(f"No entailment label in {model_dir / 'config.json'}: {label2id}")
+        self.entailment_id = entailment[0]
+
+    def _entailment_logits(self, premises: List[str], hypotheses: List[str]) -> np.ndarray:
+        encoded = self.tokenizer(
+            premises,
+            hypotheses,
+            padding=True,
+            truncation="only_first",
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names if name in encoded}
+        logits = self.session.run(None, feeds)[0]
+        return logits[:, self.entailment_id]
+
+    def __call__(
+        self,
+        sequences: Union[str, List[str]],
+        candidate_labels: List[str],
+        hypothesis_template: str = "This example is {}.",
+        batch_size: int = 1,
+    ) -> Union[Dict, List[Dict]]:
+        """
+        Returns:
+            파이프라인과 같은 형식 {"sequence", "labels", "scores"} (점수 내림차순).
+            sequences가 리스트면 결과도 리스트
+        """
+        single = isinstance(sequences, str)
+        texts = [sequences] if single else list(sequences)
+        hypotheses = [hypothesis_template.format(label) for label in candidate_labels]
+        num_labels = len(candidate_labels)
+
+        # 지문 batch_size개씩, 지문 x 라벨 쌍을 한 번의 run으로 처리
+        step = max(1, batch_size)
+        results = []
+        for start in range(0, len(texts), step):
+            chunk = texts[start:start + step]
+            premises = [text for text in chunk for _ in candidate_labels]
+            logits = self._entailment_logits(premises, hypotheses * len(chunk)).reshape(len(chunk), num_labels)
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+            for text, row in zip(chunk, probs):
+                order = np.argsort(-row)
+                results.append({
+                    "sequence": text,
+                    "labels": [candidate_labels[i] for i in order],
+                    "scores": [float(row[i]) for i in order],
+                })
+        return results[0] if single else results
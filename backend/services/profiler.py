@@ -0,0 +1,221 @@
+"""
+요청 단위 샘플링 프로파일러 (speedscope JSON)
+
+특정 PDF/지문에서만 느린 원인을 운영 환경의 실제 입력으로 확인하기 위한 옵트인 프로파일러입니다.
+PROFILING_TOKEN이 설정되어 있고 요청에 같은 토큰이 있을 때만 동작하며, 그 외 요청에는 비용이 없습니다.
+    X-Profile-Token: <토큰>  헤더 또는 ?profile=<토큰> 쿼리
+
+프로파일링 중에는 별도 스레드가 PROFILING_INTERVAL_MS마다 sys._current_frames()로 모든 스레드의 호출 스택을 모읍니다.
+DeepL 번역(asyncio.to_thread)과 주제 분류(MicroBatcher 스레드)는 이벤트 루프가 아닌 스레드에서 실행되므로
+스레드별 프로파일로 따로 보입니다. OCR(pdfplumber/Tesseract)은 이벤트 루프에서 동기로 실행되므로
+이벤트 루프 스레드 프로파일 안에 보입니다. 일감을 기다리는 유휴 워커 스레드의 샘플은 버립니다.
+프로세스 전체를 샘플링하므로 동시에 처리 중인 다른 요청의 스택도 섞일 수 있고, 한 번에 한 요청만 프로파일링합니다.
+주제 분류가 사이드카(TOPIC_SIDECAR_SOCKET)에서 실행되면 이 프로세스에서는 소켓 대기만 보입니다.
+
+결과는 PROFILING_DIR/<profile_id>.speedscope.json에 저장되고 X-Profile-Id 응답 헤더로 ID를 알려 줍니다.
+GET /api/debug/profiles/{profile_id} (같은 토큰 필요)로 받아 https://www.speedscope.app 에서 열면 됩니다.
+X-Profile-Output: inline 헤더나 ?profile_output=inline을 주면 원래 응답 대신 프로파일 JSON을 바로 돌려줍니다.
+
+환경 변수:
+    PROFILING_TOKEN        설정하면 프로파일링 활성화 (기본값: 비활성화)
+    PROFILING_INTERVAL_MS  샘플링 간격 (기본값: 5)
+    PROFILING_MAX_SECONDS  한 요청을 최대 몇 초까지 샘플링할지 (기본값: 120)
+    PROFILING_DIR          프로파일 저장 디렉토리 (기본값: backend/profiles)
+    PROFILING_KEEP         보관할 프로파일 개수, 오래된 것부터 삭제 (기본값: 50)
+"""
+import asyncio
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from services.logging_config import request_id_var
+
+logger = logging.getLogger(__name__)
+
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_MAX_SECONDS = float(os.getenv("PROFILING_MAX_SECONDS", "120"))
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", str(Path(__file__).resolve().parent.parent / "profiles")))
+PROFILING_KEEP = int(os.getenv("PROFILING_KEEP", "50"))
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+PROFILE_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,100}$")
+
+# 일감을 기다리는 스레드의 대기 지점 (threading.py/queue.py 프레임을 건너뛴 뒤의 (파일명, 함수명))
+IDLE_WAITS = {
+    ("thread.py", "_worker"),       # ThreadPoolExecutor 유휴 워커 (asyncio.to_thread, MicroBatcher)
+    ("handlers.py", "dequeue"),     # 로그 QueueListener
+    ("handlers.py", "_monitor"),
+    ("_asyncio.py", "run"),         # anyio 워커 스레드
+    ("core.py", "_connection_worker_thread"),  # aiosqlite 연결 스레드
+}
+_WAIT_MODULES = ("threading.py", "queue.py")
+
+# 한 번에 한 요청만 프로파일링
+_active_lock = threading.Lock()
+
+
+def _is_idle(frame) -> bool:
+    """스레드가 새 일감을 기다리는 중이면 True (락 대기 등 실제 코드 안의 대기는 False)"""
+    while frame is not None and os.path.basename(frame.f_code.co_filename) in _WAIT_MODULES:
+        frame = frame.f_back
+    return frame is not None and (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_WAITS
+
+
+class SamplingProfiler:
+    """별도 스레드에서 모든 스레드의 스택을 주기적으로 샘플링해 speedscope 형식으로 정리"""
+
+    def __init__(self, interval_ms: float = PROFILING_INTERVAL_MS, max_seconds: float = PROFILING_MAX_SECONDS):
+        self.interval = max(interval_ms, 1.0) / 1000
+        self.max_seconds = max_seconds
+        self._frames: List[Dict] = []
+        self._frame_index: Dict[Tuple[str, int, str], int] = {}
+        # 스레드 ID -> (샘플 스택 목록, 샘플 가중치(ms) 목록)
+        self._samples: Dict[int, Tuple[List[List[int]], List[float]]] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = 0.0
+        self.duration_ms = 0.0
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration_ms = (time.perf_counter() - self.started_at) * 1000
+
+    def _code_index(self, code) -> int:
+        name = getattr(code, "co_qualname", code.co_name)
+        key = (code.co_filename, code.co_firstlineno, name)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = len(self._frames)
+            self._frame_index[key] = index
+            self._frames.append({"name": name, "file": code.co_filename, "line": code.co_firstlineno})
+        return index
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        last = time.perf_counter()
+        deadline = last + self.max_seconds
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight = (now - last) * 1000
+            last = now
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident or _is_idle(frame):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._code_index(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                if ident not in self._samples:
+                    self._samples[ident] = ([], [])
+                    self._thread_names.update((t.ident, t.name) for t in threading.enumerate())
+                samples, weights = self._samples[ident]
+                samples.append(stack)
+                weights.append(round(weight, 3))
+            if now > deadline:
+                break
+
+    def to_speedscope(self, name: str) -> Dict:
+        """speedscope 파일 형식 (스레드마다 sampled 프로파일 하나, 샘플 많은 순)"""
+        profiles = []
+        for ident, (samples, weights) in sorted(self._samples.items(), key=lambda item: -len(item[1][0])):
+            profiles.append({
+                "type": "sampled",
+                "name": f"{self._thread_names.get(ident, 'thread')} ({ident})",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights,
+            })
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "myling-profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": self._frames},
+            "profiles": profiles,
+        }
+
+
+def _is_authorized(token: Optional[str]) -> bool:
+    # str끼리 비교하면 ASCII가 아닌 토큰에서 TypeError가 나므로 bytes로 비교
+    return bool(PROFILING_TOKEN) and bool(token) and hmac.compare_digest(token.encode(), PROFILING_TOKEN.encode())
+
+
+def _save(profile_id: str, profile: Dict) -> Path:
+    """프로파일 저장 후 PROFILING_KEEP개를 넘는 오래된 파일 삭제"""
+    PROFILING_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILING_DIR / f"{profile_id}.speedscope.json"
+    path.write_text(json.dumps(profile, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    stored = sorted(PROFILING_DIR.glob("*.speedscope.json"), key=lambda p: p.stat().st_mtime)
+    for old in stored[:max(len(stored) - PROFILING_KEEP, 0)]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+async def profile_request(request, call_next):
+    """HTTP 미들웨어: 신뢰할 수 있는 토큰이 있는 요청만 샘플링 프로파일러로 실행"""
+    if not PROFILING_TOKEN:
+        return await call_next(request)
+    token = request.headers.get("x-profile-token") or request.query_params.get("profile")
+    if not token:
+        return await call_next(request)
+    if not _is_authorized(token):
+        logger.warning("Rejected profiling request with an invalid token for %s", request.url.path)
+        return await call_next(request)
+    if not _active_lock.acquire(blocking=False):
+        response = await call_next(request)
+        response.headers["X-Profile"] = "busy"
+        return response
+
+    try:
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            profiler.stop()
+        name = f"{request.method} {request.url.path}"
+        profile = profiler.to_speedscope(name)
+    finally:
+        _active_lock.release()
+
+    request_id = request_id_var.get()
+    profile_id = time.strftime("%Y%m%dT%H%M%S") + ("" if request_id == "-" else f"-{request_id}")
+    # 파일 쓰기와 오래된 프로파일 정리는 이벤트 루프 밖에서
+    await asyncio.to_thread(_save, profile_id, profile)
+    logger.info("Profiled %s in %.0fms (%d threads), saved as %s",
+                name, profiler.duration_ms, len(profile["profiles"]), profile_id)
+
+    output = request.headers.get("x-profile-output") or request.query_params.get("profile_output")
+    if output == "inline":
+        response = JSONResponse(profile, headers={"X-Profiled-Status": str(response.status_code)})
+    response.headers["X-Profile-Id"] = profile_id
+    return response
+
+
+def profile_path(profile_id: str, token: Optional[str]) -> Optional[Path]:
+    """저장된 프로파일 경로 (토큰이 틀리거나 ID가 잘못됐거나 파일이 없으면 None)"""
+    if not _is_authorized(token) or not PROFILE_ID_RE.match(profile_id):
+        return None
+    path = PROFILING_DIR / f"{profile_id}.speedscope.json"
+    return path if path.is_file() else None
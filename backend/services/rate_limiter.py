@@ -0,0 +1,38 @@
+"""
+호스트별 요청 속도 제한 (비동기 토큰 버킷)
+"""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """초당 rate개의 요청을 허용하는 토큰 버킷 (burst개까지 한 번에 허용)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하면 제한 없음)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """토큰을 하나 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        # 락을 잡은 채로 기다리므로 대기 중인 요청은 도착 순서대로 처리됨
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
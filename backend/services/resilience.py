@@ -0,0 +1,139 @@
+"""
+외부 API 호출 보호 도구 (서킷 브레이커, 지연 시간 추적)
+
+CircuitBreaker는 연속 실패가 쌓이면 잠시 호출을 막아서, 느리거나 죽은 외부 API를
+요청마다 타임아웃까지 기다리지 않고 바로 대체 경로로 넘어가게 합니다.
+LatencyTracker는 최근 응답 시간의 p95를 계산해 hedged request를 보낼 시점을 정합니다.
+"""
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class CircuitBreaker:
+    """closed -> (연속 실패) -> open -> (대기 후) half_open -> (시험 요청 결과) closed/open"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: 이 횟수만큼 연속으로 실패하면 open
+            reset_timeout: open 후 시험 요청을 허용하기까지 기다리는 시간(초)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+        self.trips = 0
+        self.rejected = 0
+        self.successes = 0
+        self.failures = 0
+
+    def allow_request(self) -> bool:
+        """지금 외부 API를 호출해도 되는지 확인 (막히면 rejected 증가)"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_started_at = None
+            else:
+                self.rejected += 1
+                return False
+
+        if self.state == self.HALF_OPEN:
+            # 시험 요청은 한 번에 하나만 보냄 (시험 요청이 취소되어 결과가 안 오면 reset_timeout 후 다시 허용)
+            now = time.monotonic()
+            if self._trial_started_at is not None and now - self._trial_started_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self._trial_started_at = now
+        return True
+
+    def record_success(self):
+        self.successes += 1
+        self.consecutive_failures = 0
+        self._trial_started_at = None
+        self.state = self.CLOSED
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._trial_started_at = None
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
+class LatencyTracker:
+    """최근 응답 시간 window개로 백분위를 계산해 hedging 지연 시간을 정함"""
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        default_delay: float = 2.0,
+        min_delay: float = 0.2,
+        max_delay: float = 3.0,
+    ):
+        """
+        Args:
+            window: 보관할 최근 응답 시간 수
+            min_samples: 이보다 적게 모였으면 default_delay 사용
+            default_delay: 표본이 부족할 때의 hedging 지연 시간(초)
+            min_delay, max_delay: hedging 지연 시간 범위(초)
+        """
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        # nearest-rank 방식
+        index = min(len(ordered) - 1, max(0, math.ceil(p * len(ordered)) - 1))
+        return ordered[index]
+
+    def hedge_delay(self) -> float:
+        """p95 응답 시간 (표본이 부족하면 기본값), min_delay~max_delay 범위로 제한"""
+        if len(self._samples) < self.min_samples:
+            delay = self.default_delay
+        else:
+            delay = self.percentile(0.95)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def stats(self) -> Dict[str, object]:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "samples": len(self._samples),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedge_delay_ms": round(self.hedge_delay() * 1000, 1),
+        }
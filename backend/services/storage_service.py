@@ -1,11 +1,12 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy import Column, Integer, String, Text, DateTime, select
 from datetime import datetime
 import json
-import os
+import logging
 
-Base = declarative_base()
+from services.database import Base, Database
+from services.tracing import set_attributes, traced
+
+logger = logging.getLogger(__name__)
 
 class Study(Base):
     __tablename__ = "studies"
@@ -22,39 +23,26 @@ class Study(Base):
     topic = Column(String, nullable=True)
 
 class StorageService:
-    def __init__(self):
-        db_path = "myling.db"
-        # SQLite 잠금 문제 해결을 위한 설정
-        self.engine = create_async_engine(
-            f"sqlite+aiosqlite:///{db_path}",
-            echo=False,
-            pool_pre_ping=True,  # 연결 상태 확인
-            connect_args={
-                "check_same_thread": False,  # SQLite 멀티스레드 허용
-                "timeout": 30.0,  # 타임아웃 설정 (30초)
-            },
-            poolclass=None,  # 기본 풀 사용
-        )
-        self.async_session = async_sessionmaker(
-            self.engine, 
-            class_=AsyncSession, 
-            expire_on_commit=False,
-            autoflush=False,  # 자동 flush 비활성화
-            autocommit=False
-        )
-        self._initialized = False
+    def __init__(self, database: Database = None):
+        # 앱에서 생성한 공유 Database를 주입받음 (없으면 단독 실행용으로 직접 생성)
+        self.database = database or Database()
+        self.engine = self.database.engine
+        self.async_session = self.database.async_session
     
     async def init_db(self):
         """데이터베이스 초기화"""
-        if not self._initialized:
-            async with self.engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-            self._initialized = True
+        await self.database.init_db()
     
+    @traced()
     async def save_study(self, title: str, english_text: str, korean_text: str, 
                         paragraphs: list, current_step: int, words: list = None, topic: str = None):
         """학습 내용 저장"""
         await self.init_db()
+        set_attributes({
+            "study.paragraphs": len(paragraphs or []),
+            "study.words": len(words or []),
+            "study.chars": len(english_text or ""),
+        })
         
         # paragraphs를 JSON 문자열로 변환
         paragraphs_json = json.dumps(paragraphs, ensure_ascii=False) if paragraphs else "[]"
@@ -79,6 +67,7 @@ class StorageService:
                     session.add(study)
                     await session.commit()
                     await session.refresh(study)
+                    set_attributes({"db.attempts": attempt + 1})
                     return study.id
             except Exception as e:
                 error_str = str(e).lower()
@@ -86,20 +75,18 @@ class StorageService:
                 # 데이터베이스 잠금 오류인 경우 재시도
                 if "database is locked" in error_str or "locked" in error_str:
                     if attempt < max_retries - 1:
+                        self.database.record_lock_retry()
                         import asyncio
                         await asyncio.sleep(retry_delay * (attempt + 1))  # 지수 백오프
-                        print(f"Database locked, retrying... (attempt {attempt + 1}/{max_retries})")
+                        logger.info("Database locked, retrying... (attempt %d/%d)", attempt + 1, max_retries)
                         continue
                     else:
-                        import traceback
-                        error_trace = traceback.format_exc()
-                        print(f"Error in save_study after {max_retries} retries: {error_trace}")
+                        self.database.record_lock_failure()
+                        logger.exception("Error in save_study after %d retries", max_retries)
                         raise ValueError(f"데이터베이스가 잠겨있습니다. 잠시 후 다시 시도해주세요.")
                 
                 # 다른 오류인 경우
-                import traceback
-                error_trace = traceback.format_exc()
-                print(f"Error in save_study: {error_trace}")
+                logger.exception("Error in save_study")
                 
                 if "no such table" in error_str:
                     raise ValueError("데이터베이스 테이블이 초기화되지 않았습니다. 서버를 재시작해주세요.")
@@ -134,12 +121,14 @@ class StorageService:
                 error_str = str(e).lower()
                 if "database is locked" in error_str or "locked" in error_str:
                     if attempt < max_retries - 1:
+                        self.database.record_lock_retry()
                         import asyncio
                         await asyncio.sleep(retry_delay * (attempt + 1))
-                        print(f"Database locked in update_study, retrying... (attempt {attempt + 1}/{max_retries})")
+                        logger.info("Database locked in update_study, retrying... (attempt %d/%d)", attempt + 1, max_retries)
                         continue
                     else:
-                        print(f"Database locked in update_study after {max_retries} retries")
+                        self.database.record_lock_failure()
+                        logger.error("Database locked in update_study after %d retries", max_retries)
                         raise ValueError(f"데이터베이스가 잠겨있습니다. 잠시 후 다시 시도해주세요.")
                 else:
                     raise
@@ -180,8 +169,7 @@ class StorageService:
                 if vocabulary_service:
                     words = await vocabulary_service.get_words(study_id=study.id)
                     actual_word_count = len(words)
-                    # 디버깅: 단어 개수 로그 출력
-                    print(f"Study ID {study.id} ({study.title}): Found {actual_word_count} words")
+                    logger.debug("Study ID %s (%s): found %d words", study.id, study.title, actual_word_count)
                 else:
                     # vocabulary_service가 없으면 기존 word_count 사용
                     actual_word_count = study.word_count
@@ -1,19 +1,69 @@
 """
 키워드 기반 + Zero-shot Classification 하이브리드 주제 분류 서비스
+
+Zero-shot 모델은 서버 시작을 막지 않도록 시작 후 백그라운드에서 불러옵니다 (start_background_load).
+모델이 준비되기 전에는 키워드 기반 분류만 사용합니다.
+TOPIC_SIDECAR_SOCKET이 설정되어 있으면 모델을 이 프로세스에 올리지 않고 추론 사이드카(inference_sidecar.py)에
+요청하며, 사이드카를 쓸 수 없을 때는 키워드 기반 분류로 대신합니다.
+
+환경 변수:
+    TOPIC_MODEL_ENABLED  Zero-shot 모델 사용 여부 (기본값: true)
+    TOPIC_MODEL_NAME     사용할 모델 (기본값: typeform/distilbert-base-uncased-mnli)
+    TOPIC_MODEL_BACKEND  추론 백엔드 - pytorch (기본값) 또는 onnx (int8 양자화 ONNX, onnxruntime 필요)
+    TOPIC_ONNX_MODEL_DIR onnx 백엔드 모델 디렉토리 (기본값: backend/data/topic_model_onnx)
+    TOPIC_BATCH_MAX_SIZE     모델 추론 마이크로 배치 최대 크기 (기본값: 8)
+    TOPIC_BATCH_MAX_WAIT_MS  배치를 채우려고 기다리는 최대 시간(ms) (기본값: 10)
+    TOPIC_CASCADE_ENABLED    키워드가 확실하면 모델을 건너뛰는 cascade 사용 여부 (기본값: true)
+    TOPIC_CASCADE_MIN_HITS   1위 주제의 최소 키워드 수 (기본값: 1)
+    TOPIC_CASCADE_MARGIN     1위와 2위 주제의 키워드 수 차이 (기본값: 2)
+    TOPIC_WINDOW_WORDS       모델에 넣는 창 하나의 단어 수 (기본값: 200, 모델 최대 길이 512토큰 안쪽)
+    TOPIC_WINDOW_STRIDE      창 사이 간격(단어 수) (기본값: 150, 창끼리 50단어씩 겹침)
+    TOPIC_MAX_WINDOWS        지문 하나에서 모델에 넣는 최대 창 수 (기본값: 4, 넘으면 고르게 뽑음)
+    TOPIC_CACHE_SIZE         분류 결과 캐시 크기 (기본값: 1024)
+    TOPIC_SIDECAR_SOCKET     추론 사이드카 Unix 소켓 경로 (services/topic_sidecar_client.py)
 """
+import asyncio
+import hashlib
+import importlib.util
 import logging
-from typing import Optional, Dict
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+from services.keyword_matcher import KeywordMatcher
+from services.metrics import timed_stage
+from services.micro_batcher import MicroBatcher
+from services.topic_sidecar_client import TopicSidecarClient
+from services.tracing import set_attributes, traced
 
 logger = logging.getLogger(__name__)
 
 # Zero-shot classification 모델 (선택적)
-try:
-    from transformers import pipeline
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+# transformers/torch import만으로도 수 초가 걸리므로 설치 여부만 확인하고 실제 import는 모델을 불러올 때 함
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+if not TRANSFORMERS_AVAILABLE:
     logger.warning("transformers 라이브러리가 설치되지 않았습니다. 키워드 기반 분류만 사용됩니다.")
 
+DEFAULT_MODEL_NAME = "typeform/distilbert-base-uncased-mnli"
+DEFAULT_ONNX_MODEL_DIR = Path(__file__).resolve().parent.parent / "data" / "topic_model_onnx"
+
+# 모델 호출 한 번 안에서 한꺼번에 통과시키는 최대 창 수 (문단이 많은 문서에서 메모리 사용량 제한)
+MAX_MODEL_BATCH = 32
+
+# 추론 백엔드
+BACKEND_PYTORCH = "pytorch"
+BACKEND_ONNX = "onnx"
+
+# 모델 상태
+MODEL_DISABLED = "disabled"
+MODEL_NOT_LOADED = "not_loaded"
+MODEL_LOADING = "loading"
+MODEL_READY = "ready"
+MODEL_FAILED = "failed"
+
 # 주제별 키워드 리스트
 humanities_keywords = [
     # History / Philosophy / Literature
@@ -143,10 +193,12 @@ KEYWORD_GROUPS = {
 class TopicClassificationService:
     """키워드 기반 + Zero-shot Classification 하이브리드 주제 분류 서비스"""
     
-    def __init__(self, use_model: bool = True, keyword_weight: float = 0.7, model_weight: float = 0.3):
+    def __init__(self, use_model: bool = True, keyword_weight: float = 0.7, model_weight: float = 0.3,
+                 use_sidecar: bool = True):
         """
         Args:
             use_model: Zero-shot 모델 사용 여부
+            use_sidecar: TOPIC_SIDECAR_SOCKET이 설정되어 있으면 사이드카 사용 (사이드카 프로세스 자신은 False)
             keyword_weight: 키워드 점수 가중치 (0.0 ~ 1.0)
             model_weight: 모델 점수 가중치 (0.0 ~ 1.0)
         """
@@ -155,64 +207,397 @@ class TopicClassificationService:
             topic: [kw.lower() for kw in keywords]
             for topic, keywords in KEYWORD_GROUPS.items()
         }
+        # 키워드 그룹 전체를 한 번만 오토마톤으로 컴파일 (텍스트는 한 번만 훑음)
+        self.keyword_matcher = KeywordMatcher(self.keyword_groups)
         
-        # Zero-shot classifier 초기화
+        # 모델은 사이드카 프로세스에 있고 여기서는 소켓으로 요청만 보냄
+        sidecar_socket = os.getenv("TOPIC_SIDECAR_SOCKET") if use_model and use_sidecar else None
+        self.sidecar: Optional[TopicSidecarClient] = TopicSidecarClient(sidecar_socket) if sidecar_socket else None
+        
+        # Zero-shot classifier는 여기서 불러오지 않음 (load_model / start_background_load)
         self.classifier = None
-        self.use_model = use_model and TRANSFORMERS_AVAILABLE
+        self.use_model = (
+            use_model
+            and self.sidecar is None
+            and TRANSFORMERS_AVAILABLE
+            and os.getenv("TOPIC_MODEL_ENABLED", "true").lower() in ("1", "true", "yes")
+        )
         self.keyword_weight = keyword_weight
         self.model_weight = model_weight
+        # 더 가벼운 모델 사용 (빠른 처리, 용량 절약)
+        # 옵션:
+        # - "facebook/bart-large-mnli" (기본, 정확하지만 큼 ~1.6GB)
+        # - "typeform/distilbert-base-uncased-mnli" (가벼움 ~250MB, 빠름)
+        # - "valhalla/distilbart-mnli-12-3" (중간 ~500MB)
+        self.model_name = os.getenv("TOPIC_MODEL_NAME", DEFAULT_MODEL_NAME)
+        self.backend = os.getenv("TOPIC_MODEL_BACKEND", BACKEND_PYTORCH).lower()
+        self.onnx_model_dir = Path(os.getenv("TOPIC_ONNX_MODEL_DIR") or DEFAULT_ONNX_MODEL_DIR)
+        
+        self.model_state = MODEL_NOT_LOADED if self.use_model else MODEL_DISABLED
+        self.model_error: Optional[str] = None
+        self.model_load_seconds: Optional[float] = None
+        self._load_task: Optional[asyncio.Task] = None
         
-        if self.use_model:
-            try:
-                # 더 가벼운 모델 사용 (빠른 처리, 용량 절약)
-                # 옵션:
-                # - "facebook/bart-large-mnli" (기본, 정확하지만 큼 ~1.6GB)
-                # - "typeform/distilbert-base-uncased-mnli" (가벼움 ~250MB, 빠름)
-                # - "valhalla/distilbart-mnli-12-3" (중간 ~500MB)
+        # 키워드 단계에서 확실하게 결정되면 모델을 건너뜀. 기본값은 benchmarks/calibrate_topic_cascade.py
+        # (평가 세트 24개 지문, 조기 종료 정답률 목표 0.95)의 추천값 min_hits=1, margin=2:
+        #   1/2 (기본값)  조기 종료 33%, 정답률 1.00  (2/2와 같은 비율)
+        #   1/1           조기 종료 75%, 정답률 0.94  (18개 중 1개 오분류, 목표 미달)
+        # 모델을 더 많이 건너뛰어야 하면 TOPIC_CASCADE_MARGIN=1로 정확도를 조금 내주고 조정할 수 있음
+        self.cascade_enabled = os.getenv("TOPIC_CASCADE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.cascade_min_hits = int(os.getenv("TOPIC_CASCADE_MIN_HITS", "1"))
+        self.cascade_margin = int(os.getenv("TOPIC_CASCADE_MARGIN", "2"))
+        # 분류 경로별 요청 수: 키워드로 조기 종료 / 모델 사용 / 모델 없이 키워드만
+        self.cascade_counts = {"early_exit": 0, "model": 0, "keyword_only": 0}
+        
+        # 긴 지문은 고정 길이 창으로 나눠 모델 점수를 평균 (모델은 512토큰 뒤를 잘라버림)
+        self.window_words = int(os.getenv("TOPIC_WINDOW_WORDS", "200"))
+        self.window_stride = int(os.getenv("TOPIC_WINDOW_STRIDE", "150"))
+        self.max_windows = int(os.getenv("TOPIC_MAX_WINDOWS", "4"))
+        
+        # 정규화한 텍스트의 해시 -> 주제 (같은 지문을 다시 분류하지 않음)
+        # 추론 워커 스레드와 이벤트 루프에서 함께 쓰므로 lock으로 보호
+        self.cache_size = int(os.getenv("TOPIC_CACHE_SIZE", "1024"))
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # 동시에 들어온 분류 요청을 모아서 전용 스레드에서 한 번에 모델에 통과시킴
+        self.batcher = MicroBatcher(
+            self._classify_with_model,
+            max_batch_size=int(os.getenv("TOPIC_BATCH_MAX_SIZE", "8")),
+            max_wait_ms=float(os.getenv("TOPIC_BATCH_MAX_WAIT_MS", "10")),
+            name="topic-inference",
+        )
+    
+    @property
+    def model_ready(self) -> bool:
+        return self.model_state == MODEL_READY
+    
+    def load_model(self):
+        """Zero-shot 모델을 불러옴 (블로킹, 수십 초 걸릴 수 있음)"""
+        if self.model_state not in (MODEL_NOT_LOADED, MODEL_LOADING):
+            return
+        self.model_state = MODEL_LOADING
+        started_at = time.perf_counter()
+        try:
+            if self.backend == BACKEND_ONNX:
+                # int8 양자화 ONNX 모델 (torch 없이 onnxruntime으로 실행, 메모리/지연 시간 절약)
+                from services.onnx_zero_shot import OnnxZeroShotClassifier
+                
+                self.classifier = OnnxZeroShotClassifier(self.onnx_model_dir)
+            else:
+                from transformers import pipeline
+                
                 self.classifier = pipeline(
                     "zero-shot-classification",
-                    model="typeform/distilbert-base-uncased-mnli",  # 더 가벼운 모델 사용
+                    model=self.model_name,
                     device=-1  # CPU 사용 (-1), GPU가 있으면 0으로 변경 가능
                 )
-                logger.info("Zero-shot classification 모델이 성공적으로 로드되었습니다.")
-            except Exception as e:
-                logger.warning(f"Zero-shot 모델 로드 실패: {e}. 키워드 기반 분류만 사용됩니다.")
-                self.use_model = False
+            self.model_load_seconds = time.perf_counter() - started_at
+            self.model_state = MODEL_READY
+            logger.info(
+                "Zero-shot classification 모델이 성공적으로 로드되었습니다. (%s, %.1fs)", self.backend, self.model_load_seconds
+            )
+        except Exception as e:
+            self.model_error = str(e)
+            self.model_state = MODEL_FAILED
+            logger.warning("Zero-shot 모델 로드 실패: %s. 키워드 기반 분류만 사용됩니다.", e)
+    
+    def start_background_load(self):
+        """이벤트 루프를 막지 않도록 별도 스레드에서 모델을 불러옴 (앱 lifespan 시작 시 호출)"""
+        if self.sidecar is not None:
+            # 사이드카 모드에서는 사이드카 상태만 확인해 둠
+            if self._load_task is None:
+                self._load_task = asyncio.create_task(self.sidecar.refresh_status())
+            return
+        if self.model_state != MODEL_NOT_LOADED or self._load_task is not None:
+            return
+        self.model_state = MODEL_LOADING
+        self._load_task = asyncio.create_task(asyncio.to_thread(self.load_model))
+    
+    async def refresh_model_status(self):
+        """사이드카 모드면 사이드카 상태를 다시 확인 (최근에 확인했으면 건너뜀, readiness 검사에서 호출)"""
+        if self.sidecar is not None:
+            await self.sidecar.refresh_status_if_stale()
+    
+    def model_status(self) -> Dict[str, object]:
+        """모델 준비 상태"""
+        if self.sidecar is not None:
+            return {
+                "state": "sidecar",
+                "ready": self.sidecar.available,
+                "sidecar": self.sidecar.stats(),
+                "cascade": self.cascade_stats(),
+                "cache": self.cache_stats(),
+            }
+        return {
+            "state": self.model_state,
+            "ready": self.model_ready,
+            "model": self.model_name,
+            "backend": self.backend,
+            "load_seconds": round(self.model_load_seconds, 2) if self.model_load_seconds is not None else None,
+            "error": self.model_error,
+            "batching": self.batcher.stats(),
+            "cascade": self.cascade_stats(),
+            "cache": self.cache_stats(),
+        }
+    
+    def cache_stats(self) -> Dict[str, object]:
+        """분류 결과 캐시 지표"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": self.cache_hits / lookups if lookups else 0.0,
+        }
+    
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """대소문자와 공백 차이를 무시한 텍스트 해시"""
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, text: str) -> Optional[str]:
+        key = self._cache_key(text)
+        with self._cache_lock:
+            topic = self._cache.get(key)
+            if topic is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return topic
+    
+    def _cache_put(self, text: str, topic: str):
+        if self.cache_size <= 0:
+            return
+        key = self._cache_key(text)
+        with self._cache_lock:
+            self._cache[key] = topic
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def cascade_stats(self) -> Dict[str, object]:
+        """키워드 단계에서 끝난 요청 비율 등 cascade 지표"""
+        total = sum(self.cascade_counts.values())
+        return {
+            "enabled": self.cascade_enabled,
+            "min_hits": self.cascade_min_hits,
+            "margin": self.cascade_margin,
+            "requests": total,
+            **self.cascade_counts,
+            "early_exit_ratio": self.cascade_counts["early_exit"] / total if total else 0.0,
+        }
+    
+    async def aclose(self):
+        """추론 워커 종료 (앱 lifespan 종료 시 호출)"""
+        await self.batcher.aclose()
     
     def _calculate_keyword_scores(self, text: str) -> Dict[str, float]:
-        """키워드 기반 점수 계산"""
-        text_lower = text.lower()
-        scores = {}
+        """키워드 기반 점수 계산 (단어 단위 매칭, 주제별 키워드 개수로 나누어 0~1 사이로 정규화)"""
+        return self.keyword_matcher.score(text)
+    
+    def _keyword_stage(self, text: str) -> Tuple[Dict[str, float], Optional[str]]:
+        """
+        cascade 1단계. 키워드 점수를 계산하고, 1위 주제의 키워드 수가 cascade_min_hits 이상이면서
+        2위보다 cascade_margin 이상 많으면 모델 없이 주제를 결정합니다.
         
-        for topic, keywords in self.keyword_groups.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
-            # 정규화: 키워드 개수로 나누어 0~1 사이로 정규화
-            scores[topic] = score / len(keywords) if keywords else 0
+        Returns:
+            (키워드 점수, 결정된 주제 또는 None)
+        """
+        counts = self.keyword_matcher.counts(text)
+        keyword_scores = self.keyword_matcher.normalize(counts)
+        if not self.cascade_enabled:
+            return keyword_scores, None
         
-        return scores
+        ranked = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+        top_topic, top = ranked[0] if ranked else (None, 0)
+        second = ranked[1][1] if len(ranked) > 1 else 0
+        if top >= self.cascade_min_hits and top - second >= self.cascade_margin:
+            # 정규화 점수는 키워드 목록 길이에 따라 작아서 _choose_topic의 임계값을 거치지 않고 바로 결정
+            return keyword_scores, TOPIC_MAPPING.get(top_topic, '기타')
+        return keyword_scores, None
     
     def _calculate_model_scores(self, text: str) -> Optional[Dict[str, float]]:
         """Zero-shot 모델 기반 점수 계산"""
-        if not self.use_model or not self.classifier:
-            return None
+        return self._calculate_model_scores_batch([text])[0]
+    
+    def _split_windows(self, text: str) -> List[str]:
+        """
+        긴 텍스트를 window_words 단어짜리 창으로 나눔 (window_stride 간격, 마지막 창은 끝에 맞춤).
+        창이 max_windows개보다 많으면 처음부터 끝까지 고르게 뽑아서 비용을 제한합니다.
+        """
+        words = text.split()
+        size = max(1, self.window_words)
+        if len(words) <= size:
+            return [text]
+        
+        stride = max(1, min(self.window_stride, size))
+        starts = list(range(0, len(words) - size, stride)) + [len(words) - size]
+        if self.max_windows > 0 and len(starts) > self.max_windows:
+            if self.max_windows == 1:
+                starts = [starts[len(starts) // 2]]
+            else:
+                last = len(starts) - 1
+                starts = [starts[round(i * last / (self.max_windows - 1))] for i in range(self.max_windows)]
+        return [" ".join(words[start:start + size]) for start in starts]
+    
+    def _calculate_model_scores_batch(self, texts: List[str]) -> List[Optional[Dict[str, float]]]:
+        """
+        Zero-shot 모델 기반 점수를 여러 텍스트에 대해 한 번의 호출로 계산.
+        긴 텍스트는 여러 창으로 나누고, 모든 텍스트의 창을 한 번에 모델에 넣은 뒤 텍스트별로 평균을 냅니다.
+        """
+        # 모델이 준비되기 전에는 키워드 점수만 사용
+        if not self.model_ready or not self.classifier or not texts:
+            return [None] * len(texts)
+        
+        windows = []
+        owners = []
+        for i, text in enumerate(texts):
+            for window in self._split_windows(text):
+                windows.append(window)
+                owners.append(i)
         
         try:
-            result = self.classifier(text, ZERO_SHOT_LABELS)
+            results = self.classifier(windows, ZERO_SHOT_LABELS, batch_size=min(len(windows), MAX_MODEL_BATCH))
+            if isinstance(results, dict):
+                results = [results]
             
-            # 모델 결과를 내부 주제 형식으로 변환
-            scores = {}
-            for label, score in zip(result['labels'], result['scores']):
-                topic = ZERO_SHOT_TO_TOPIC.get(label)
-                if topic:
-                    scores[topic] = score
+            # 모델 결과를 내부 주제 형식으로 변환하고 텍스트별로 창 점수를 합산
+            totals: List[Dict[str, float]] = [{} for _ in texts]
+            window_counts = [0] * len(texts)
+            for owner, result in zip(owners, results):
+                window_counts[owner] += 1
+                for label, score in zip(result['labels'], result['scores']):
+                    topic = ZERO_SHOT_TO_TOPIC.get(label)
+                    if topic:
+                        totals[owner][topic] = totals[owner].get(topic, 0) + score
             
-            return scores
+            return [
+                {topic: total / count for topic, total in scores.items()} if count else None
+                for scores, count in zip(totals, window_counts)
+            ]
         except Exception as e:
-            logger.warning(f"모델 분류 실패: {e}")
+            logger.warning("모델 분류 실패: %s", e)
+            return [None] * len(texts)
+    
+    @staticmethod
+    def _is_too_short(text: str) -> bool:
+        """비어있거나 너무 짧은 텍스트 (20자 이하 또는 단어가 3개 이하)"""
+        if not text or not text.strip():
+            return True
+        text_stripped = text.strip()
+        return len(text_stripped) <= 20 or len(text_stripped.split()) <= 3
+    
+    def _classify_with_model(self, texts: List[str]) -> List[str]:
+        """키워드만으로 결정되지 않은 텍스트들을 한 번의 모델 배치 호출로 분류"""
+        model_scores = self._calculate_model_scores_batch(texts)
+        topics = []
+        for text, scores in zip(texts, model_scores):
+            topic = self._choose_topic(self._calculate_keyword_scores(text), scores)
+            # 모델 점수까지 반영된 결과만 캐시 (모델 실패 시 키워드만으로 낸 결과는 저장하지 않음)
+            if scores is not None:
+                self._cache_put(text, topic)
+            topics.append(topic)
+        return topics
+    
+    def _pre_model_stage(self, text: str) -> Tuple[Optional[str], Dict[str, float]]:
+        """
+        모델 없이 끝낼 수 있는지 확인 (너무 짧은 텍스트, 캐시, 키워드 cascade).
+        
+        Returns:
+            (결정된 주제 또는 None, 키워드 점수)
+        """
+        if self._is_too_short(text):
+            return '기타', {}
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached, {}
+        keyword_scores, decided = self._keyword_stage(text)
+        if decided is not None:
+            self.cascade_counts["early_exit"] += 1
+            self._cache_put(text, decided)
+        return decided, keyword_scores
+    
+    @timed_stage("classify")
+    def classify_batch(self, texts: List[str]) -> List[str]:
+        """
+        여러 텍스트를 분류합니다. 캐시에 없고 키워드로도 결정되지 않은 텍스트만 한 번의 배치 호출로 모델에 보냅니다.
+        (동기 호출이라 사이드카 모드에서는 키워드만 사용합니다. 사이드카는 classify_async에서 사용)
+        """
+        topics = []
+        ambiguous = []
+        for i, text in enumerate(texts):
+            topic, keyword_scores = self._pre_model_stage(text)
+            if topic is None and not self.model_ready:
+                self.cascade_counts["keyword_only"] += 1
+                topic = self._choose_topic(keyword_scores, None)
+            elif topic is None:
+                self.cascade_counts["model"] += 1
+                ambiguous.append(i)
+            topics.append(topic)
+        if ambiguous:
+            for i, topic in zip(ambiguous, self._classify_with_model([texts[i] for i in ambiguous])):
+                topics[i] = topic
+        return topics
+    
+    async def _model_stage_async(self, texts: List[str]) -> Optional[List[str]]:
+        """사이드카 또는 추론 워커로 모델 분류 (모델을 쓸 수 없으면 None)"""
+        if self.sidecar is not None:
+            topics = await self.sidecar.classify_batch(texts)
+            if topics is not None and self.sidecar.model_ready:
+                for text, topic in zip(texts, topics):
+                    self._cache_put(text, topic)
+            return topics
+        if not self.model_ready:
             return None
+        if len(texts) == 1:
+            # 한 건이면 다른 요청과 마이크로 배치로 묶임
+            return [await self.batcher.submit(texts[0])]
+        return await self.batcher.submit_batch(texts)
+    
+    @traced()
+    @timed_stage("classify")
+    async def classify_many_async(self, texts: List[str]) -> List[str]:
+        """
+        이벤트 루프를 막지 않고 여러 텍스트(예: 문서 전체 + 문단들)를 분류합니다.
+        캐시나 키워드로 결정되지 않은 텍스트를 모아 모델 호출 한 번으로 처리하고,
+        모델(또는 사이드카)을 쓸 수 없으면 키워드만으로 분류합니다.
+        """
+        topics = []
+        ambiguous = []
+        keyword_scores_by_index = {}
+        for i, text in enumerate(texts):
+            topic, keyword_scores = self._pre_model_stage(text)
+            if topic is None:
+                ambiguous.append(i)
+                keyword_scores_by_index[i] = keyword_scores
+            topics.append(topic)
+        set_attributes({"classify.texts": len(texts), "classify.model_texts": len(ambiguous)})
+        if not ambiguous:
+            return topics
+        
+        model_topics = await self._model_stage_async([texts[i] for i in ambiguous])
+        if model_topics is None:
+            self.cascade_counts["keyword_only"] += len(ambiguous)
+            model_topics = [self._choose_topic(keyword_scores_by_index[i], None) for i in ambiguous]
+        else:
+            self.cascade_counts["model"] += len(ambiguous)
+        for i, topic in zip(ambiguous, model_topics):
+            topics[i] = topic
+        return topics
+    
+    async def classify_async(self, text: str) -> str:
+        """
+        이벤트 루프를 막지 않는 classify.
+        캐시에 있거나 키워드로 결정되면 바로 반환하고, 아니면 추론 워커의 마이크로 배치로 보냅니다.
+        모델이 준비되기 전에는 키워드만으로 분류합니다.
+        """
+        return (await self.classify_many_async([text]))[0]
     
     def classify(self, text: str) -> str:
         """
@@ -224,21 +609,10 @@ class TopicClassificationService:
         Returns:
             분류된 주제 (한글): '인문', '자연과학', '공학·기술', '예술·문화', '기타'
         """
-        if not text or not text.strip():
-            return '기타'
-        
-        # 텍스트가 너무 짧으면 (20자 이하 또는 단어가 3개 이하) '기타' 반환
-        text_stripped = text.strip()
-        word_count = len(text_stripped.split())
-        if len(text_stripped) <= 20 or word_count <= 3:
-            return '기타'
-        
-        # 1. 키워드 기반 점수 계산
-        keyword_scores = self._calculate_keyword_scores(text)
-        
-        # 2. 모델 기반 점수 계산 (선택적)
-        model_scores = self._calculate_model_scores(text)
-        
+        return self.classify_batch([text])[0]
+    
+    def _choose_topic(self, keyword_scores: Dict[str, float], model_scores: Optional[Dict[str, float]]) -> str:
+        """키워드 점수와 모델 점수(없으면 None)를 합쳐 최종 주제 선택"""
         # 3. 키워드 점수가 모두 0인지 확인
         max_keyword_score = max(keyword_scores.values()) if keyword_scores else 0
         has_keywords = max_keyword_score > 0
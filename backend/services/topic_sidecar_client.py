@@ -0,0 +1,141 @@
+"""
+주제 분류 추론 사이드카 클라이언트
+
+uvicorn 워커마다 Zero-shot 모델(수백 MB + torch 런타임)을 따로 올리지 않도록,
+모델은 inference_sidecar.py 프로세스 하나에만 올리고 API 워커들은 Unix 소켓으로 분류를 요청합니다.
+사이드카가 꺼져 있거나 응답이 늦으면 None을 돌려주고, 호출하는 쪽은 키워드 분류로 대신합니다.
+연속 실패 시에는 서킷 브레이커가 잠시 호출을 막아서 요청마다 타임아웃까지 기다리지 않습니다.
+
+프로토콜: 한 줄에 JSON 하나 (요청 -> 응답)
+    {"op": "classify", "texts": [...]}  ->  {"topics": [...], "model_ready": true}
+    {"op": "status"}                    ->  {"status": {...}, "model_ready": true}
+    실패 시                              ->  {"error": "..."}
+
+환경 변수:
+    TOPIC_SIDECAR_SOCKET          사이드카 Unix 소켓 경로 (설정하면 API 워커는 모델을 직접 올리지 않음)
+    TOPIC_SIDECAR_TIMEOUT         요청 타임아웃(초) (기본값: 5)
+    TOPIC_SIDECAR_RETRY_SECONDS   연속 실패로 막힌 뒤 다시 시도하기까지 기다리는 시간(초) (기본값: 5)
+    TOPIC_SIDECAR_STATUS_TTL      readiness 검사에서 사이드카 상태를 다시 묻는 최소 간격(초) (기본값: 2)
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from services.resilience import CircuitBreaker
+
+# 책 한 권 분량 지문도 한 줄에 들어가도록 StreamReader 한도를 늘림
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict]:
+    """한 줄을 읽어 JSON으로 변환 (연결이 끊기면 None)"""
+    line = await reader.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+async def write_message(writer: asyncio.StreamWriter, message: Dict):
+    writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+class TopicSidecarClient:
+    """inference_sidecar.py에 분류를 요청하는 클라이언트"""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None, retry_seconds: Optional[float] = None):
+        """
+        Args:
+            socket_path: 사이드카 Unix 소켓 경로
+            timeout: 요청 하나의 타임아웃(초)
+            retry_seconds: 연속 실패로 막힌 뒤 다시 시도하기까지 기다리는 시간(초)
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout or float(os.getenv("TOPIC_SIDECAR_TIMEOUT", "5"))
+        self.breaker = CircuitBreaker(
+            failure_threshold=3,
+            reset_timeout=retry_seconds or float(os.getenv("TOPIC_SIDECAR_RETRY_SECONDS", "5")),
+        )
+        # 마지막 응답에서 받은 사이드카 모델 준비 상태
+        self.model_ready = False
+        self.last_status: Optional[Dict] = None
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        # readiness 검사가 자주 들어와도 사이드카에는 이 간격마다 한 번만 상태를 물음
+        self.status_ttl = float(os.getenv("TOPIC_SIDECAR_STATUS_TTL", "2"))
+        self._status_checked_at = float("-inf")
+
+    @property
+    def available(self) -> bool:
+        """사이드카 모델이 준비되어 있고 호출이 막혀 있지 않은지 (마지막으로 확인한 상태 기준)"""
+        return self.model_ready and self.breaker.state != CircuitBreaker.OPEN
+
+    async def _request(self, message: Dict) -> Optional[Dict]:
+        if not self.breaker.allow_request():
+            return None
+        self.requests += 1
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path, limit=MAX_MESSAGE_BYTES), self.timeout
+            )
+            await write_message(writer, message)
+            response = await asyncio.wait_for(read_message(reader), self.timeout)
+            if response is None or "error" in response:
+                raise RuntimeError(response.get("error") if response else "connection closed")
+        except (OSError, asyncio.TimeoutError, RuntimeError, ValueError) as e:
+            self.failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            self.model_ready = False
+            self.breaker.record_failure()
+            return None
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self.breaker.record_success()
+        self.model_ready = bool(response.get("model_ready"))
+        return response
+
+    async def classify_batch(self, texts: List[str]) -> Optional[List[str]]:
+        """사이드카에서 분류한 주제 목록 (사이드카를 쓸 수 없으면 None)"""
+        response = await self._request({"op": "classify", "texts": texts})
+        if response is None:
+            return None
+        topics = response.get("topics")
+        if not isinstance(topics, list) or len(topics) != len(texts):
+            return None
+        return topics
+
+    async def refresh_status(self) -> Optional[Dict]:
+        """사이드카 모델 상태를 다시 확인"""
+        self._status_checked_at = time.monotonic()
+        response = await self._request({"op": "status"})
+        if response is not None:
+            self.last_status = response.get("status")
+        return self.last_status
+
+    async def refresh_status_if_stale(self) -> Optional[Dict]:
+        """
+        마지막 확인 후 status_ttl초가 지났을 때만 상태를 다시 확인
+        
+        시작 시 한 번 확인한 뒤 분류 요청이 없으면 model_ready가 갱신되지 않아,
+        사이드카가 모델을 다 불러온 뒤에도 readiness가 계속 준비 안 됨으로 남지 않게 합니다.
+        """
+        if time.monotonic() - self._status_checked_at < self.status_ttl:
+            return self.last_status
+        return await self.refresh_status()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "socket": self.socket_path,
+            "model_ready": self.model_ready,
+            "requests": self.requests,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "circuit_breaker": self.breaker.stats(),
+            "remote": self.last_status,
+        }
@@ -0,0 +1,293 @@
+"""
+요청 추적 span (OpenTelemetry 형식의 경량 구현)
+
+/api/study/save 하나가 StorageService.save_study, VocabularyService.save_words, 단어 N개의 사전 조회와
+DeepL 호출로 퍼져 나가는 과정을 span 트리로 남깁니다. 요청마다 루트 span(HTTP)이 생기고, 서비스 호출과
+SQL 문 실행이 그 아래 자식 span이 됩니다. 부모 span은 contextvars로 전달되므로 asyncio.gather나
+asyncio.to_thread로 퍼진 작업도 같은 트리에 붙습니다.
+
+외부 수집기 없이 쓸 수 있도록 span은 콘솔(stdout) 또는 로컬 JSONL 파일로 내보냅니다.
+JSONL 한 줄이 span 하나이며 필드 이름은 OTLP JSON을 따릅니다 (traceId, spanId, parentSpanId, ...).
+scripts/trace_summary.py로 트레이스별 트리와 임계 경로를 볼 수 있습니다.
+내보내기는 logging_config와 같은 큐 + 리스너 스레드 방식이라 요청 처리를 막지 않습니다.
+요청에 W3C traceparent 헤더가 있으면 그 trace ID를 이어서 쓰고, 응답의 X-Trace-Id 헤더로 trace ID를 돌려줍니다.
+
+환경 변수:
+    TRACING_EXPORTER     console, jsonl 또는 console,jsonl (기본값: 비활성화)
+    TRACING_FILE         JSONL 파일 경로 (기본값: backend/traces/spans.jsonl, 50MB마다 교체)
+    TRACING_SAMPLE_RATE  추적할 요청 비율 (기본값: 1.0)
+"""
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import secrets
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from services.logging_config import request_id_var
+
+TRACING_EXPORTERS = {name.strip() for name in os.getenv("TRACING_EXPORTER", "").lower().split(",") if name.strip()}
+TRACING_FILE = Path(os.getenv("TRACING_FILE", str(Path(__file__).resolve().parent.parent / "traces" / "spans.jsonl")))
+TRACING_SAMPLE_RATE = min(1.0, max(0.0, float(os.getenv("TRACING_SAMPLE_RATE", "1.0"))))
+TRACING_FILE_MAX_BYTES = 50 * 1024 * 1024
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+# 긴 SQL 문은 앞부분만 속성으로 남김
+MAX_STATEMENT_CHARS = 200
+
+_span_logger = logging.getLogger("myling.tracing")
+_span_logger.propagate = False
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class Span:
+    """시작/종료 시각, 부모, 속성을 가진 작업 단위 하나"""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.status = "OK"
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        self.attributes.update(attributes)
+
+    def record_exception(self, error: BaseException):
+        self.status = "ERROR"
+        self.attributes["exception.type"] = type(error).__name__
+        self.attributes["exception.message"] = str(error)[:500]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """추적이 꺼져 있거나 샘플링되지 않은 요청에서 쓰는 span (아무것도 기록하지 않음)"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+# 현재 span (None이면 루트, NOOP_SPAN이면 이 요청은 샘플링되지 않음)
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+def enabled() -> bool:
+    return _listener is not None
+
+
+def current_span():
+    """현재 span (없으면 NOOP_SPAN)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def set_attributes(attributes: Dict[str, Any]):
+    """현재 span에 속성 추가 (추적이 꺼져 있으면 아무것도 하지 않음)"""
+    current_span().set_attributes(attributes)
+
+
+@contextmanager
+def span(name: str, trace_id: Optional[str] = None, parent_id: Optional[str] = None, **attributes: Any):
+    """
+    with 블록을 span 하나로 기록 (현재 span의 자식)
+
+    trace_id/parent_id는 루트 span에서 외부 traceparent를 이어받을 때만 지정합니다.
+    """
+    parent = _current_span.get()
+    if _listener is None or parent is NOOP_SPAN:
+        yield NOOP_SPAN
+        return
+    if parent is None and trace_id is None and random.random() >= TRACING_SAMPLE_RATE:
+        token = _current_span.set(NOOP_SPAN)
+        try:
+            yield NOOP_SPAN
+        finally:
+            _current_span.reset(token)
+        return
+
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    current = Span(name, trace_id or secrets.token_hex(16), parent_id, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_ns = time.time_ns()
+        _span_logger.info(current.name, extra={"span": current.to_dict()})
+
+
+def traced(name: Optional[str] = None):
+    """함수(동기/async) 호출을 span으로 기록하는 데코레이터 (기본 이름: 클래스.메서드)"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _ConsoleSpanFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = record.span
+        attributes = " ".join(f"{key}={value}" for key, value in data["attributes"].items())
+        return (f"span {data['traceId'][:8]}/{data['spanId']}<-{data['parentSpanId'] or '-'} "
+                f"{data['name']} {data['durationMs']:.1f}ms {data['status']} {attributes}").rstrip()
+
+
+class _JsonlSpanFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.span, ensure_ascii=False, default=str)
+
+
+class _SpanQueueHandler(logging.handlers.QueueHandler):
+    """span dict를 그대로 큐에 넣음 (기본 QueueHandler처럼 메시지를 미리 포맷하지 않음)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_tracing():
+    """TRACING_EXPORTER에 맞게 내보내기 설정 (비어 있으면 span을 만들지 않음)"""
+    global _listener
+    if _listener is not None or not TRACING_EXPORTERS:
+        return
+
+    handlers = []
+    if "console" in TRACING_EXPORTERS:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(_ConsoleSpanFormatter())
+        handlers.append(console)
+    if "jsonl" in TRACING_EXPORTERS:
+        TRACING_FILE.parent.mkdir(parents=True, exist_ok=True)
+        jsonl = logging.handlers.RotatingFileHandler(
+            TRACING_FILE, maxBytes=TRACING_FILE_MAX_BYTES, backupCount=3, encoding="utf-8"
+        )
+        jsonl.setFormatter(_JsonlSpanFormatter())
+        handlers.append(jsonl)
+    if not handlers:
+        logging.getLogger(__name__).warning("Unknown TRACING_EXPORTER %s, tracing disabled", sorted(TRACING_EXPORTERS))
+        return
+
+    span_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _span_logger.handlers = [_SpanQueueHandler(span_queue)]
+    _span_logger.setLevel(logging.INFO)
+    _listener = logging.handlers.QueueListener(span_queue, *handlers)
+    _listener.start()
+
+
+def stop_tracing():
+    """큐에 남은 span을 모두 내보내고 리스너 종료 (lifespan 종료 시 호출)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def instrument_engine(engine):
+    """SQL 문 실행마다 db.query span 기록 (AsyncEngine이면 sync_engine에 이벤트 연결)"""
+    if _listener is None:
+        return
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        manager = span(
+            "db.query",
+            **{
+                "db.system": sync_engine.dialect.name,
+                "db.operation": statement.lstrip().split(" ", 1)[0].upper(),
+                "db.statement": statement[:MAX_STATEMENT_CHARS],
+                "db.executemany": executemany,
+            },
+        )
+        manager.__enter__()
+        conn.info.setdefault("tracing_spans", []).append(manager)
+
+    def _finish(conn, error: Optional[BaseException]):
+        managers = conn.info.get("tracing_spans")
+        if not managers:
+            return
+        manager = managers.pop()
+        if error is None:
+            manager.__exit__(None, None, None)
+        else:
+            manager.__exit__(type(error), error, error.__traceback__)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn, None)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(context):
+        if context.connection is not None:
+            _finish(context.connection, context.original_exception)
+
+
+async def trace_request(request, call_next):
+    """HTTP 미들웨어: 요청마다 루트 span을 만들고 X-Trace-Id 응답 헤더로 trace ID를 돌려줌"""
+    if _listener is None:
+        return await call_next(request)
+    trace_id = parent_id = None
+    match = TRACEPARENT_RE.match(request.headers.get("traceparent", ""))
+    if match:
+        trace_id, parent_id = match.group(1), match.group(2)
+
+    with span(f"{request.method} {request.url.path}", trace_id=trace_id, parent_id=parent_id,
+              **{"http.method": request.method, "request.id": request_id_var.get()}) as root:
+        response = await call_next(request)
+        # 실제 경로 대신 라우트 템플릿으로 이름을 바꿔 트레이스끼리 묶어 볼 수 있게 함
+        route = request.scope.get("route")
+        if isinstance(root, Span):
+            root.name = f"{request.method} {getattr(route, 'path', request.url.path)}"
+            root.set_attributes({"http.route": getattr(route, "path", None), "http.status_code": response.status_code})
+            response.headers["X-Trace-Id"] = root.trace_id
+        return response
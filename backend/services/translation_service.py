@@ -1,29 +1,34 @@
-import deepl
+import asyncio
 import os
 import re
 from typing import List
 
+from services.env_loader import load_env
+from services.metrics import timed_stage
+from services.tracing import set_attributes, traced
+
 class TranslationService:
+    # DeepL은 요청 하나에 최대 50개의 텍스트를 받음
+    MAX_BATCH_TEXTS = 50
+    
     def __init__(self):
-        # 환경 변수 다시 확인
+        # main에서 이미 읽었으면 다시 읽지 않음 (스크립트 등에서 단독으로 쓸 때만 api.env를 읽음)
+        load_env()
         api_key = os.getenv("DEEPL_API_KEY")
-        if not api_key:
-            # api.env 파일을 직접 읽어보기
-            from pathlib import Path
-            env_path = Path(__file__).parent.parent / "api.env"
-            if env_path.exists():
-                with open(env_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith("DEEPL_API_KEY="):
-                            api_key = line.split("=", 1)[1].strip()
-                            os.environ["DEEPL_API_KEY"] = api_key
-                            break
-        
         if not api_key:
             raise ValueError("DEEPL_API_KEY environment variable is not set")
         
-        self.translator = deepl.Translator(api_key)
+        self._api_key = api_key
+        self._translator = None
+    
+    @property
+    def translator(self):
+        """DeepL 클라이언트 (deepl/requests import가 무거워서 처음 번역할 때 생성)"""
+        if self._translator is None:
+            import deepl
+            
+            self._translator = deepl.Translator(self._api_key)
+        return self._translator
     
     def _is_title_line(self, line: str) -> bool:
         """제목 라인인지 판단 - 매우 엄격한 조건"""
@@ -84,6 +89,8 @@ class TranslationService:
         """이 라인을 문단에서 제외해야 하는지 판단"""
         return self._is_title_line(line) or self._is_author_line(line) or self._is_chapter_line(line)
     
+    @traced()
+    @timed_stage("paragraph_split")
     def split_into_paragraphs(self, text: str) -> List[str]:
         """텍스트를 문단 단위로 분리
         
@@ -96,6 +103,7 @@ class TranslationService:
         """
         if not text or not text.strip():
             return [""]
+        set_attributes({"text.chars": len(text)})
         
         normalized = text.replace('\r\n', '\n').replace('\r', '\n')
         
@@ -244,11 +252,39 @@ class TranslationService:
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences
     
+    @traced("DeepL.translate")
+    @timed_stage("translate")
     async def translate(self, text: str, target_lang: str = "KO") -> str:
         """텍스트를 한국어로 번역"""
+        set_attributes({"deepl.texts": 1, "deepl.chars": len(text), "deepl.target_lang": target_lang})
         try:
-            result = self.translator.translate_text(text, target_lang=target_lang)
+            # DeepL SDK는 동기 HTTP 호출이므로 스레드에서 실행해 이벤트 루프를 막지 않음
+            result = await asyncio.to_thread(self.translator.translate_text, text, target_lang=target_lang)
             return result.text
         except Exception as e:
             raise Exception(f"Translation failed: {str(e)}")
-
+    
+    @traced("DeepL.translate_batch")
+    @timed_stage("translate")
+    async def translate_batch(self, texts: List[str], target_lang: str = "KO") -> List[str]:
+        """여러 텍스트를 DeepL 배치 요청으로 번역 (입력 순서대로 반환)"""
+        if not texts:
+            return []
+        set_attributes({
+            "deepl.texts": len(texts),
+            "deepl.chars": sum(len(text) for text in texts),
+            "deepl.requests": (len(texts) + self.MAX_BATCH_TEXTS - 1) // self.MAX_BATCH_TEXTS,
+            "deepl.target_lang": target_lang,
+        })
+        try:
+            translations: List[str] = []
+            for i in range(0, len(texts), self.MAX_BATCH_TEXTS):
+                results = await asyncio.to_thread(
+                    self.translator.translate_text,
+                    texts[i:i + self.MAX_BATCH_TEXTS],
+                    target_lang=target_lang
+                )
+                translations.extend(result.text for result in results)
+            return translations
+        except Exception as e:
+            raise Exception(f"Translation failed: {str(e)}")
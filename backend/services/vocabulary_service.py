@@ -1,10 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, select, delete
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, select, delete, update, func, text, bindparam, literal
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
 import re
-from typing import List, Optional, Dict
+import logging
+from typing import List, Optional, Dict, Tuple
 
-from services.storage_service import StorageService, Base
+from services.storage_service import StorageService, Study, Base
+from services.tracing import set_attributes, traced
+
+logger = logging.getLogger(__name__)
+
+# SQLite 바인드 변수 개수 제한(구버전 999개)을 넘지 않도록 나눠서 처리
+UPSERT_CHUNK_SIZE = 150
+LOOKUP_CHUNK_SIZE = 500
 
 class Word(Base):
     __tablename__ = "words"
@@ -15,28 +24,63 @@ class Word(Base):
     study_id = Column(Integer, ForeignKey("studies.id"), nullable=True)
     known = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        # 같은 지문에 같은 단어는 한 번만 저장 (INSERT ... ON CONFLICT 대상)
+        Index("ux_words_word_study", "word", "study_id", unique=True),
+    )
+
+class MeaningQueueItem(Base):
+    """뜻이 비어있는 단어를 백그라운드에서 채우기 위한 작업 큐 (services/enrichment_worker.py가 처리)"""
+    __tablename__ = "meaning_queue"
+    
+    id = Column(Integer, primary_key=True)
+    word_id = Column(Integer, ForeignKey("words.id"), nullable=False, unique=True)
+    word = Column(String, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    enqueued_at = Column(DateTime, default=datetime.now, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
 
 class VocabularyService:
-    def __init__(self):
-        self.storage_service = StorageService()
+    def __init__(self, storage_service: StorageService = None):
+        # 같은 엔진/풀을 쓰도록 앱의 StorageService를 주입받음
+        self.storage_service = storage_service or StorageService()
         self._initialized = False
     
     async def init_db(self):
         """데이터베이스 초기화"""
+        # Word 모델도 같은 Base에 등록되어 있으므로 공유 런타임이 한 번에 생성
+        await self.storage_service.init_db()
         if not self._initialized:
-            # storage_service의 데이터베이스를 먼저 초기화 (studies 테이블 생성)
-            await self.storage_service.init_db()
-            # 그 다음 words 테이블 생성 (studies 테이블이 이미 존재해야 함)
-            # 같은 Base를 사용하므로 모든 테이블을 한 번에 생성
-            async with self.storage_service.engine.begin() as conn:
-                # Base.metadata에 Word 테이블이 등록되어 있는지 확인
-                from services.storage_service import Base as StorageBase
-                # Word 모델을 StorageBase의 메타데이터에 등록
-                if 'words' not in StorageBase.metadata.tables:
-                    Word.__table__.tometadata(StorageBase.metadata)
-                await conn.run_sync(StorageBase.metadata.create_all, checkfirst=True)
+            await self._ensure_unique_index()
             self._initialized = True
     
+    async def _ensure_unique_index(self):
+        """기존 DB에 (word, study_id) 유니크 인덱스가 없으면 중복 정리 후 생성"""
+        async with self.storage_service.engine.begin() as conn:
+            result = await conn.execute(text("PRAGMA index_list(words)"))
+            if any(row[1] == "ux_words_word_study" for row in result.fetchall()):
+                return
+            # 예전 버전에서 생긴 중복 단어는 뜻이 있는 것 중 가장 먼저 저장된 행을 남기고(없으면 가장 먼저 저장된 행),
+            # 중복 중 하나라도 아는 단어로 표시됐으면 남는 행에도 표시를 옮김
+            keepers = (
+                "SELECT COALESCE(MIN(CASE WHEN meaning IS NOT NULL AND meaning != '' THEN id END), MIN(id)) "
+                "FROM words WHERE study_id IS NOT NULL GROUP BY word, study_id"
+            )
+            duplicates = f"SELECT id FROM words WHERE study_id IS NOT NULL AND id NOT IN ({keepers})"
+            await conn.execute(text(
+                f"UPDATE words SET known = 1 WHERE id IN ({keepers}) AND EXISTS ("
+                "SELECT 1 FROM words AS dup WHERE dup.word = words.word AND dup.study_id = words.study_id "
+                "AND dup.known = 1)"
+            ))
+            await conn.execute(text(f"DELETE FROM meaning_queue WHERE word_id IN ({duplicates})"))
+            result = await conn.execute(text(f"DELETE FROM words WHERE id IN ({duplicates})"))
+            if result.rowcount:
+                logger.warning("Removed %d duplicate word rows before creating ux_words_word_study", result.rowcount)
+            await conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ux_words_word_study ON words (word, study_id)"
+            ))
+    
     def extract_words(self, text: str) -> List[Dict[str, str]]:
         """텍스트에서 영어 단어 추출"""
         # 영어 단어만 추출 (알파벳만)
@@ -47,118 +91,202 @@ class VocabularyService:
         unique_words = [w for w in unique_words if len(w) > 2]
         return [{"word": word, "meaning": ""} for word in unique_words]
     
-    async def save_words(self, words: List[Dict[str, str]], study_id: Optional[int] = None, dictionary_service=None):
-        """단어 저장"""
+    @traced()
+    async def save_words(self, words: List[Dict[str, str]], study_id: Optional[int] = None, dictionary_service=None,
+                         enqueue_missing_meanings: bool = False):
+        """단어 저장 (기존 단어 일괄 조회 + 다중 행 upsert)
+        
+        Args:
+            words: [{"word": ..., "meaning": ...}] 목록
+            study_id: 단어가 속한 지문 ID (없으면 지문 없이 저장)
+            dictionary_service: 주어지면 뜻이 없는 단어의 뜻을 저장 전에 동시에 조회
+            enqueue_missing_meanings: True면 뜻이 없는 단어를 같은 트랜잭션에서 meaning_queue에 넣어
+                백그라운드 워커가 나중에 채우도록 함 (저장은 즉시 반환)
+        """
         await self.init_db()
         
+        # 입력 단어 정리 (소문자, 중복 제거 - 뜻이 있는 항목 우선)
+        incoming: Dict[str, str] = {}
+        for word_data in words or []:
+            word_text = (word_data.get("word") or "").lower().strip()
+            if not word_text:
+                continue
+            meaning = (word_data.get("meaning") or "").strip()
+            if word_text not in incoming or (meaning and not incoming[word_text]):
+                incoming[word_text] = meaning
+        
+        # 1. 이미 저장된 (word, study_id) 쌍을 한 번에 조회 (짧은 읽기 세션)
+        async with self.storage_service.async_session() as session:
+            existing = await self._find_existing(session, list(incoming.keys()), study_id)
+        set_attributes({"words.incoming": len(incoming), "words.existing": len(existing)})
+        
+        # 2. 뜻이 없고 dictionary_service가 제공되면 자동으로 가져오기
+        #    외부 API 조회는 동시에 진행하고, 쓰기 트랜잭션을 열기 전에 끝냄
+        if dictionary_service:
+            missing = [w for w, meaning in incoming.items() if not meaning and not existing.get(w)]
+            if missing:
+                fetched = await dictionary_service.get_word_meanings(missing)
+                set_attributes({"words.looked_up": len(missing), "words.found": sum(1 for w in missing if fetched.get(w))})
+                for word_text in missing:
+                    if fetched.get(word_text):
+                        incoming[word_text] = fetched[word_text]
+        
         async with self.storage_service.async_session() as session:
-            for word_data in words:
-                word_text = word_data.get("word", "").lower()
-                meaning = word_data.get("meaning", "")
+            rows = []
+            null_study_updates = []
+            for word_text, meaning in incoming.items():
+                has_row = word_text in existing
+                existing_meaning = existing.get(word_text)
+                # 뜻이 이미 있는 단어는 건드릴 필요 없음
+                if has_row and existing_meaning:
+                    continue
                 
-                # 뜻이 없고 dictionary_service가 제공되면 자동으로 가져오기
-                if (not meaning or meaning.strip() == "") and dictionary_service:
-                    try:
-                        fetched_meaning = await dictionary_service.get_word_meaning(word_text)
-                        if fetched_meaning:
-                            meaning = fetched_meaning
-                    except Exception as e:
-                        print(f"Failed to fetch meaning for {word_text}: {e}")
+                # 기존 단어인데 새 뜻도 없으면 변경 사항 없음
+                if has_row and not meaning:
+                    continue
                 
-                # 이미 존재하는지 확인
-                result = await session.execute(
-                    select(Word).where(
-                        Word.word == word_text,
-                        Word.study_id == study_id if study_id else Word.study_id.is_(None)
-                    )
-                )
-                existing = result.scalar_one_or_none()
+                # NULL은 유니크 인덱스에서 서로 다른 값으로 취급되어 ON CONFLICT가 동작하지 않으므로
+                # study_id 없는 기존 단어는 UPDATE로 처리
+                if has_row and study_id is None:
+                    null_study_updates.append({"b_word": word_text, "b_meaning": meaning})
+                    continue
                 
-                if not existing:
-                    word = Word(
-                        word=word_text,
-                        meaning=meaning,
-                        study_id=study_id,
-                        known=False  # 새로 추가된 단어는 항상 '모르는 단어' 상태로 시작
+                rows.append({
+                    "word": word_text,
+                    "meaning": meaning,
+                    "study_id": study_id,
+                    "known": False,  # 새로 추가된 단어는 항상 '모르는 단어' 상태로 시작
+                    "created_at": datetime.now(),
+                })
+            
+            # 3. 다중 행 INSERT ... ON CONFLICT 로 저장 (기존 단어는 뜻이 비어있을 때만 갱신)
+            for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                stmt = sqlite_insert(Word).values(rows[i:i + UPSERT_CHUNK_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Word.word, Word.study_id],
+                    set_={"meaning": stmt.excluded.meaning},
+                    where=(func.coalesce(Word.meaning, "") == "") & (stmt.excluded.meaning != ""),
+                )
+                await session.execute(stmt)
+            
+            if null_study_updates:
+                words_table = Word.__table__
+                await session.execute(
+                    update(words_table)
+                    .where(
+                        words_table.c.word == bindparam("b_word"),
+                        words_table.c.study_id.is_(None),
+                        func.coalesce(words_table.c.meaning, "") == "",
                     )
-                    session.add(word)
-                elif existing and (not existing.meaning or existing.meaning.strip() == "") and meaning:
-                    # 기존 단어에 뜻이 없으면 업데이트
-                    existing.meaning = meaning
+                    .values(meaning=bindparam("b_meaning")),
+                    null_study_updates,
+                )
             
-            await session.commit()
+            set_attributes({"words.upserted": len(rows), "words.updated": len(null_study_updates)})
             
-            # 단어 저장 후 study의 word_count 업데이트 (실제 단어 개수로)
+            # 4. 같은 트랜잭션에서 study의 word_count 갱신
             if study_id:
-                words = await self.get_words(study_id=study_id)
-                actual_count = len(words)
-                await self.storage_service.update_study(study_id, word_count=actual_count)
+                await self._update_word_count(session, study_id)
+            
+            if enqueue_missing_meanings:
+                await self._enqueue_missing_meanings(session, list(incoming.keys()), study_id)
+            
+            await session.commit()
+    
+    async def _enqueue_missing_meanings(self, session: AsyncSession, word_texts: List[str], study_id: Optional[int]):
+        """뜻이 비어있는 단어를 meaning_queue에 추가 (이미 큐에 있으면 무시)"""
+        now = datetime.now()
+        for i in range(0, len(word_texts), LOOKUP_CHUNK_SIZE):
+            chunk = word_texts[i:i + LOOKUP_CHUNK_SIZE]
+            pending = select(
+                Word.id,
+                Word.word,
+                literal(0),
+                literal(now, DateTime),
+                literal(now, DateTime),
+            ).where(
+                Word.word.in_(chunk),
+                Word.study_id == study_id if study_id else Word.study_id.is_(None),
+                func.coalesce(Word.meaning, "") == "",
+            )
+            stmt = sqlite_insert(MeaningQueueItem).from_select(
+                ["word_id", "word", "attempts", "enqueued_at", "next_attempt_at"],
+                pending,
+            ).on_conflict_do_nothing(index_elements=["word_id"])
+            await session.execute(stmt)
+    
+    async def _find_existing(self, session: AsyncSession, word_texts: List[str], study_id: Optional[int]) -> Dict[str, str]:
+        """주어진 단어들 중 이미 저장된 단어와 그 뜻 조회 (word -> meaning)"""
+        existing: Dict[str, str] = {}
+        for i in range(0, len(word_texts), LOOKUP_CHUNK_SIZE):
+            chunk = word_texts[i:i + LOOKUP_CHUNK_SIZE]
+            result = await session.execute(
+                select(Word.word, Word.meaning).where(
+                    Word.word.in_(chunk),
+                    Word.study_id == study_id if study_id else Word.study_id.is_(None)
+                )
+            )
+            for word_text, meaning in result.all():
+                if not existing.get(word_text):
+                    existing[word_text] = (meaning or "").strip()
+        return existing
+    
+    async def _update_word_count(self, session: AsyncSession, study_id: int):
+        """study의 word_count를 실제 단어 개수로 갱신 (호출한 세션의 트랜잭션 안에서 실행)"""
+        word_count = (
+            select(func.count(Word.id))
+            .where(Word.study_id == study_id)
+            .scalar_subquery()
+        )
+        await session.execute(
+            update(Study)
+            .where(Study.id == study_id)
+            .values(word_count=word_count, last_studied_date=datetime.now())
+        )
     
     async def get_words(self, study_id: Optional[int] = None, known_only: Optional[bool] = None):
-        """단어 조회"""
+        """단어 조회 (words와 studies를 JOIN해서 필요한 컬럼만 한 번에 조회)"""
         await self.init_db()
         
         async with self.storage_service.async_session() as session:
-            query = select(Word)
+            query = (
+                select(
+                    Word.id,
+                    Word.word,
+                    Word.meaning,
+                    Word.study_id,
+                    Word.known,
+                    Study.title,
+                    Study.last_studied_date,
+                )
+                .outerjoin(Study, Word.study_id == Study.id)
+            )
             
             if study_id:
-                # study_id가 제공되면 해당 study가 존재하는지 먼저 확인
-                study = await self.storage_service.get_study(study_id)
-                if not study:
-                    # study가 존재하지 않으면 빈 리스트 반환
-                    return []
-                query = query.where(Word.study_id == study_id)
+                # 해당 study가 없으면 JOIN 결과가 비어 빈 리스트 반환
+                query = query.where(Word.study_id == study_id, Study.id.is_not(None))
+            else:
+                # 삭제된 지문의 단어(고아 단어)는 제외, 지문 없이 추가된 단어는 포함
+                query = query.where((Word.study_id.is_(None)) | (Study.id.is_not(None)))
             
             if known_only is not None:
                 query = query.where(Word.known == known_only)
             
             query = query.order_by(Word.word)
             result = await session.execute(query)
-            words = result.scalars().all()
             
-            # Study 정보도 함께 가져오기
-            # study_id가 제공되지 않은 경우에만 삭제된 지문의 단어 제외
-            word_list = []
-            study_cache = {}  # study 정보 캐시 (title, last_studied_date)
-            
-            for word in words:
-                study_title = None
-                study_last_studied_date = None
-                
-                if word.study_id:
-                    # study_id가 제공된 경우 이미 확인했으므로 캐시 사용
-                    if study_id and word.study_id == study_id:
-                        study_title = study.get("title")
-                        study_last_studied_date = study.get("last_studied_date")
-                    else:
-                        # study_id가 제공되지 않은 경우에만 확인
-                        if word.study_id not in study_cache:
-                            study_data = await self.storage_service.get_study(word.study_id)
-                            if study_data:
-                                study_cache[word.study_id] = {
-                                    "title": study_data.get("title"),
-                                    "last_studied_date": study_data.get("last_studied_date")
-                                }
-                            else:
-                                # 지문이 삭제된 경우, 이 단어는 제외
-                                print(f"Skipping orphan word {word.id} (study_id {word.study_id} not found)")
-                                continue
-                        cached_study = study_cache.get(word.study_id)
-                        if cached_study:
-                            study_title = cached_study.get("title")
-                            study_last_studied_date = cached_study.get("last_studied_date")
-                
-                word_list.append({
-                    "id": word.id,
-                    "word": word.word,
-                    "meaning": word.meaning or "",
-                    "study_id": word.study_id,
-                    "study_title": study_title,
-                    "study_last_studied_date": study_last_studied_date,
-                    "known": word.known
-                })
-            
-            return word_list
+            return [
+                {
+                    "id": row.id,
+                    "word": row.word,
+                    "meaning": row.meaning or "",
+                    "study_id": row.study_id,
+                    "study_title": row.title,
+                    "study_last_studied_date": row.last_studied_date.strftime("%Y.%m.%d") if row.last_studied_date else None,
+                    "known": row.known
+                }
+                for row in result.all()
+            ]
     
     async def mark_word(self, word_id: int, known: bool):
         """단어를 '알고 있음' 또는 '모름'으로 표시"""
@@ -173,6 +301,59 @@ class VocabularyService:
                 return True
             return False
     
+    async def fill_missing_meanings(self, word_ids: List[int], dictionary_service) -> Tuple[Dict[str, Optional[str]], int]:
+        """뜻이 비어 있는 단어들의 뜻을 한 번에 조회해서 저장
+        
+        사전 조회는 쓰기 트랜잭션을 열기 전에 끝내고, 찾은 뜻은 한 트랜잭션에서 일괄 UPDATE 합니다.
+        
+        Returns:
+            (소문자 단어 -> 뜻, 실제로 저장한 단어 수)
+        """
+        await self.init_db()
+        
+        # 1. 뜻이 비어 있는 단어만 조회 (짧은 읽기 세션)
+        pending: Dict[int, str] = {}
+        async with self.storage_service.async_session() as session:
+            for i in range(0, len(word_ids), LOOKUP_CHUNK_SIZE):
+                result = await session.execute(
+                    select(Word.id, Word.word).where(
+                        Word.id.in_(word_ids[i:i + LOOKUP_CHUNK_SIZE]),
+                        func.coalesce(Word.meaning, "") == "",
+                    )
+                )
+                pending.update(result.all())
+        if not pending:
+            return {}, 0
+        
+        # 2. 사전 조회 (DB 세션 밖에서)
+        meanings = await dictionary_service.get_word_meanings(list(pending.values()))
+        found = [
+            {"b_word_id": word_id, "b_meaning": meanings[word.lower().strip()]}
+            for word_id, word in pending.items()
+            if meanings.get(word.lower().strip())
+        ]
+        set_attributes({"words.looked_up": len(pending), "words.found": len(found)})
+        if not found:
+            return meanings, 0
+        
+        # 3. 찾은 뜻을 한 트랜잭션으로 저장 (그 사이 사용자가 입력한 뜻은 덮어쓰지 않음)
+        async with self.storage_service.async_session() as session:
+            words_table = Word.__table__
+            result = await session.execute(
+                update(words_table)
+                .where(
+                    words_table.c.id == bindparam("b_word_id"),
+                    func.coalesce(words_table.c.meaning, "") == "",
+                )
+                .values(meaning=bindparam("b_meaning")),
+                found,
+            )
+            await session.execute(
+                delete(MeaningQueueItem).where(MeaningQueueItem.word_id.in_([row["b_word_id"] for row in found]))
+            )
+            await session.commit()
+        return meanings, result.rowcount
+    
     async def update_word_meaning(self, word_id: int, meaning: str):
         """단어의 뜻 업데이트"""
         await self.init_db()
@@ -182,6 +363,9 @@ class VocabularyService:
             word = result.scalar_one_or_none()
             if word:
                 word.meaning = meaning
+                if meaning and meaning.strip():
+                    # 직접 입력한 뜻이 있으면 백그라운드 채우기 작업은 필요 없음
+                    await session.execute(delete(MeaningQueueItem).where(MeaningQueueItem.word_id == word_id))
                 await session.commit()
                 return True
             return False
@@ -195,15 +379,15 @@ class VocabularyService:
             word = result.scalar_one_or_none()
             if word:
                 study_id = word.study_id
+                await session.execute(delete(MeaningQueueItem).where(MeaningQueueItem.word_id == word_id))
                 await session.delete(word)
-                await session.commit()
+                await session.flush()
                 
                 # 단어 삭제 후 study의 word_count 업데이트 (실제 단어 개수로)
                 if study_id:
-                    words = await self.get_words(study_id=study_id)
-                    actual_count = len(words)
-                    await self.storage_service.update_study(study_id, word_count=actual_count)
+                    await self._update_word_count(session, study_id)
                 
+                await session.commit()
                 return True
             return False
     
@@ -221,12 +405,17 @@ class VocabularyService:
             
             if word_count > 0:
                 # delete 문을 사용하여 한 번에 삭제 (더 효율적)
+                await session.execute(
+                    delete(MeaningQueueItem).where(
+                        MeaningQueueItem.word_id.in_(select(Word.id).where(Word.study_id == study_id))
+                    )
+                )
                 delete_stmt = delete(Word).where(Word.study_id == study_id)
                 await session.execute(delete_stmt)
                 await session.commit()
-                print(f"Successfully deleted {word_count} words for study_id {study_id}")
+                logger.info("Deleted %d words for study_id %s", word_count, study_id)
             else:
-                print(f"No words found for study_id {study_id}")
+                logger.debug("No words found for study_id %s", study_id)
             
             return word_count
 
@@ -15,6 +15,7 @@ export default function VocabularyPage() {
   const [percentageAnimation, setPercentageAnimation] = useState(false)
   const [animationTimer, setAnimationTimer] = useState<NodeJS.Timeout | null>(null)
   const [sortOrder, setSortOrder] = useState<'recent' | 'oldest'>('recent') // 정렬 순서
+  const [fetchingMeanings, setFetchingMeanings] = useState(false)
 
   useEffect(() => {
     loadWords()
@@ -84,6 +85,28 @@ export default function VocabularyPage() {
     }
   }
 
+  // 뜻이 비어있는 단어들의 뜻을 한 번의 요청으로 가져오기
+  const handleFetchMissingMeanings = async () => {
+    const missing = words.filter((word) => !word.meaning)
+    if (missing.length === 0) return
+
+    setFetchingMeanings(true)
+    try {
+      // 조회와 저장을 서버가 한 번에 처리하므로 단어 수와 상관없이 요청은 조회 + 목록 새로고침 두 번
+      const result = await apiClient.fillMissingMeanings(missing.map((word) => word.id))
+      const saved: number = result.saved || 0
+      await loadWords()
+      if (saved < missing.length) {
+        alert(`${missing.length - saved}개 단어의 뜻을 찾을 수 없습니다.`)
+      }
+    } catch (error) {
+      console.error('Failed to fetch meanings:', error)
+      alert('뜻을 가져오는데 실패했습니다.')
+    } finally {
+      setFetchingMeanings(false)
+    }
+  }
+
   const handleDeleteWord = async (wordId: number) => {
     // 옵티미스틱 업데이트: 먼저 UI에서 단어 제거
     const deletedWord = words.find(w => w.id === wordId)
@@ -327,6 +350,16 @@ export default function VocabularyPage() {
               <div className="flex justify-between items-center mb-4">
                 <h3 className="font-semibold">단어 목록</h3>
                 <div className="flex items-center gap-4">
+                  {words.some((word) => !word.meaning) && (
+                    <button
+                      onClick={handleFetchMissingMeanings}
+                      disabled={fetchingMeanings}
+                      className="px-3 py-2 text-sm bg-primary text-white rounded-lg hover:bg-primary-dark disabled:opacity-50"
+                    >
+                      {fetchingMeanings ? '뜻 가져오는 중...' : '빈 뜻 모두 가져오기'}
+                    </button>
+                  )}
+
                   {/* 정렬 드롭다운 - 특정 지문 선택 시 숨김 */}
                   {!(filter === 'by-passage' && selectedStudyId !== null) && (
                     <select
@@ -15,6 +15,7 @@ export interface TranslationResponse {
       english: string
       korean: string
     }>
+    topic?: string
   }>
   words: Array<{
     word: string
@@ -56,8 +57,9 @@ export const apiClient = {
   },
 
   // 번역
-  translate: async (text: string): Promise<TranslationResponse> => {
-    const response = await api.post('/api/translate', { text })
+  // paragraphTopics: 문단별 주제도 함께 받기
+  translate: async (text: string, paragraphTopics = false): Promise<TranslationResponse> => {
+    const response = await api.post('/api/translate', { text, paragraph_topics: paragraphTopics })
     return response.data
   },
 
@@ -139,10 +141,21 @@ export const apiClient = {
   },
 
   // 단어 뜻 가져오기
+  // GET 요청이라 브라우저 HTTP 캐시(ETag/max-age)가 자주 찾는 단어를 서버까지 보내지 않고 처리
   fetchWordMeaning: async (word: string) => {
-    const response = await api.post('/api/vocabulary/fetch-meaning', null, {
-      params: { word },
-    })
+    const response = await api.get(`/api/dictionary/${encodeURIComponent(word.toLowerCase().trim())}`)
+    return response.data
+  },
+
+  // 여러 단어 뜻 한 번에 가져오기 (단어 -> 뜻, 찾지 못하면 null)
+  fetchWordMeanings: async (words: string[]) => {
+    const response = await api.post('/api/vocabulary/fetch-meanings', { words })
+    return response.data
+  },
+
+  // 단어장의 뜻이 비어있는 단어들의 뜻을 조회해서 서버에서 바로 저장 (요청 한 번)
+  fillMissingMeanings: async (wordIds: number[]) => {
+    const response = await api.post('/api/vocabulary/fetch-meanings', { word_ids: wordIds })
     return response.data
   },
 
@@ -1,11 +1,20 @@
-﻿from fastapi import FastAPI, File, UploadFile, HTTPException
+﻿import time
+
+# 서버 시작부터 첫 요청 처리까지 걸린 시간 측정 기준
+STARTUP_STARTED_AT = time.perf_counter()
+
+from fastapi import FastAPI, File, UploadFile, HTTPException, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse
+import asyncio
+import hashlib
+import json
+import logging
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import List, Optional
+from contextlib import asynccontextmanager
 import uvicorn
 
 # backend 디렉토리를 Python 경로에 추가
@@ -15,82 +24,126 @@ if str(backend_path) not in sys.path:
 
 # 타입 체크를 위한 주석 (런타임에는 sys.path 수정으로 해결됨)
 if True:  # 런타임 경로 수정
+    from services.env_loader import load_env  # type: ignore
+    from services.logging_config import begin_request, setup_logging  # type: ignore
+    from services import metrics, profiler, tracing  # type: ignore
+    from services.database import Database  # type: ignore
     from services.ocr_service import OCRService  # type: ignore
     from services.translation_service import TranslationService  # type: ignore
     from services.storage_service import StorageService  # type: ignore
     from services.vocabulary_service import VocabularyService  # type: ignore
     from services.dictionary_service import DictionaryService  # type: ignore
+    from services.dictionary_cache import DictionaryCache  # type: ignore
+    from services.offline_dictionary import OfflineDictionary  # type: ignore
+    from services.enrichment_worker import MeaningEnrichmentWorker  # type: ignore
     from services.topic_classification_service import TopicClassificationService  # type: ignore
     from models.schemas import (  # type: ignore
         TranslationRequest,
         TranslationResponse,
         SaveStudyRequest,
+        FetchMeaningsRequest,
         StudyResponse,
         WordResponse
     )
 
-# Railway 환경 변수를 우선 사용, 없으면 파일에서 로드
-api_key = os.getenv('DEEPL_API_KEY')
+# api.env는 프로세스에서 한 번만 읽음 (Railway 환경 변수가 있으면 그쪽이 우선)
+load_env()
+setup_logging()
+tracing.setup_tracing()
 
-# 환경 변수가 없으면 파일에서 로드 시도
-if not api_key:
-    env_path = backend_path / "api.env"
-    print(f"Looking for env file at: {env_path}")
-    print(f"File exists: {env_path.exists()}")
-    
-    if env_path.exists():
-        try:
-            with open(env_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(f"File content (first 50 chars): {repr(content[:50])}")
-                print(f"File content length: {len(content)}")
-                
-                if not content:
-                    print("WARNING: File is empty!")
-                    with open(env_path, 'rb') as fb:
-                        binary_content = fb.read()
-                        print(f"Binary content: {binary_content[:50]}")
-                        content = binary_content.decode('utf-8')
-                        print(f"Decoded content: {repr(content[:50])}")
-                
-                lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-                print(f"Number of lines: {len(lines)}")
-                
-                for i, line in enumerate(lines):
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        parts = line.split('=', 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            # 이미 환경 변수가 설정되어 있지 않을 때만 설정
-                            if not os.getenv(key):
-                                os.environ[key] = value
-                                print(f"Set environment variable: {key} = {value[:20]}...")
-                                test_key = os.getenv(key)
-                                print(f"  Verification: os.getenv('{key}') = {test_key is not None}")
-                                if test_key:
-                                    print(f"  Value: {test_key[:20]}...")
-        except Exception as e:
-            print(f"Error reading env file: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("api.env not found, trying load_dotenv()")
-        load_dotenv()
+logger = logging.getLogger(__name__)
+
+# 서비스는 lifespan에서 생성 (모듈 import만으로는 DB 엔진이나 외부 API 클라이언트를 만들지 않음)
+database: Optional[Database] = None
+ocr_service: Optional[OCRService] = None
+translation_service: Optional[TranslationService] = None
+storage_service: Optional[StorageService] = None
+vocabulary_service: Optional[VocabularyService] = None
+dictionary_service: Optional[DictionaryService] = None
+enrichment_worker: Optional[MeaningEnrichmentWorker] = None
+topic_classification_service: Optional[TopicClassificationService] = None
+
+def init_services():
+    """모든 서비스 생성 (lifespan 시작 시 한 번 호출)"""
+    global database, ocr_service, translation_service, storage_service, vocabulary_service
+    global dictionary_service, enrichment_worker, topic_classification_service
+    # 모든 서비스가 공유하는 DB 런타임 (엔진/풀은 프로세스당 하나)
+    database = Database()
+    ocr_service = OCRService()
+    translation_service = TranslationService()
+    storage_service = StorageService(database)
+    vocabulary_service = VocabularyService(storage_service)
+    dictionary_service = DictionaryService(
+        translation_service=translation_service,
+        cache=DictionaryCache(database),
+        offline_dictionary=OfflineDictionary()
+    )
+    enrichment_worker = MeaningEnrichmentWorker(storage_service, dictionary_service)
+    topic_classification_service = TopicClassificationService()
     
-    # 다시 확인
-    api_key = os.getenv('DEEPL_API_KEY')
+    # /metrics: SQL 실행 시간, 캐시 적중률, 진행 중인 작업 수
+    metrics.instrument_engine(database.engine)
+    tracing.instrument_engine(database.engine)
+    metrics.register_cache("dictionary", dictionary_service.cache.stats)
+    metrics.register_cache("offline_dictionary", dictionary_service.offline_dictionary.stats)
+    metrics.register_cache("topic", topic_classification_service.cache_stats)
+    metrics.register_gauge("myling_dictionary_lookups_in_flight", "Distinct dictionary lookups in progress",
+                           lambda: len(dictionary_service._inflight))
+    metrics.register_gauge("myling_topic_queue_depth", "Texts waiting for the topic inference worker",
+                           lambda: topic_classification_service.batcher.stats()["queue_depth"])
 
-print(f"DEEPL_API_KEY after loading: {api_key is not None}")
-if api_key:
-    print(f"DEEPL_API_KEY value: {api_key[:20]}...")
-else:
-    print("ERROR: DEEPL_API_KEY is still None!")
-    print(f"All env vars with DEEPL: {[k for k in os.environ.keys() if 'DEEPL' in k]}")
-    print("⚠️ Please set DEEPL_API_KEY in Railway environment variables!")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_services()
+    logger.info("Initializing database...")
+    await database.init_db()
+    logger.info("Database initialized")
+    enrichment_worker.start()
+    # 주제 분류 모델은 요청을 받기 시작한 뒤 백그라운드에서 불러옴
+    topic_classification_service.start_background_load()
+    startup_timings["app_ready_seconds"] = round(time.perf_counter() - STARTUP_STARTED_AT, 3)
+    logger.info("App ready %.2fs after startup", startup_timings["app_ready_seconds"])
+    yield
+    await enrichment_worker.stop()
+    await topic_classification_service.aclose()
+    await dictionary_service.aclose()
+    await database.dispose()
+    tracing.stop_tracing()
+
+app = FastAPI(title="MyLing API", version="1.0.0", lifespan=lifespan)
 
-app = FastAPI(title="MyLing API", version="1.0.0")
+startup_timings = {"app_ready_seconds": None, "first_request_seconds": None}
+
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    return await metrics.track_request(request, call_next)
+
+@app.middleware("http")
+async def record_first_request(request: Request, call_next):
+    response = await call_next(request)
+    if startup_timings["first_request_seconds"] is None:
+        startup_timings["first_request_seconds"] = round(time.perf_counter() - STARTUP_STARTED_AT, 3)
+        logger.info("First request (%s) served %.2fs after startup",
+                    request.url.path, startup_timings["first_request_seconds"])
+    return response
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """TRACING_EXPORTER가 설정되어 있으면 요청마다 루트 span 기록"""
+    return await tracing.trace_request(request, call_next)
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """X-Profile-Token 헤더(또는 ?profile=)가 PROFILING_TOKEN과 같을 때만 요청을 샘플링 프로파일러로 실행"""
+    return await profiler.profile_request(request, call_next)
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """요청 ID를 로그 컨텍스트에 설정하고 X-Request-ID 응답 헤더로 돌려줌 (가장 바깥 미들웨어)"""
+    request_id = begin_request(request.headers.get("x-request-id"))
+    response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
 
 # CORS 설정 (환경 변수로 관리, 없으면 기본값 사용)
 cors_origins_env = os.getenv('CORS_ALLOWED_ORIGINS', '')
@@ -112,8 +165,8 @@ else:
 # Vercel 프리뷰 URL 패턴 (모든 my-ling 관련 vercel.app 도메인 허용)
 vercel_regex = r"https://my-ling.*\.vercel\.app"
 
-print(f"CORS allowed origins: {allowed_origins}")
-print(f"CORS allowed origin regex: {vercel_regex}")
+logger.info("CORS allowed origins: %s", allowed_origins)
+logger.info("CORS allowed origin regex: %s", vercel_regex)
 
 app.add_middleware(
     CORSMiddleware,
@@ -124,45 +177,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-translation_service = TranslationService()
-storage_service = StorageService()
-vocabulary_service = VocabularyService()
-dictionary_service = DictionaryService(translation_service=translation_service)
-ocr_service = OCRService()
-topic_classification_service = TopicClassificationService()
+# GET /api/dictionary/{word} 응답의 브라우저/CDN 캐시 시간(초)
+DICTIONARY_HTTP_MAX_AGE = int(os.getenv("DICTIONARY_HTTP_MAX_AGE", "86400"))
+DICTIONARY_HTTP_NEGATIVE_MAX_AGE = int(os.getenv("DICTIONARY_HTTP_NEGATIVE_MAX_AGE", "300"))
 
 # 업로드 디렉토리 설정
 upload_dir = backend_path / "uploads"
 
-async def startup_event():
-    print("Initializing database...")
-    await storage_service.init_db()
-    print("Database initialized successfully!")
-
 @app.get("/")
 async def root():
     return {"message": "MyLing API is running"}
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 스크레이프용 지표"""
+    rendered = metrics.render()
+    if rendered is None:
+        return Response("prometheus_client is not installed\n", status_code=503, media_type="text/plain")
+    body, content_type = rendered
+    return Response(body, media_type=content_type)
+
+@app.get("/api/ready")
+async def readiness(require_model: bool = False):
+    """Readiness check. Reports topic model state; 503 only when require_model is set and the model isn't ready"""
+    await topic_classification_service.refresh_model_status()
+    model = topic_classification_service.model_status()
+    body = {
+        "ready": True,
+        "topic_model": model,
+        "startup": {**startup_timings, "uptime_seconds": round(time.perf_counter() - STARTUP_STARTED_AT, 3)},
+    }
+    if require_model and not model["ready"]:
+        body["ready"] = False
+        return JSONResponse(body, status_code=503)
+    return body
+
+@app.get("/api/db/pool")
+async def get_db_pool_stats():
+    return database.pool_stats()
+
+@app.get("/api/debug/profiles/{profile_id}", include_in_schema=False)
+async def get_profile(profile_id: str, x_profile_token: Optional[str] = Header(None)):
+    """저장된 요청 프로파일 (speedscope JSON, PROFILING_TOKEN 필요)"""
+    path = profiler.profile_path(profile_id, x_profile_token)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=path.name)
+
 @app.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
     try:
-        print(f"Received file upload: {file.filename}, content_type: {file.content_type}")
+        logger.info("Received file upload: %s, content_type: %s", file.filename, file.content_type)
         
         os.makedirs(upload_dir, exist_ok=True)
         
         safe_filename = file.filename.replace("..", "").replace("/", "").replace("\\", "")
         file_path = str(upload_dir / safe_filename)
         
-        print(f"Saving file to: {file_path}")
-        with open(file_path, "wb") as buffer:
+        logger.debug("Saving file to: %s", file_path)
+        with metrics.track_stage("upload_io"), open(file_path, "wb") as buffer:
             content = await file.read()
             buffer.write(content)
         
-        print(f"File saved, size: {len(content)} bytes")
+        logger.debug("File saved, size: %d bytes", len(content))
         
-        print(f"Extracting text from: {file_path}")
+        logger.debug("Extracting text from: %s", file_path)
         extracted_text = await ocr_service.extract_text(file_path, file.content_type)
-        print(f"Extracted text length: {len(extracted_text)}")
+        logger.info("Extracted text length: %d", len(extracted_text))
         
         # os.remove(file_path)
         
@@ -172,9 +253,7 @@ async def upload_file(file: UploadFile = File(...)):
             "filename": file.filename
         })
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"Error uploading file: {error_detail}")
+        logger.exception("Error uploading file")
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
 
 @app.post("/api/translate", response_model=TranslationResponse)
@@ -184,24 +263,40 @@ async def translate_text(request: TranslationRequest):
         if not paragraphs and request.text.strip():
             paragraphs = [request.text.strip()]
         
-        translated_paragraphs = []
-        for paragraph in paragraphs:
-            sentences = translation_service.split_into_sentences(paragraph)
-            translated_pairs = []
-            for sentence in sentences:
-                if sentence.strip():
-                    korean = await translation_service.translate(sentence)
-                    translated_pairs.append({
-                        "english": sentence.strip(),
-                        "korean": korean
-                    })
-            if translated_pairs:
-                translated_paragraphs.append({"sentences": translated_pairs})
+        # 주제 분류는 추론 워커에서 번역과 동시에 진행
+        # 문단별 주제도 요청하면 문서 전체와 문단들을 한 번의 배치로 분류
+        topic_texts = [request.text] + (paragraphs if request.paragraph_topics else [])
+        topic_task = asyncio.create_task(topic_classification_service.classify_many_async(topic_texts))
         
-        words = vocabulary_service.extract_words(request.text)
+        try:
+            translated_paragraphs = []
+            paragraph_indices = []
+            for index, paragraph in enumerate(paragraphs):
+                sentences = translation_service.split_into_sentences(paragraph)
+                translated_pairs = []
+                for sentence in sentences:
+                    if sentence.strip():
+                        korean = await translation_service.translate(sentence)
+                        translated_pairs.append({
+                            "english": sentence.strip(),
+                            "korean": korean
+                        })
+                if translated_pairs:
+                    translated_paragraphs.append({"sentences": translated_pairs})
+                    paragraph_indices.append(index)
+            
+            words = vocabulary_service.extract_words(request.text)
+        except BaseException:
+            # 번역이 실패하거나 요청이 취소되면 주제 분류도 취소 (결과를 기다리는 쪽 없이 남지 않게)
+            topic_task.cancel()
+            raise
         
         # 주제 분류
-        topic = topic_classification_service.classify(request.text)
+        topics = await topic_task
+        topic = topics[0]
+        if request.paragraph_topics:
+            for paragraph, index in zip(translated_paragraphs, paragraph_indices):
+                paragraph["topic"] = topics[1 + index]
         
         return TranslationResponse(
             paragraphs=translated_paragraphs,
@@ -219,9 +314,8 @@ async def save_study(request: SaveStudyRequest):
         if not request.paragraphs or len(request.paragraphs) == 0:
             raise ValueError("번역된 내용이 없습니다.")
         
-        print(f"Received save request: title={request.title}, step={request.current_step}")
-        print(f"Paragraphs count: {len(request.paragraphs) if request.paragraphs else 0}")
-        print(f"Words count: {len(request.words) if request.words else 0}")
+        logger.info("Received save request: title=%s, step=%s, paragraphs=%d, words=%d",
+                    request.title, request.current_step, len(request.paragraphs), len(request.words or []))
         
         paragraphs_dict = []
         for para in request.paragraphs:
@@ -243,20 +337,22 @@ async def save_study(request: SaveStudyRequest):
             topic=request.topic
         )
         
-        print(f"Study saved with ID: {study_id}")
+        logger.info("Study saved with ID: %s", study_id)
         
-        print(f"Saving {len(request.words)} words...")
-        await vocabulary_service.save_words(request.words, study_id, dictionary_service)
-        print("Words saved successfully")
+        logger.debug("Saving %d words...", len(request.words))
+        if enrichment_worker.enabled:
+            await vocabulary_service.save_words(request.words, study_id, enqueue_missing_meanings=True)
+            enrichment_worker.notify()
+        else:
+            await vocabulary_service.save_words(request.words, study_id, dictionary_service)
+        logger.debug("Words saved")
         
         return {"success": True, "study_id": study_id}
     except ValueError as e:
-        print(f"Validation error: {str(e)}")
+        logger.info("Validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"Error saving study: {error_detail}")
+        logger.exception("Error saving study")
         raise HTTPException(
             status_code=500,
             detail=f"Error saving study: {str(e)}"
@@ -292,14 +388,12 @@ async def update_study(study_id: int, data: dict):
 async def delete_study(study_id: int):
     try:
         deleted_count = await vocabulary_service.delete_words_by_study_id(study_id)
-        print(f"Deleted {deleted_count} words for study_id {study_id}")
+        logger.info("Deleted %d words for study_id %s", deleted_count, study_id)
         
         await storage_service.delete_study(study_id)
         return {"success": True, "deleted_words_count": deleted_count}
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"Error deleting study: {error_detail}")
+        logger.exception("Error deleting study")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/vocabulary", response_model=List[WordResponse])
@@ -322,6 +416,13 @@ async def add_word(word: str, meaning: str = "", study_id: Optional[int] = None)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/vocabulary/enrichment")
+async def get_enrichment_status():
+    try:
+        return await enrichment_worker.stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/vocabulary/fetch-meaning")
 async def fetch_word_meaning(word: str):
    
@@ -334,6 +435,51 @@ async def fetch_word_meaning(word: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/vocabulary/fetch-meanings")
+async def fetch_word_meanings(request: FetchMeaningsRequest):
+    """Fetch meanings for many words with one batched DeepL request (and save them when word_ids is given)"""
+    try:
+        if request.word_ids:
+            meanings, saved = await vocabulary_service.fill_missing_meanings(request.word_ids, dictionary_service)
+            return {"success": True, "meanings": meanings, "saved": saved}
+        meanings = await dictionary_service.get_word_meanings(request.words)
+        return {"success": True, "meanings": meanings}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/stats/dictionary")
+async def get_dictionary_stats():
+    return dictionary_service.stats()
+
+@app.get("/api/dictionary/{word}")
+async def get_dictionary_entry(word: str, if_none_match: Optional[str] = Header(None)):
+    """Cacheable word meaning lookup (strong ETag + Cache-Control, 304 on If-None-Match)"""
+    word_clean = word.lower().strip()
+    if not word_clean:
+        raise HTTPException(status_code=400, detail="단어가 비어있습니다.")
+    try:
+        meaning = await dictionary_service.get_word_meaning(word_clean)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if meaning:
+        body = {"success": True, "word": word_clean, "meaning": meaning}
+        max_age = DICTIONARY_HTTP_MAX_AGE
+    else:
+        # 찾지 못한 결과는 나중에 사전에 추가될 수 있으므로 짧게만 캐시
+        body = {"success": False, "word": word_clean, "message": "단어의 뜻을 찾을 수 없습니다."}
+        max_age = DICTIONARY_HTTP_NEGATIVE_MAX_AGE
+
+    content = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if if_none_match:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in candidates or etag in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
 @app.post("/api/vocabulary/update-meaning")
 async def update_word_meaning(word_id: int, meaning: str):
 